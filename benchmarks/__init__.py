@@ -0,0 +1,52 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+# Benchmarks, run from the root of the repository e.g.
+#   python -m benchmarks.config_lookup
+# Importing the userbot package starts the bot (configuration, client),
+# the benchmarks load its subpackages from the source tree only
+from os.path import dirname, join
+from subprocess import check_output
+from types import ModuleType
+import sys
+
+ROOT = dirname(dirname(__file__))
+
+if "userbot" not in sys.modules:
+    _package = ModuleType("userbot")
+    _package.__path__ = [join(ROOT, "userbot")]
+    sys.modules["userbot"] = _package
+
+
+def load_revision(name: str, revision: str) -> ModuleType:
+    """
+    Load a module of the userbot package as of a git revision, next to
+    the current one (it isn't added to sys.modules)
+
+    Args:
+        name (string): e.g. "userbot.sysutils.configuration"
+        revision (string): any git revision e.g. "HEAD~3"
+
+    Returns:
+        the module
+    """
+    file_path = name.replace(".", "/") + ".py"
+    source = check_output(["git", "show", f"{revision}:{file_path}"],
+                          cwd=ROOT)
+    module = ModuleType(name)
+    module.__file__ = join(ROOT, file_path)
+    module.__package__ = name.rpartition(".")[0]  # relative imports
+    exec(compile(source, module.__file__, "exec"), module.__dict__)
+    return module
+
+
+def percentile(values: list, percent: float):
+    """
+    Returns the value below which percent of the (sorted) values are
+    """
+    return values[min(int(len(values) * percent / 100), len(values) - 1)]
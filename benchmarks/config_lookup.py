@@ -0,0 +1,55 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+# Per-call latency of getConfig before and after it became a single
+# dictionary lookup. The old implementation is loaded from git:
+#   python -m benchmarks.config_lookup [--before REVISION]
+from benchmarks import load_revision
+from userbot.sysutils import configuration
+from argparse import ArgumentParser
+from timeit import Timer
+
+BEFORE = "d9a83b0^"  # last revision with the frame inspecting getConfig
+CONFIGS = 40  # added to the 4 built-in configs, like a usual config.env
+
+
+def measure(module) -> tuple:
+    """
+    Returns the latency of a hit and a miss in microseconds per call
+    """
+    configs = module._sysconfigs._SysConfigurations__botconfigs
+    configs.update({f"CONFIG_{number}": number
+                    for number in range(CONFIGS)})
+    results = []
+    for config in (f"CONFIG_{CONFIGS - 1}", "NOT_SET"):
+        timer = Timer(lambda: module.getConfig(config, None))
+        calls, _ = timer.autorange()  # at least 0.2 seconds
+        best = min(timer.repeat(repeat=5, number=calls))
+        results.append(best / calls * 1e6)
+    return tuple(results)
+
+
+def main():
+    parser = ArgumentParser(
+        description="Per-call latency of getConfig before and after")
+    parser.add_argument("--before", default=BEFORE,
+                        help=f"revision to compare with (default {BEFORE})")
+    args = parser.parse_args()
+    print(f"getConfig, {CONFIGS + 4} configs, best of 5 (us/call)")
+    print(f"  {'':10}{'hit':>12}{'miss':>12}")
+    for label, module in (
+            (args.before, load_revision("userbot.sysutils.configuration",
+                                        args.before)),
+            ("current", configuration)):
+        hit, miss = measure(module)
+        print(f"  {label:10}{hit:12.3f}{miss:12.3f}")
+    return
+
+
+if __name__ == "__main__":
+    main()
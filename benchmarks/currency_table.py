@@ -0,0 +1,74 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+# Parse time, memory (tracemalloc) and convert() latency of the rate
+# table against CurrencyConverter, which .currency built on every call
+# before. The history bundled with currency_converter is used by default:
+#   python -m benchmarks.currency_table [--file ECB_HISTORY]
+from benchmarks import percentile
+from userbot.include.currency_rates import _RateTable, _read_lines
+from currency_converter import CURRENCY_FILE, CurrencyConverter
+from argparse import ArgumentParser
+from gc import collect
+from time import perf_counter
+from timeit import Timer
+from tracemalloc import get_traced_memory, start, stop
+
+ROUNDS = 5  # parses per implementation, the median is reported
+
+
+def measure(build) -> tuple:
+    """
+    Returns the parse time in seconds, the memory kept after parsing in
+    bytes and the converter
+    """
+    times = []
+    for _ in range(ROUNDS):
+        begin = perf_counter()
+        build()
+        times.append(perf_counter() - begin)
+    collect()
+    start()
+    converter = build()
+    collect()
+    memory, _ = get_traced_memory()
+    stop()
+    times.sort()
+    return percentile(times, 50), memory, converter
+
+
+def convert_latency(converter) -> float:
+    """
+    Returns the latency of converter.convert in microseconds
+    """
+    timer = Timer(lambda: converter.convert(100, "USD", "JPY"))
+    calls, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=calls)) / calls * 1e6
+
+
+def main():
+    parser = ArgumentParser(description="Currency rate table benchmark")
+    parser.add_argument("--file", default=CURRENCY_FILE,
+                        help="ECB history, csv or zip (default: bundled)")
+    args = parser.parse_args()
+    setups = (("CurrencyConverter", lambda: CurrencyConverter(args.file)),
+              ("rate table", lambda: _RateTable(_read_lines(args.file))))
+    print(f"{args.file}, median of {ROUNDS} parses")
+    print(f"  {'':20}{'parse ms':>10}{'memory MiB':>12}{'convert us':>12}")
+    for label, build in setups:
+        parse_time, memory, converter = measure(build)
+        print(f"  {label:20}{parse_time * 1000:10.1f}"
+              f"{memory / 1048576:12.1f}{convert_latency(converter):12.2f}")
+    table = _RateTable(_read_lines(args.file))
+    print(f"rate table: {table.days} days, {len(table.currencies)} "
+          f"currencies, arrays {table.nbytes / 1048576:.1f} MiB")
+    return
+
+
+if __name__ == "__main__":
+    main()
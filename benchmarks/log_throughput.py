@@ -0,0 +1,104 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+# Log throughput as seen by the logging code (records/s, latency of a
+# log call) and end to end (records/s written by the listener) for the
+# old formatters, the prebuilt formatters and the queue pipeline. The
+# terminal output goes to /dev/null, the log file to a temp directory:
+#   python -m benchmarks.log_throughput [--records N] [--before REVISION]
+from benchmarks import load_revision, percentile
+from userbot.sysutils.log_formatter import LogColorFormatter, LogFileFormatter
+from userbot.sysutils.log_pipeline import CompressingFileHandler, LogPipeline
+from argparse import ArgumentParser
+from logging import INFO, StreamHandler, getLogger
+from os import devnull
+from os.path import join
+from tempfile import TemporaryDirectory
+from time import perf_counter, perf_counter_ns
+
+BEFORE = "b17344e^"  # last revision with the per-record formatters
+
+
+def handlers(directory: str, formatters: tuple) -> list:
+    file_handler = CompressingFileHandler(join(directory, "hyper.log"),
+                                          10485760, 5)
+    file_handler.setFormatter(formatters[0]())
+    stream_handler = StreamHandler(open(devnull, "w"))
+    stream_handler.setFormatter(formatters[1]())
+    return [file_handler, stream_handler]
+
+
+def run(name: str, records: int, formatters: tuple,
+        pipeline: bool) -> tuple:
+    """
+    Log records through a fresh logger
+
+    Returns:
+        a tuple of the records/s of the caller, the latency of a call
+        (p50, p99) in microseconds and the records/s end to end
+    """
+    logger = getLogger(f"benchmark.{name}")
+    logger.setLevel(INFO)
+    logger.propagate = False
+    with TemporaryDirectory() as directory:
+        log_handlers = handlers(directory, formatters)
+        if pipeline:
+            log_pipeline = LogPipeline(logger, log_handlers)
+            log_pipeline.start()
+        else:
+            for handler in log_handlers:
+                logger.addHandler(handler)
+        latencies = []
+        start = perf_counter()
+        for number in range(records):
+            call = perf_counter_ns()
+            logger.info("Record %d of the benchmark", number)
+            latencies.append(perf_counter_ns() - call)
+        logged = perf_counter() - start
+        if pipeline:
+            log_pipeline.stop()  # waits until every record is written
+        written = perf_counter() - start
+        for handler in log_handlers:
+            logger.removeHandler(handler)
+            handler.close()
+            if handler.stream:  # StreamHandler leaves /dev/null open
+                handler.stream.close()
+    latencies.sort()
+    return (records / logged, percentile(latencies, 50) / 1000,
+            percentile(latencies, 99) / 1000, records / written)
+
+
+def main():
+    parser = ArgumentParser(description="Log throughput benchmark")
+    parser.add_argument("--records", type=int, default=50000,
+                        help="records per setup (default 50000)")
+    parser.add_argument("--before", default=BEFORE,
+                        help=f"revision of the old formatters "
+                             f"(default {BEFORE})")
+    args = parser.parse_args()
+    old = load_revision("userbot.sysutils.log_formatter", args.before)
+    setups = (
+        ("old formatters (sync)",
+         (old.LogFileFormatter, old.LogColorFormatter), False),
+        ("prebuilt formatters (sync)",
+         (LogFileFormatter, LogColorFormatter), False),
+        ("queue pipeline",
+         (LogFileFormatter, LogColorFormatter), True))
+    print(f"{args.records} records, terminal output to {devnull}")
+    print(f"  {'setup':28}{'caller rec/s':>13}{'p50 us':>9}{'p99 us':>9}"
+          f"{'written rec/s':>15}")
+    for number, (label, formatters, pipeline) in enumerate(setups):
+        caller, p50, p99, written = run(str(number), args.records,
+                                        formatters, pipeline)
+        print(f"  {label:28}{caller:13.0f}{p50:9.1f}{p99:9.1f}"
+              f"{written:15.0f}")
+    return
+
+
+if __name__ == "__main__":
+    main()
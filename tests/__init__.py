@@ -0,0 +1,19 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+# Importing the userbot package starts the bot (configuration, client).
+# The tests need its subpackages only, those are loaded from the source
+# tree without running userbot/__init__.py
+from os.path import dirname, join
+from types import ModuleType
+import sys
+
+if "userbot" not in sys.modules:
+    _package = ModuleType("userbot")
+    _package.__path__ = [join(dirname(dirname(__file__)), "userbot")]
+    sys.modules["userbot"] = _package
@@ -0,0 +1,71 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from urllib.parse import parse_qs, urlsplit
+import json
+
+
+class StandIn:
+    def __init__(self, respond):
+        """
+        Local HTTP server standing in for a remote API. Every GET is
+        answered by respond(path, query, headers) which returns a tuple
+        (status, headers, JSON data or None). Requests are recorded as
+        (path, query, headers, client port), keep-alive is supported
+
+        Example:
+            with StandIn(respond) as server:
+                url = server.url + "/check"
+        """
+        self.requests = []
+        self.__lock = Lock()
+        record = self.__record
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep connections alive
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                query = {key: values[0] for key, values in
+                         parse_qs(url.query).items()}
+                record(url.path, query, dict(self.headers),
+                       self.client_address[1])
+                status, headers, data = respond(url.path, query,
+                                                self.headers)
+                body = json.dumps(data).encode() if data is not None else b""
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+            def log_message(self, *args):
+                return  # keep the test output clean
+
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.__server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.__server.server_address[1]}"
+
+    def __record(self, *request):
+        with self.__lock:
+            self.requests.append(request)
+        return
+
+    def __enter__(self):
+        Thread(target=self.__server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.__server.shutdown()
+        self.__server.server_close()
+        return
@@ -0,0 +1,85 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from tests.stand_in import StandIn
+from userbot.include import cas_api
+from asyncio import run
+from time import monotonic
+from unittest import mock
+import unittest
+
+UNREACHABLE = 13  # user ID the stand-in fails to look up
+
+
+class CASAPITest(unittest.TestCase):
+    def setUp(self):
+        self.server = StandIn(self.respond).__enter__()
+        self.addCleanup(self.server.__exit__)
+        query_url = cas_api.CAS_QUERY_URL
+        self.addCleanup(setattr, cas_api, "CAS_QUERY_URL", query_url)
+        cas_api.CAS_QUERY_URL = self.server.url + "/check?user_id="
+        client = cas_api._client
+        self.addCleanup(setattr, cas_api, "_client", client)
+        cas_api._client = cas_api._CASClient()
+
+    def respond(self, path, query, headers):
+        user_id = int(query["user_id"])
+        if user_id == UNREACHABLE:
+            return (500, {}, None)
+        if user_id % 2:  # odd IDs aren't banned
+            return (200, {}, {"ok": False,
+                              "description": "Record not found."})
+        return (200, {}, {"ok": True,
+                          "result": {"offenses": user_id // 2,
+                                     "time_added": "2021-05-30T18:00:00Z"}})
+
+    def test_verdicts(self):
+        banned = run(cas_api.fetch_user_data(4))
+        self.assertTrue(cas_api.isbanned(banned))
+        self.assertEqual(cas_api.offenses(banned), "2")
+        self.assertEqual(cas_api.timeadded(banned).year, 2021)
+        self.assertFalse(cas_api.isbanned(cas_api.get_user_data(5)))
+        # verdicts of users not banned are kept once
+        self.assertIs(cas_api.get_user_data(5), cas_api.get_user_data(7))
+
+    def test_batch_pooled(self):
+        user_ids = list(range(1, 201))
+        verdicts = run(cas_api.fetch_users_data(user_ids))
+        self.assertEqual(list(verdicts), user_ids)
+        self.assertIsNone(verdicts[UNREACHABLE])
+        self.assertEqual(sum(1 for verdict in verdicts.values()
+                             if verdict and cas_api.isbanned(verdict)), 100)
+        # connections are reused, at most one per lookup in flight
+        connections = {port for _, _, _, port in self.server.requests}
+        self.assertLessEqual(len(connections), cas_api.MAX_CONCURRENCY)
+
+    def test_cache_hits(self):
+        run(cas_api.fetch_users_data([1, 2, 3]))
+        run(cas_api.fetch_users_data([1, 2, 3]))
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(cas_api.getCASCacheStats(),
+                         {"size": 3, "hits": 3, "misses": 3})
+
+    def test_ttl_expiry(self):
+        cas_api.get_user_data(2)
+        cas_api.get_user_data(2)
+        self.assertEqual(len(self.server.requests), 1)
+        # CAS_CACHE_TTL is 3600 seconds by default
+        later = monotonic() + 3601
+        with mock.patch.object(cas_api, "monotonic", lambda: later):
+            cas_api.get_user_data(2)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_failed_lookup_not_cached(self):
+        with self.assertRaises(Exception):
+            cas_api.get_user_data(UNREACHABLE)
+        self.assertEqual(cas_api.getCASCacheStats()["size"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from tests.stand_in import StandIn
+from userbot.include import git_api
+from asyncio import run
+from os import chdir, getcwd
+from os.path import exists
+from tempfile import TemporaryDirectory
+import json
+import unittest
+
+REPO = "nunopenim/HyperUBot"
+RELEASES = [{"tag_name": f"v{number}", "name": f"Release {number}"}
+            for number in range(5, 0, -1)]  # newest first
+
+
+class GitAPITest(unittest.TestCase):
+    def setUp(self):
+        self.down = False  # answer every request with 503
+        self.server = StandIn(self.respond).__enter__()
+        self.addCleanup(self.server.__exit__)
+        # github_cache.json is stored in TEMP_DL_DIR ("." by default)
+        self.temp_dir = TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.addCleanup(chdir, getcwd())
+        chdir(self.temp_dir.name)
+        api_url = git_api.APIURL
+        self.addCleanup(setattr, git_api, "APIURL", api_url)
+        git_api.APIURL = self.server.url + "/repos/"
+        client = git_api._client
+        self.addCleanup(setattr, git_api, "_client", client)
+        git_api._client = git_api._GitHubClient()
+
+    def respond(self, path, query, headers):
+        if self.down:
+            return (503, {}, None)
+        if path == f"/repos/{REPO}/releases/latest":
+            data = RELEASES[0]
+        elif path == f"/repos/{REPO}/releases":
+            page = int(query.get("page", 1))
+            per_page = int(query.get("per_page", 30))
+            data = RELEASES[(page - 1) * per_page:page * per_page]
+        else:
+            return (404, {}, {"message": "Not Found"})
+        etag = f'"{path}:{sorted(query.items())}"'
+        if headers.get("If-None-Match") == etag:
+            return (304, {"ETag": etag}, None)
+        return (200, {"ETag": etag}, data)
+
+    def test_etag_reuse(self):
+        self.assertEqual(git_api.getLatestData(REPO), RELEASES[0])
+        self.assertEqual(git_api.getLatestData(REPO), RELEASES[0])
+        first, second = self.server.requests
+        self.assertNotIn("If-None-Match", first[2])
+        self.assertIn("If-None-Match", second[2])
+        # both requests came through the same connection
+        self.assertEqual(first[3], second[3])
+
+    def test_cache_file(self):
+        git_api.getLatestData(REPO)
+        self.assertTrue(exists("github_cache.json"))
+        with open("github_cache.json", "r") as cache_file:
+            cache = json.load(cache_file)
+        url = git_api.APIURL + REPO + "/releases/latest"
+        self.assertEqual(list(cache), [url])
+        self.assertEqual(cache[url]["data"], RELEASES[0])
+        self.assertTrue(cache[url]["etag"])
+        # a restarted client revalidates the cached response
+        git_api._client = git_api._GitHubClient()
+        self.assertEqual(git_api.getLatestData(REPO), RELEASES[0])
+        self.assertEqual(self.server.requests[-1][2].get("If-None-Match"),
+                         cache[url]["etag"])
+
+    def test_pagination(self):
+        pages = [run(git_api.fetchReleases(REPO, page, per_page=2))
+                 for page in range(1, 5)]
+        self.assertEqual(pages, [RELEASES[0:2], RELEASES[2:4],
+                                 RELEASES[4:5], []])
+        self.assertEqual([query for _, query, _, _ in self.server.requests],
+                         [{"per_page": "2", "page": str(page)}
+                          for page in range(1, 5)])
+
+    def test_stale_fallback(self):
+        self.assertEqual(git_api.getData(REPO), RELEASES)
+        self.down = True
+        self.assertEqual(git_api.getData(REPO), RELEASES)
+        self.assertIsNone(git_api.getLatestData(REPO))  # never cached
+
+    def test_unknown_repo(self):
+        self.assertIsNone(git_api.getData("nobody/nothing"))
+        self.assertIsNone(run(git_api.fetchReleases("nobody/nothing")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from userbot.include import ping_engine
+from asyncio import run
+from icmplib import ping, SocketPermissionError
+from shutil import which
+from unittest import mock
+import unittest
+
+LOCALHOST = "127.0.0.1"
+
+
+def _can_ping() -> bool:
+    """
+    Unprivileged ICMP or the ping binary is required to probe localhost
+    """
+    if which("ping"):
+        return True
+    try:
+        ping(LOCALHOST, count=1, timeout=1, privileged=False)
+    except SocketPermissionError:
+        return False
+    return True
+
+
+class PingHistoryTest(unittest.TestCase):
+    def test_stats(self):
+        history = ping_engine._PingHistory()
+        for rtt in (10.0, None, 14.0, 12.0):
+            history.add(rtt)
+        stats = history.stats()
+        self.assertEqual(stats["probes"], 4)
+        self.assertEqual(stats["loss"], 25)
+        self.assertEqual(stats["min"], 10)
+        self.assertEqual(stats["avg"], 12)
+        self.assertEqual(stats["jitter"], 3)  # (|14-10| + |12-14|) / 2
+
+    def test_size(self):
+        history = ping_engine._PingHistory()
+        for _ in range(ping_engine._HISTORY_SIZE + 5):
+            history.add(None)
+        self.assertEqual(history.stats()["probes"],
+                         ping_engine._HISTORY_SIZE)
+
+    def test_empty(self):
+        self.assertEqual(ping_engine._PingHistory().stats(),
+                         {"probes": 0, "loss": 0, "min": None, "avg": None,
+                          "jitter": None})
+
+
+class PingEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = ping_engine._PingEngine()
+
+    @unittest.skipUnless(_can_ping(), "ICMP not permitted, no ping binary")
+    def test_probe_localhost(self):
+        for _ in range(3):
+            results = run(self.engine._probe_many([LOCALHOST]))
+            self.assertIsNotNone(results[LOCALHOST])
+        stats = self.engine._getStats(LOCALHOST)
+        self.assertEqual(stats["probes"], 3)
+        self.assertEqual(stats["loss"], 0)
+        self.assertLessEqual(stats["min"], stats["avg"])
+        self.assertGreaterEqual(stats["jitter"], 0)
+
+    def test_invalid_address(self):
+        with self.assertLogs(ping_engine.log, "WARNING"):
+            results = run(self.engine._probe_many(["-c", ""]))
+        self.assertEqual(results, {"-c": None, "": None})
+        self.assertEqual(self.engine._getStats("-c")["probes"], 0)
+
+    def test_failed_probe_keeps_icmp(self):
+        async def unreachable(*args, **kwargs):
+            raise OSError("Network is unreachable")
+        with mock.patch.object(ping_engine, "async_ping", unreachable), \
+                self.assertLogs(ping_engine.log, "WARNING"):
+            results = run(self.engine._probe_many(["10.0.0.1", "10.0.0.2"]))
+        self.assertEqual(results, {"10.0.0.1": None, "10.0.0.2": None})
+        self.assertEqual(self.engine._getStats("10.0.0.1")["loss"], 100)
+        self.assertTrue(self.engine._PingEngine__icmp_usable)
+
+    def test_targets_capped(self):
+        async def unreachable(*args, **kwargs):
+            raise OSError("Network is unreachable")
+        addresses = [f"10.0.{number // 256}.{number % 256}"
+                     for number in range(ping_engine._MAX_TARGETS + 10)]
+        with mock.patch.object(ping_engine, "async_ping", unreachable), \
+                self.assertLogs(ping_engine.log, "WARNING"):
+            run(self.engine._probe_many(addresses))
+        self.assertEqual(len(self.engine._PingEngine__histories),
+                         ping_engine._MAX_TARGETS)
+        self.assertEqual(self.engine._getStats(addresses[0])["probes"], 0)
+        self.assertEqual(self.engine._getStats(addresses[-1])["probes"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,9 +6,11 @@
 # You may not use this file or any of the content within it, unless in
 # compliance with the PE License
 
+from userbot.sysutils.boot_profiler import start_phase, end_phase
 from userbot.sysutils.configuration import addConfig, getConfig
 from userbot.sysutils.colors import Color, setColorText
 from userbot.sysutils.log_formatter import LogFileFormatter, LogColorFormatter
+from userbot.sysutils.log_pipeline import CompressingFileHandler, LogPipeline
 from userbot.sysutils.sys_funcs import os_name, verAsTuple
 from userbot.version import VERSION as hubot_version
 from telethon import TelegramClient, version
@@ -16,24 +18,31 @@ from telethon.errors.rpcerrorlist import (ApiIdInvalidError,
                                           PhoneNumberInvalidError)
 from telethon.sessions import StringSession
 from dotenv import load_dotenv
-from logging import FileHandler, StreamHandler, basicConfig, INFO, getLogger
-from os import path, execle, environ, mkdir, remove
+from logging import StreamHandler, INFO, getLogger
+from os import path, execle, environ, mkdir
 from platform import platform, machine, processor
 from sys import argv, executable, version_info
 
 # Terminal logging
+start_phase("Log setup")
 LOGFILE = "hyper.log"
+LOGFILE_MAX_SIZE = 10485760  # bytes before hyper.log is rotated
+LOGFILE_BACKUPS = 5  # compressed logs of previous runs kept
+log = getLogger(__name__)
+_fhandler = CompressingFileHandler(LOGFILE, LOGFILE_MAX_SIZE,
+                                   LOGFILE_BACKUPS)
 try:
-    if path.exists(LOGFILE):
-        remove(LOGFILE)
-except:
+    # keep the log of the last run instead of deleting it
+    _fhandler.rollover_if_used()
+except Exception:
     pass
-log = getLogger(__name__)
-_fhandler = FileHandler(LOGFILE)
 _fhandler.setFormatter(LogFileFormatter())
 _shandler = StreamHandler()
 _shandler.setFormatter(LogColorFormatter())
-basicConfig(handlers=[_fhandler, _shandler], level=INFO)
+getLogger().setLevel(INFO)
+# records are written by a listener thread, not by the logging thread
+_log_pipeline = LogPipeline(getLogger(), [_fhandler, _shandler])
+_log_pipeline.start()
 
 PROJECT = "HyperUBot"
 OS = os_name()  # Current Operating System [DEPRECATED]
@@ -45,26 +54,27 @@ if len(argv) >= 2:
         SAFEMODE = True
 
 try:
-    if path.exists(LOGFILE):
-        _sys_string = "======= SYS INFO\n\n"
-        _sys_string += "Project: {}\n".format(PROJECT)
-        _sys_string += "Version: {}\n".format(hubot_version)
-        _sys_string += "Safe mode: {}\n".format("On" if SAFEMODE else "Off")
-        _sys_string += "Operating System: {}\n".format(os_name())
-        _sys_string += "Platform: {}\n".format(platform())
-        _sys_string += "Machine: {}\n".format(machine())
-        _sys_string += "Processor: {}\n".format(processor())
-        _sys_string += "Python: v{}.{}.{}\n".format(version_info.major,
-                                                    version_info.minor,
-                                                    version_info.micro)
-        _sys_string += "Telethon: v{}\n\n".format(version.__version__)
-        _sys_string += "======= TERMINAL LOGGING\n\n"
-        _file = open(LOGFILE, "w")
-        _file.write(_sys_string)
-        _file.close()
+    _sys_string = "======= SYS INFO\n\n"
+    _sys_string += "Project: {}\n".format(PROJECT)
+    _sys_string += "Version: {}\n".format(hubot_version)
+    _sys_string += "Safe mode: {}\n".format("On" if SAFEMODE else "Off")
+    _sys_string += "Operating System: {}\n".format(os_name())
+    _sys_string += "Platform: {}\n".format(platform())
+    _sys_string += "Machine: {}\n".format(machine())
+    _sys_string += "Processor: {}\n".format(processor())
+    _sys_string += "Python: v{}.{}.{}\n".format(version_info.major,
+                                                version_info.minor,
+                                                version_info.micro)
+    _sys_string += "Telethon: v{}\n\n".format(version.__version__)
+    _sys_string += "======= TERMINAL LOGGING\n\n"
+    _file = open(LOGFILE, "w")
+    _file.write(_sys_string)
+    _file.close()
 except Exception as e:
     log.warning("Unable to write system information into log: {}".format(e))
 
+start_phase("Configurations")
+
 # Check Python version
 if (version_info.major, version_info.minor) < (3, 8):
     log.error("Python v3.8+ is required! "
@@ -72,6 +82,7 @@ if (version_info.major, version_info.minor) < (3, 8):
               "(current version: {}.{}.{}).".format(version_info.major,
                                                     version_info.minor,
                                                     version_info.micro))
+    _log_pipeline.stop()  # write pending records
     quit(1)
 
 # Check Telethon version
@@ -79,6 +90,7 @@ if verAsTuple(version.__version__) < (1, 21, 1):
     log.error("Telethon version 1.21.1+ is required! "
               "Please update Telethon to v1.21.1 or newer "
               f"(current version: {version.__version__}).")
+    _log_pipeline.stop()
     quit(1)
 
 if SAFEMODE:
@@ -104,6 +116,7 @@ if path.exists(path.join(".", "userbot", "config.env")):
                     addConfig(key, int(value) if value.isnumeric() else value)
     if getConfig("SAMPLE_CONFIG", None):
         log.error("Please remove SAMPLE_CONFIG from config.env!")
+        _log_pipeline.stop()
         quit(1)
     API_KEY = environ.get("API_KEY", 0)
     API_HASH = environ.get("API_HASH", None)
@@ -122,15 +135,18 @@ elif path.exists(path.join(".", "userbot", "config.py")):
         log.error("config.py file isn't well-formed. Please make sure "
                   "your config file matches expected python script "
                   "formation", exc_info=True)
+        _log_pipeline.stop()
         quit(1)
     except Exception as e:
         log.error(f"Unable to load configs: {e}", exc_info=True)
+        _log_pipeline.stop()
         quit(1)
     try:
         if not SAFEMODE:
             from inspect import getmembers, isclass, isfunction
     except Exception as e:
         log.error(f"Couldn't import config components: {e}", exc_info=True)
+        _log_pipeline.stop()
         quit(1)
     if not SAFEMODE:
         for name, cfgclass in getmembers(cfg, isclass):
@@ -159,6 +175,7 @@ else:
         _PY_EXEC = (executable
                     if " " not in executable else '"' + executable + '"')
         _tcmd = [_PY_EXEC, "setup.py"]
+        _log_pipeline.stop()
         execle(_PY_EXEC, *_tcmd, environ)
     except Exception as e:
         log.warning(f"Failed to start Setup Assistant: {e}", exc_info=True)
@@ -166,6 +183,7 @@ else:
                   "Please run the Setup Assistant to setup your config file "
                   "or generate a config file manually: "
                   "Environment and Python scripts are supported")
+    _log_pipeline.stop()
     quit()
 
 if not getConfig("TEMP_DL_DIR"):
@@ -184,6 +202,7 @@ if not API_KEY:
               "your config file")
     log.error("API_KEY is required in order to use HyperUBot properly")
     log.error("Please obtain your API Key from 'https://my.telegram.org'")
+    _log_pipeline.stop()
     quit(1)
 
 if not API_HASH:
@@ -191,8 +210,11 @@ if not API_HASH:
               "config file")
     log.error("API_HASH is required in order to use HyperUBot properly")
     log.error("Please obtain your API Hash from 'https://my.telegram.org'")
+    _log_pipeline.stop()
     quit(1)
 
+start_phase("Telegram client")
+
 try:
     if STRING_SESSION:
         tgclient = TelegramClient(StringSession(STRING_SESSION),
@@ -210,14 +232,20 @@ try:
                   "session or if present, set your string session to "
                   "STRING_SESSION=\"YOUR STRING\" in your config.* file")
         log.error("Exiting...")
+        _log_pipeline.stop()
         quit(1)
 except ApiIdInvalidError as ae:
     log.critical(f"API Key and/or API Hash is/are invalid: {ae}",
                  exc_info=True)
+    _log_pipeline.stop()
     quit(1)
 except PhoneNumberInvalidError as pe:
     log.critical(f"Phone number is not valid: {pe}", exc_info=True)
+    _log_pipeline.stop()
     quit(1)
 except Exception as e:
     log.critical(f"Failed to create Telegram Client: {e}", exc_info=True)
+    _log_pipeline.stop()
     quit(1)
+
+end_phase()
@@ -6,19 +6,35 @@
 # You may not use this file or any of the content within it, unless in
 # compliance with the PE License
 
-from userbot import tgclient, log, _fhandler, _shandler, PROJECT, SAFEMODE
+from userbot import tgclient, log, _log_pipeline, PROJECT, SAFEMODE
+from userbot.include.currency_rates import (HISTORY_FILE,
+                                            startCurrencyRefresher)
+from userbot.include.language_processor import (ModuleDescriptions,
+                                                ModuleUsages)
+from userbot.sysutils.boot_profiler import (finish_profiling, profile_module,
+                                            profile_phase)
 from userbot.sysutils.configuration import getConfig
+from userbot.sysutils.event_handler import _router
 from userbot.sysutils.registration import (update_all_modules,
                                            update_load_modules,
                                            update_user_modules,
-                                           getAllModules)
+                                           getAllModules,
+                                           getLoadModules,
+                                           pre_register_lazy_cmd,
+                                           register_lazy_module_desc)
 from userbot.version import VERSION
+from telethon.events import MessageEdited, NewMessage
+from asyncio import create_task, sleep
+from ast import (AsyncFunctionDef, Attribute, Call, Constant, Import,
+                 ImportFrom, Name, literal_eval, parse, walk)
+from concurrent.futures import ThreadPoolExecutor
 from logging import shutdown
 from importlib import import_module
 from glob import glob
 from os import execle, environ
 from os.path import dirname, basename, isfile, join
-from sys import executable
+from sys import executable, modules as imported_modules
+from time import perf_counter
 
 
 class _Modules:
@@ -26,6 +42,9 @@ class _Modules:
         self.__imported_module = None
         self.__load_modules_count = 0
         self.__not_load_modules = getConfig("NOT_LOAD_MODULES", [])
+        self.__lazy_load_modules = getConfig("LAZY_LOAD_MODULES", [])
+        self.__parallel_import = getConfig("PARALLEL_IMPORT", False)
+        self.__timings = {}
 
     def __load_modules(self) -> tuple:
         all_modules = []
@@ -55,59 +74,255 @@ class _Modules:
                                 "present in sys already")
         return (all_modules, sys_modules, user_modules)
 
-    def import_load_modules(self):
-        def tryImportModule(path, module) -> bool:
+    def __build_manifest(self, path: str):
+        """
+        Build a lightweight manifest of a module by parsing its source
+        instead of importing it
+
+        Args:
+            path (string): path to the module
+
+        Returns:
+            a tuple (commands, dependencies, usages, description) or None
+            if the module uses any feature which can't be registered
+            lazily. commands is a list of
+            (command, alt, hasArgs, ignore_edits, kwargs), dependencies a
+            set of top-level packages the module imports, usages a dict
+            of the commands' {command: (args, usage)} found and
+            description the module description (or None)
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as module_file:
+                tree = parse(module_file.read(), path)
+        except Exception as e:
+            log.warning(f"Unable to parse module '{path}': {e}")
+            return None
+        commands, dependencies = [], set()
+        usages, description = {}, None
+        lang_aliases = {}  # name in module: ModuleUsages/ModuleDescriptions
+        usage_dicts = set()  # ModuleUsages attributes the module uses
+        for node in walk(tree):
+            if isinstance(node, ImportFrom) and \
+               node.module == "userbot.include.language_processor":
+                for alias in node.names:
+                    if alias.name in ("ModuleUsages", "ModuleDescriptions"):
+                        lang_aliases[alias.asname or alias.name] = alias.name
+        for node in walk(tree):
+            if isinstance(node, Attribute) and \
+               isinstance(node.value, Name) and \
+               lang_aliases.get(node.value.id) == "ModuleUsages":
+                usage_dicts.add(node.attr)
+            elif isinstance(node, Call) and isinstance(node.func, Name):
+                if node.func.id == "register_cmd_usage" and \
+                   node.args and all(isinstance(arg, Constant)
+                                     for arg in node.args):
+                    values = [arg.value for arg in node.args]
+                    values += [None] * (3 - len(values))
+                    usages[values[0]] = (values[1], values[2])
+                elif node.func.id == "register_module_desc" and node.args:
+                    arg = node.args[0]
+                    if isinstance(arg, Constant):
+                        description = arg.value
+                    elif isinstance(arg, Attribute) and \
+                            isinstance(arg.value, Name) and \
+                            lang_aliases.get(arg.value.id) == \
+                            "ModuleDescriptions":
+                        description = getattr(ModuleDescriptions, arg.attr,
+                                              None)
+            if isinstance(node, Import):
+                dependencies.update(alias.name.split(".")[0]
+                                    for alias in node.names)
+            elif isinstance(node, ImportFrom) and node.module and \
+                    not node.level:
+                dependencies.add(node.module.split(".")[0])
+            elif isinstance(node, AsyncFunctionDef):
+                for decorator in node.decorator_list:
+                    if not isinstance(decorator, Call) or \
+                       not isinstance(decorator.func, Attribute):
+                        continue
+                    handler = decorator.func.attr
+                    if handler in ("on_ChatAction", "on_Pattern", "on_Raw"):
+                        return None  # needs to listen from the start
+                    if handler not in ("on", "on_NewMessage"):
+                        continue
+                    params = (["command", "alt", "hasArgs", "ignore_edits"]
+                              if handler == "on" else
+                              ["command", "alt", "hasArgs"])
+                    kwargs = {}
+                    try:
+                        for name, arg in zip(params, decorator.args):
+                            kwargs[name] = literal_eval(arg)
+                        for keyword in decorator.keywords:
+                            if keyword.arg is None:  # **kwargs
+                                return None
+                            kwargs[keyword.arg] = literal_eval(keyword.value)
+                    except ValueError:  # not a constant value
+                        return None
+                    if len(decorator.args) > len(params) or \
+                       not kwargs.get("command"):
+                        return None
+                    ignore_edits = (kwargs.pop("ignore_edits", False)
+                                    if handler == "on" else True)
+                    commands.append((kwargs.pop("command"),
+                                     kwargs.pop("alt", None),
+                                     kwargs.pop("hasArgs", False),
+                                     ignore_edits, kwargs))
+        # usages registered through the language resources
+        for name in usage_dicts:
+            usage_dict = getattr(ModuleUsages, name, None)
+            if not isinstance(usage_dict, dict):
+                continue
+            for command, _, _, _, _ in commands:
+                if command not in usages and command in usage_dict:
+                    usages[command] = (usage_dict[command].get("args"),
+                                       usage_dict[command].get("usage"))
+        dependencies.discard("userbot")
+        return (commands, dependencies, usages, description)
+
+    def __pre_import(self, dependencies: set):
+        """
+        Import the (third party) dependencies of modules concurrently in
+        a thread pool so the actual module imports find them in
+        sys.modules already
+        """
+        def tryImport(name):
             try:
-                self.__imported_module = import_module(path + module)
-                return True
-            except KeyboardInterrupt:
-                raise KeyboardInterrupt
-            except (BaseException, Exception):
-                log.error(f"Unable to start module '{module}' due "
-                          "to an unhandled exception",
-                          exc_info=True)
-            return False
+                import_module(name)
+            except Exception:
+                pass  # reported by the module import later
+        to_import = [name for name in sorted(dependencies)
+                     if name not in imported_modules]
+        if not to_import:
+            return
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            executor.map(tryImport, to_import)
+        log.info(f"Pre-imported {len(to_import)} dependencies in "
+                 f"{(perf_counter() - start) * 1000:.1f} ms")
+        return
+
+    async def import_load_modules(self):
+        def tryImportModule(path, module) -> bool:
+            imported = False
+            with profile_module(module) as record:
+                try:
+                    self.__imported_module = import_module(path + module)
+                    imported = True
+                except KeyboardInterrupt:
+                    raise KeyboardInterrupt
+                except (BaseException, Exception):
+                    log.error(f"Unable to start module '{module}' due "
+                              "to an unhandled exception",
+                              exc_info=True)
+            self.__timings[module] = record["wall"]
+            return imported
+
+        def lazyLoadModule(path, module) -> bool:
+            manifest = self.__build_manifest(
+                join(dirname(__file__), path.split(".")[1], module + ".py"))
+            if not manifest:
+                return False
+            commands, _, usages, description = manifest
+
+            def loader():
+                log.info(f"Loading module '{module}' on first use")
+                if not tryImportModule(path, module):
+                    update_load_modules(module, False)
+                else:
+                    log.info(f"Module '{module}' started in "
+                             f"{self.__timings[module] * 1000:.1f} ms")
+                return
+
+            for command, alt, hasArgs, ignore_edits, kwargs in commands:
+                # listed by .help and .modules before the import
+                args, usage = usages.get(command, (None, None))
+                pre_register_lazy_cmd(command, alt, hasArgs, module,
+                                      args, usage)
+                names = (command, alt) if alt else (command,)
+                if not ignore_edits:
+                    _router._add_lazy_route(MessageEdited, ".", names,
+                                            loader, **kwargs)
+                _router._add_lazy_route(NewMessage, ".", names,
+                                        loader, **kwargs)
+            if description:
+                register_lazy_module_desc(module, description)
+            return True
+
         try:
             all_modules, sys_modules, user_modules = self.__load_modules()
             for module in sorted(all_modules):
                 update_all_modules(module)
-            for module in sys_modules:
-                if tryImportModule("userbot.modules.", module):
+            to_load = [("userbot.modules.", module)
+                       for module in sys_modules]
+            if not SAFEMODE:
+                to_load += [("userbot.modules_user.", module)
+                            for module in user_modules
+                            if module not in self.__not_load_modules]
+            lazy_modules = []
+            if self.__lazy_load_modules and not SAFEMODE:
+                for path, module in to_load:
+                    if module in self.__lazy_load_modules:
+                        if lazyLoadModule(path, module):
+                            lazy_modules.append(module)
+                        else:
+                            log.warning(f"Module '{module}' can't be "
+                                        "loaded lazily. Starting it now")
+            if self.__parallel_import:
+                dependencies = set()
+                for path, module in to_load:
+                    if module not in lazy_modules:
+                        manifest = self.__build_manifest(
+                            join(dirname(__file__), path.split(".")[1],
+                                 module + ".py"))
+                        if manifest:
+                            dependencies.update(manifest[1])
+                self.__pre_import(dependencies)
+            for path, module in to_load:
+                if module in lazy_modules:
+                    update_load_modules(module, True)
+                    self.__load_modules_count += 1
+                    continue
+                if tryImportModule(path, module):
                     update_load_modules(module, True)
                     self.__load_modules_count += 1
                 else:
                     update_load_modules(module, False)
+                # let the loop process the connection between imports
+                await sleep(0)
             for module in user_modules:
-                if not SAFEMODE:
-                    if module not in self.__not_load_modules:
-                        if tryImportModule("userbot.modules_user.", module):
-                            update_load_modules(module, True)
-                            self.__load_modules_count += 1
-                        else:
-                            update_load_modules(module, False)
                 update_user_modules(module)
+            if lazy_modules:
+                log.info("Lazy loaded modules: " + ", ".join(lazy_modules))
         except:
             raise
         return
 
+    def startup_timings(self) -> dict:
+        return self.__timings
+
     def loaded_modules(self) -> int:
         return self.__load_modules_count
 
 
-def start_modules():
+async def start_modules():
     if SAFEMODE:
         log.info("Starting system modules only")
     else:
         log.info("Starting modules")
     modules = _Modules()
     try:
-        modules.import_load_modules()
+        await modules.import_load_modules()
     except KeyboardInterrupt:
         raise KeyboardInterrupt
     except (BaseException, Exception) as e:
         log.critical(f"Failed to start modules: {e}", exc_info=True)
     load_modules_count = modules.loaded_modules()
     sum_modules = len(getAllModules())
+    timings = modules.startup_timings()
+    if timings:
+        log.info("Module startup timings: " + ", ".join(
+            f"{module} {duration * 1000:.1f} ms" for module, duration in
+            sorted(timings.items(), key=lambda item: item[1], reverse=True)))
     if not load_modules_count:
         log.warning("No modules started!")
     elif load_modules_count > 0:
@@ -116,14 +331,54 @@ def start_modules():
     return
 
 
+async def _startup():
+    """
+    Connect the client and start the modules at the same time. Modules
+    are imported in the event loop's thread, as module-level code may
+    create asyncio objects or use the loop. The import of every module
+    is followed by a return to the loop, so the connection and
+    authorization handshake proceeds while the modules start and the
+    startup takes about as long as the slower of both instead of their
+    sum
+    """
+    timings = {}
+    start = perf_counter()
+
+    async def connect():
+        with profile_phase("Client connection") as record:
+            await tgclient.start()
+            me = await tgclient.get_me()
+        timings["connect"] = record["wall"]
+        return me
+
+    connection = create_task(connect())
+    await sleep(0)  # send the first requests before importing
+    with profile_phase("Modules") as record:
+        await start_modules()
+    timings["modules"] = record["wall"]
+    me = await connection
+    if getLoadModules().get("scrappers"):
+        # keeps the data history of .currency up to date
+        startCurrencyRefresher(join(getConfig("TEMP_DL_DIR"), HISTORY_FILE))
+    log.info("Startup phases: " + ", ".join(
+        f"{phase} {duration * 1000:.1f} ms"
+        for phase, duration in timings.items()) +
+        f" (total {(perf_counter() - start) * 1000:.1f} ms)")
+    return me
+
+
 def run_client():
     try:
         log.info("Starting Telegram client")
-        with tgclient:
-            me = tgclient.loop.run_until_complete(tgclient.get_me())
+        try:
+            me = tgclient.loop.run_until_complete(_startup())
+            finish_profiling()
+            log.info("HyperUBot is going online")
             log.info(f"You're running {PROJECT} v{VERSION} as "
                      f"{me.first_name} (ID: {me.id})")
             tgclient.run_until_disconnected()
+        finally:
+            tgclient.disconnect()
     except KeyboardInterrupt:
         raise KeyboardInterrupt
     except (BaseException, Exception) as e:
@@ -134,10 +389,8 @@ def run_client():
 
 def shutdown_logging():
     try:
-        if _fhandler:
-            _fhandler.close()
-        if _shandler:
-            _shandler.close()
+        # writes the records still queued, shutdown() closes the handlers
+        _log_pipeline.stop()
         shutdown()
     except:
         pass
@@ -181,8 +434,6 @@ def check_reboot():
 
 
 def main():
-    start_modules()
-    log.info("HyperUBot is going online")
     run_client()
     log.info("HyperUBot is offline")
     check_reboot()
@@ -6,13 +6,14 @@
 # You may not use this file or any of the content within it, unless in
 # compliance with the PE License
 
+from userbot.include.entity_cache import get_full_user, get_user
+from userbot.include.event_log_sink import submit_event
 from userbot.include.language_processor import GeneralMessages as msgsLang
 from userbot.sysutils.configuration import getConfig
 from telethon.tl.types import PeerUser, PeerChannel, User
-from telethon.tl.functions.users import GetFullUserRequest
 from logging import getLogger
 from subprocess import check_output, CalledProcessError
-from asyncio import create_subprocess_exec as asyncr
+from asyncio import create_subprocess_exec as asyncr, gather, wait_for
 from asyncio.subprocess import PIPE as asyncPIPE
 from json import loads
 from shutil import which
@@ -102,14 +103,15 @@ async def fetch_user(event=None, full_user=False,
             pass
 
         if not user:
-            oh_look_its_me = await event.client.get_me()
-            user = oh_look_its_me.id
+            # the input peer of the own account is known without request
+            oh_look_its_me = await event.client.get_me(input_peer=True)
+            user = oh_look_its_me.user_id
 
     try:
         if full_user:
-            user_obj = await event.client(GetFullUserRequest(user))
+            user_obj = await get_full_user(event.client, user)
         else:
-            user_obj = await event.client.get_entity(user)
+            user_obj = await get_user(event.client, user)
             if not type(user_obj) is User:
                 await event.edit(msgsLang.ENTITY_NOT_USER)
                 user_obj = None
@@ -124,7 +126,9 @@ async def event_log(event, event_name: str, user_name=None,
                     user_id=None, username=None, chat_title=None,
                     chat_link=None, chat_id=None, custom_text=None):
     """
-    Log any event by sending a message to the targeted chat
+    Log any event by sending a message to the targeted chat. The message
+    is sent in the background, events logged within EVENT_LOG_WINDOW
+    seconds are merged into one message
 
     Args:
         event (Event): any event e.g. NewMessage
@@ -169,10 +173,8 @@ async def event_log(event, event_name: str, user_name=None,
     if custom_text:
         text += f"{custom_text}"
 
-    try:
-        await event.client.send_message(log_chat_id, text)
-    except Exception as e:
-        log.warning(f"EVENT_LOG ({event_name}): {e}")
+    # sent in the background, merged with events of the next seconds
+    submit_event(event.client, log_chat_id, text)
     return
 
 
@@ -319,6 +321,10 @@ def pinger(address) -> str:
     Example:
         ping = pinger("8.8.8.8")
 
+    Note:
+        This function blocks until the ping finished. Use async_pinger
+        from userbot.include.ping_engine in commands instead
+
     Returns:
         Ping result as a string
     """
@@ -366,6 +372,42 @@ async def getGitReview():
     return commit
 
 
+async def fan_out(calls: dict, timeout: float = 10) -> tuple:
+    """
+    Await independent requests concurrently, each with its own timeout.
+    A failed or timed out request doesn't affect the others, its result
+    is None instead
+
+    Args:
+        calls (dict): name and awaitable of every request
+        timeout (float): seconds to wait for every single request
+
+    Example:
+        results, failed = await fan_out(
+            {"me": event.client.get_me(),
+             "chat": event.get_chat()}, timeout=5)
+        if "chat" not in failed:
+            print(results["chat"].title)
+
+    Returns:
+        A tuple of the results {name: result or None} and a list
+        of the names of the failed requests
+    """
+    async def call(name, awaitable):
+        try:
+            return await wait_for(awaitable, timeout)
+        except Exception as e:
+            log.warning(f"Request '{name}' failed: "
+                        f"{e if str(e) else type(e).__name__}")
+            failed.append(name)
+        return None
+
+    failed = []
+    names = list(calls.keys())
+    values = await gather(*[call(name, calls[name]) for name in names])
+    return (dict(zip(names, values)), failed)
+
+
 # Package Manager
 def sizeStrMaker(size: float, value: int = 0):
     """
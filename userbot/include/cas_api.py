@@ -1,18 +1,149 @@
+from userbot.sysutils.configuration import getConfig
+from asyncio import Semaphore, gather, get_event_loop
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dateutil.parser import parse
+from threading import Lock
+from time import monotonic
+from requests.adapters import HTTPAdapter
 import json
 import requests
-from dateutil.parser import parse
 
 
-VERSION = "1.4.1"
+VERSION = "1.5.0"
 CAS_QUERY_URL = "https://api.cas.chat/check?user_id="
 DL_DIR = "./csvExports"
+MAX_CONCURRENCY = 16  # lookups in flight at most
+_CACHE_SIZE = 100000  # verdicts kept at most
 
 
-def get_user_data(user_id):
-    with requests.request('GET', CAS_QUERY_URL + str(user_id)) as userdata_raw:
-        userdata = json.loads(userdata_raw.text)
+class _CASClient:
+    def __init__(self):
+        """
+        All lookups share one session with a connection pool as large as
+        the amount of concurrent lookups. Verdicts are cached for
+        CAS_CACHE_TTL seconds
+        """
+        self.__session = None
+        self.__cache = OrderedDict()  # user ID: (expires, userdata)
+        # verdicts of users not banned are identical, keep them once
+        self.__verdicts = {}  # raw response: userdata
+        self.__lock = Lock()
+        self.__executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY,
+                                             thread_name_prefix="cas_api")
+        self.hits = 0
+        self.misses = 0
+
+    def __getSession(self) -> requests.Session:
+        with self.__lock:
+            if self.__session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=MAX_CONCURRENCY)
+                self.__session = requests.Session()
+                self.__session.mount("https://", adapter)
+                self.__session.mount("http://", adapter)
+        return self.__session
+
+    def _cached(self, user_id: int):
+        with self.__lock:
+            entry = self.__cache.get(user_id)
+            if entry is None or entry[0] < monotonic():
+                self.misses += 1
+                return None
+            self.__cache.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def _lookup(self, user_id: int) -> dict:
+        """
+        Blocking lookup of the user, raises if CAS couldn't be reached
+        """
+        with self.__getSession().get(CAS_QUERY_URL + str(user_id),
+                                     timeout=15) as userdata_raw:
+            userdata_raw.raise_for_status()
+            raw = userdata_raw.text
+        userdata = json.loads(raw)
+        with self.__lock:
+            if not userdata.get("ok"):
+                userdata = self.__verdicts.setdefault(raw, userdata)
+            self.__cache[user_id] = (monotonic() +
+                                     getConfig("CAS_CACHE_TTL", 3600),
+                                     userdata)
+            self.__cache.move_to_end(user_id)
+            while len(self.__cache) > _CACHE_SIZE:
+                self.__cache.popitem(last=False)
         return userdata
 
+    def _get(self, user_id: int) -> dict:
+        userdata = self._cached(user_id)
+        return userdata if userdata is not None else self._lookup(user_id)
+
+    async def _fetch(self, user_id: int) -> dict:
+        userdata = self._cached(user_id)
+        if userdata is not None:  # no thread hop for cached verdicts
+            return userdata
+        return await get_event_loop().run_in_executor(
+            self.__executor, self._lookup, user_id)
+
+    def _getStats(self) -> dict:
+        return {"size": len(self.__cache), "hits": self.hits,
+                "misses": self.misses}
+
+
+_client = _CASClient()
+
+
+def get_user_data(user_id):
+    return _client._get(user_id)
+
+
+async def fetch_user_data(user_id: int) -> dict:
+    """
+    Look up a user in CAS without blocking the event loop. Verdicts are
+    cached for CAS_CACHE_TTL seconds
+
+    Args:
+        user_id (int): ID of the user
+
+    Returns:
+        the user data as returned by CAS. Raises if CAS couldn't be
+        reached
+    """
+    return await _client._fetch(user_id)
+
+
+async def fetch_users_data(user_ids: list,
+                           concurrency: int = MAX_CONCURRENCY) -> dict:
+    """
+    Look up several users in CAS with at most concurrency lookups in
+    flight at the same time
+
+    Args:
+        user_ids (list): IDs of the users
+        concurrency (int): lookups in flight at most
+
+    Returns:
+        the user data of every user ID, None if the lookup failed
+    """
+    semaphore = Semaphore(max(min(concurrency, MAX_CONCURRENCY), 1))
+
+    async def lookup(user_id: int):
+        async with semaphore:
+            try:
+                return await _client._fetch(user_id)
+            except Exception:
+                return None
+    results = await gather(*[lookup(user_id) for user_id in user_ids])
+    return dict(zip(user_ids, results))
+
+
+def getCASCacheStats() -> dict:
+    """
+    Returns size, hits and misses of the verdict cache.
+    Scheme: {"size": 0, "hits": 0, "misses": 0}
+    """
+    return _client._getStats()
+
 
 def isbanned(userdata):
     return userdata['ok']
@@ -0,0 +1,324 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from userbot.sysutils.configuration import getConfig
+from userbot.sysutils.metrics import track_job
+from currency_converter import CURRENCY_FILE
+from array import array
+from asyncio import create_task, get_event_loop, shield, sleep
+from datetime import date as Date
+from io import BytesIO
+from itertools import zip_longest
+from logging import getLogger
+from math import isnan
+from os import replace, stat
+from os.path import getmtime
+from random import uniform
+from time import perf_counter, time
+from urllib.request import urlopen
+from zipfile import BadZipFile, ZipFile
+
+log = getLogger(__name__)
+HISTORY_FILE = "currency.csv"  # name of the data history in TEMP_DL_DIR
+ECB_HIST_URL = "http://www.ecb.int/stats/eurofxref/eurofxref-hist.zip"
+_REF_CURRENCY = "EUR"  # all ECB rates are quoted against the euro
+_NA_VALUES = ("", "N/A")
+_RETRY_DELAY = 1800  # seconds to wait after a failed download
+
+
+class _RateTable:
+    def __init__(self, lines):
+        """
+        Columnar copy of the ECB history: one array of day ordinals
+        (ascending) shared by all currencies and one array of rates per
+        currency. Missing rates are stored as NaN
+        """
+        start = perf_counter()
+        lines = iter(lines)
+        header = [currency.strip()
+                  for currency in next(lines).strip().split(",")[1:]]
+        rows = sorted(line.strip().split(",") for line in lines
+                      if line.strip())  # ECB files are newest first
+        # transpose once, every column is converted in a single pass
+        columns = list(zip_longest(*rows, fillvalue=""))
+        if not columns:
+            raise ValueError("no rates found")
+        self.__days = array("l", (Date.fromisoformat(day).toordinal()
+                                  for day in columns[0]))
+        self.__day_index = {day: index
+                            for index, day in enumerate(self.__days)}
+        self.__rates = {}
+        self.__last = {}  # currency: index of the last known rate
+        nan = float("nan")
+        for currency, column in zip(header, columns[1:]):
+            if not currency:  # trailing comma of the header
+                continue
+            rates = array("d", [nan if rate in _NA_VALUES else float(rate)
+                                for rate in column])
+            last = len(rates) - 1
+            while last >= 0 and isnan(rates[last]):
+                last -= 1
+            if last >= 0:
+                self.__rates[currency] = rates
+                self.__last[currency] = last
+        self.currencies = frozenset(self.__rates) | {_REF_CURRENCY}
+        self.parse_time = perf_counter() - start
+        self.nbytes = (self.__days.itemsize * len(self.__days) +
+                       sum(rates.itemsize * len(rates)
+                           for rates in self.__rates.values()))
+
+    @property
+    def days(self) -> int:
+        return len(self.__days)
+
+    def last_date(self, currency: str) -> Date:
+        """
+        Returns the date of the most recent rate of the currency
+        """
+        if currency == _REF_CURRENCY:
+            return Date.fromordinal(self.__days[-1])
+        return Date.fromordinal(self.__days[self.__last[currency]])
+
+    def __rate(self, currency: str, index, date: Date = None) -> float:
+        if currency == _REF_CURRENCY:
+            return 1.0
+        rates = self.__rates.get(currency)
+        if rates is None:
+            raise ValueError(f"{currency} is not a supported currency")
+        rate = rates[index] if index is not None else float("nan")
+        if isnan(rate):
+            if date is None:
+                date = Date.fromordinal(self.__days[index])
+            raise ValueError(f"{currency} has no rate for {date}")
+        return rate
+
+    def rate(self, currency: str, date: Date) -> float:
+        """
+        Returns the rate of the currency against the euro at the date
+        """
+        return self.__rate(currency,
+                           self.__day_index.get(date.toordinal()), date)
+
+    def convert(self, amount: float, currency: str, new_currency: str,
+                date: Date = None) -> float:
+        """
+        Convert the amount from a currency to another one at the date,
+        at the date of the most recent rate of currency by default
+        """
+        for iso in (currency, new_currency):
+            if iso not in self.currencies:
+                raise ValueError(f"{iso} is not a supported currency")
+        if date is None:
+            index = self.__last.get(currency, len(self.__days) - 1)
+        else:
+            index = self.__day_index.get(date.toordinal())
+        return (float(amount) / self.__rate(currency, index, date) *
+                self.__rate(new_currency, index, date))
+
+
+def _read_lines(file_path: str) -> list:
+    with open(file_path, "rb") as rates_file:
+        content = rates_file.read()
+    if file_path.endswith(".zip"):
+        with ZipFile(BytesIO(content)) as zip_file:
+            return zip_file.read(
+                zip_file.namelist()[0]).decode("utf-8").splitlines()
+    return content.decode("utf-8").splitlines()
+
+
+class _RateEngine:
+    def __init__(self):
+        """
+        Keeps the parsed rate table in memory. The file is only parsed
+        again if its modification time (or size) changed, parsing runs
+        in a worker thread
+        """
+        self.__table = None
+        self.__source = None  # (path, mtime, size) of the loaded table
+        self.__loading = None
+
+    def __signature(self, file_path: str):
+        try:
+            info = stat(file_path)
+        except OSError:
+            return None
+        return (file_path, info.st_mtime_ns, info.st_size)
+
+    def __load(self, signature: tuple) -> _RateTable:
+        # worker thread
+        try:
+            table = _RateTable(_read_lines(signature[0]))
+        except Exception as e:
+            if signature[0] == CURRENCY_FILE:
+                raise
+            log.warning(f"Unable to read data history: {e}. Falling back "
+                        "to default currency data.")
+            table = _RateTable(_read_lines(CURRENCY_FILE))
+        log.info(f"[CURRENCY] {table.days} days of "
+                 f"{len(table.currencies)} currencies loaded in "
+                 f"{table.parse_time * 1000:.1f} ms "
+                 f"({table.nbytes / 1024:.0f} KiB)")
+        return table
+
+    async def _getTable(self, file_path: str) -> _RateTable:
+        signature = self.__signature(file_path)
+        if signature is None:  # no downloaded history (yet)
+            signature = self.__signature(CURRENCY_FILE)
+        if signature is None:
+            raise FileNotFoundError("No currency data available")
+        if self.__table is not None and signature == self.__source:
+            return self.__table
+        if self.__loading is None:
+            self.__loading = get_event_loop().run_in_executor(
+                None, self.__load, signature)
+            self.__loading.add_done_callback(
+                lambda loading: self.__loaded(loading, signature))
+        # shielded, so a cancelled waiter can't cancel the others
+        table = await shield(self.__loading)
+        return table
+
+    def __loaded(self, loading, signature: tuple):
+        self.__loading = None
+        if not loading.cancelled() and loading.exception() is None:
+            self.__table = loading.result()
+            self.__source = signature
+        return
+
+    def _getStats(self) -> dict:
+        table = self.__table
+        if table is None:
+            return {}
+        return {"source": self.__source[0], "days": table.days,
+                "currencies": len(table.currencies),
+                "parse_time": table.parse_time, "memory": table.nbytes}
+
+
+_engine = _RateEngine()
+
+
+class _HistoryRefresher:
+    def __init__(self):
+        """
+        Keeps the data history up to date in the background, started
+        once the client is running. It's downloaded once it's older
+        than CURRENCY_REFRESH_INTERVAL seconds, after a random delay so
+        bots started at the same time don't hit the ECB together.
+        Commands never wait for a download
+        """
+        self.__task = None
+
+    def _start(self, file_path: str):
+        if self.__task is None or self.__task.done():
+            self.__task = create_task(self.__run(file_path))
+        return
+
+    def __next_refresh(self, file_path: str, failed: bool) -> float:
+        interval = getConfig("CURRENCY_REFRESH_INTERVAL", 86400)
+        jitter = uniform(0, min(interval / 10, 600))
+        if failed:
+            return min(interval, _RETRY_DELAY) + jitter
+        try:
+            age = time() - getmtime(file_path)
+        except OSError:
+            age = interval  # no data history yet
+        return max(interval - age, 0) + jitter
+
+    async def __run(self, file_path: str):
+        failed = False
+        while True:
+            await sleep(self.__next_refresh(file_path, failed))
+            try:
+                with track_job("currency_refresh"):
+                    await get_event_loop().run_in_executor(
+                        None, downloadHistory, file_path)
+                    # parse it now rather than in the next command
+                    await getRateTable(file_path)
+                failed = False
+            except Exception as e:
+                log.warning(f"Unable to update currency data history: {e}")
+                failed = True
+
+
+_refresher = _HistoryRefresher()
+
+
+def downloadHistory(file_path: str):
+    """
+    Download the latest data history from the European Central Bank and
+    swap it in atomically, so readers see either the old or the new
+    history but never a partial one. Blocking, call it in a worker
+    thread
+
+    Args:
+        file_path (string): where to store the history (csv)
+    """
+    with urlopen(ECB_HIST_URL, timeout=60) as response:
+        content = response.read()
+    try:
+        with ZipFile(BytesIO(content), "r") as zipObject:
+            csv_filename = None
+            for filename in zipObject.namelist():
+                if filename.endswith(".csv"):
+                    csv_filename = filename
+                    break
+            if not csv_filename:
+                raise ValueError("no csv file in data history archive")
+            data = zipObject.read(csv_filename)
+    except BadZipFile as bze:
+        raise ValueError(f"Bad zip archive: {bze}")
+    if not data.startswith(b"Date,"):
+        raise ValueError("unexpected data history format")
+    temp_file = file_path + ".tmp"
+    with open(temp_file, "wb") as csv_file:
+        csv_file.write(data)
+    replace(temp_file, file_path)
+    log.info("[CURRENCY] data history successfully updated")
+    return
+
+
+def startCurrencyRefresher(file_path: str):
+    """
+    Refresh the data history at file_path in the background every
+    CURRENCY_REFRESH_INTERVAL seconds. Requires a running event loop,
+    starting it again while it's running does nothing
+
+    Args:
+        file_path (string): path to the data history (csv)
+    """
+    _refresher._start(file_path)
+    return
+
+
+async def getRateTable(file_path: str) -> _RateTable:
+    """
+    Get the rate table of the ECB history file. The file is parsed once
+    and again only after it changed. The history bundled with
+    currency_converter is used if the file doesn't exist
+
+    Args:
+        file_path (string): path to the ECB history (csv or zip)
+
+    Example:
+        table = await getRateTable(CC_CSV_PATH)
+        if "USD" in table.currencies:
+            print(table.convert(10, "EUR", "USD"))
+
+    Returns:
+        the rate table
+    """
+    return await _engine._getTable(file_path)
+
+
+def getRateTableStats() -> dict:
+    """
+    Returns information about the loaded rate table or an empty dict if
+    no table is loaded yet.
+    Scheme: {"source": "file path", "days": 0, "currencies": 0,
+             "parse_time": "seconds", "memory": "bytes"}
+    """
+    return _engine._getStats()
@@ -0,0 +1,255 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from userbot.sysutils.configuration import getConfig
+from telethon.events import Raw
+from telethon.tl import types as tl_types
+from telethon.tl.functions.users import GetFullUserRequest
+from collections import OrderedDict
+from logging import getLogger
+from time import monotonic
+
+log = getLogger(__name__)
+# updates which change the information of a user. Not every update
+# exists in every layer supported by Telethon
+_INVALIDATING_UPDATES = tuple(
+    getattr(tl_types, name) for name in ("UpdateUser", "UpdateUserName",
+                                         "UpdateUserPhone", "UpdateUserPhoto")
+    if hasattr(tl_types, name))
+
+
+class _TTLCache:
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Bounded least recently used cache whose entries expire after
+        ttl seconds
+        """
+        self.__entries = OrderedDict()  # key: (expires, value)
+        self.__maxsize = maxsize
+        self.__ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key):
+        entry = self.__entries.get(key)
+        if entry is None or entry[0] < monotonic():
+            if entry is not None:
+                del self.__entries[key]
+            self.misses += 1
+            return None
+        self.__entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key, value):
+        self.__entries[key] = (monotonic() + self.__ttl, value)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__maxsize:
+            self.__entries.popitem(last=False)
+        return
+
+    def pop(self, key):
+        entry = self.__entries.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self):
+        self.__entries.clear()
+        return
+
+
+class _EntityCache:
+    def __init__(self):
+        """
+        Shared cache of resolved users. User and FullUser objects are
+        cached separately by user ID, usernames (and any other non-ID
+        identifier) are mapped to the user ID they resolved to.
+        """
+        self.__users = None
+        self.__full_users = None
+        self.__aliases = None  # alias: (user ID, alias is the username)
+        self.__hooked_clients = set()
+
+    def __setup(self):
+        """
+        Create the caches on first use, as this module is imported
+        before the configurations are loaded
+        """
+        if self.__users is not None:
+            return
+        maxsize = getConfig("ENTITY_CACHE_SIZE", 256)
+        ttl = getConfig("ENTITY_CACHE_TTL", 300)
+        self.__users = _TTLCache(maxsize, ttl)
+        self.__full_users = _TTLCache(maxsize, ttl)
+        self.__aliases = _TTLCache(maxsize, ttl)
+        return
+
+    def __hook_client(self, client):
+        """
+        Listen to user updates of the client to drop changed users.
+        Done on first use as the client doesn't exist yet on import
+        """
+        if id(client) in self.__hooked_clients:
+            return
+        self.__hooked_clients.add(id(client))
+        if not _INVALIDATING_UPDATES:
+            return
+
+        async def invalidate(update):
+            self._invalidate(update.user_id)
+        try:
+            client.add_event_handler(invalidate,
+                                     Raw(types=list(_INVALIDATING_UPDATES)))
+        except Exception as e:
+            log.warning(f"Unable to listen to user updates: {e}")
+        return
+
+    def __alias(self, identifier):
+        if isinstance(identifier, str):
+            identifier = identifier.strip().lower()
+            return identifier[1:] if identifier.startswith("@") else identifier
+        return None
+
+    def __user(self, obj):
+        if isinstance(obj, tl_types.User):
+            return obj
+        for attr in ("user", "full_user"):  # FullUser depending on layer
+            user = getattr(obj, attr, None)
+            if user is not None and hasattr(user, "id"):
+                return user
+        users = getattr(obj, "users", None)
+        return users[0] if users else None
+
+    def __username(self, obj) -> str:
+        user = self.__user(obj)
+        username = getattr(user, "username", None)
+        return username.lower() if username else None
+
+    def __cached(self, cache: _TTLCache, identifier):
+        if isinstance(identifier, int):
+            return cache.get(identifier)
+        alias = self.__alias(identifier)
+        entry = self.__aliases.get(alias) if alias is not None else None
+        if entry is None:
+            return None
+        user_id, is_username = entry
+        obj = cache.get(user_id)
+        if obj is not None and is_username and \
+           self.__username(obj) != alias:
+            # renamed since, the username may belong to someone else now
+            self.__aliases.pop(alias)
+            return None
+        return obj
+
+    async def __resolve(self, client, cache: _TTLCache, identifier,
+                        request):
+        self.__hook_client(client)
+        obj = self.__cached(cache, identifier)
+        if obj is not None:
+            return obj
+        obj = await request()
+        user = self.__user(obj)
+        if user is not None and hasattr(user, "id"):
+            cache.put(user.id, obj)
+            alias = self.__alias(identifier)
+            if alias is not None:
+                self.__aliases.put(
+                    alias, (user.id, alias == self.__username(obj)))
+        return obj
+
+    async def _get_user(self, client, identifier):
+        self.__setup()
+        return await self.__resolve(
+            client, self.__users, identifier,
+            lambda: client.get_entity(identifier))
+
+    async def _get_full_user(self, client, identifier):
+        self.__setup()
+        return await self.__resolve(
+            client, self.__full_users, identifier,
+            lambda: client(GetFullUserRequest(identifier)))
+
+    def _invalidate(self, user_id: int):
+        self.__setup()
+        self.__users.pop(user_id)
+        self.__full_users.pop(user_id)
+        return
+
+    def _clear(self):
+        self.__setup()
+        for cache in (self.__users, self.__full_users, self.__aliases):
+            cache.clear()
+        return
+
+    def _getStats(self) -> dict:
+        self.__setup()
+        return {name: {"size": len(cache), "hits": cache.hits,
+                       "misses": cache.misses}
+                for name, cache in (("users", self.__users),
+                                    ("full_users", self.__full_users))}
+
+
+_entity_cache = _EntityCache()
+
+
+async def get_user(client, identifier):
+    """
+    Resolve a user (or any other entity) by ID or username. Results are
+    cached for ENTITY_CACHE_TTL seconds
+
+    Args:
+        client (TelegramClient): the client to resolve with
+        identifier: user ID, username or anything get_entity accepts
+
+    Returns:
+        the entity as returned by get_entity
+    """
+    return await _entity_cache._get_user(client, identifier)
+
+
+async def get_full_user(client, identifier):
+    """
+    Fetch the full information of a user by ID or username. Results are
+    cached for ENTITY_CACHE_TTL seconds
+
+    Args:
+        client (TelegramClient): the client to fetch with
+        identifier: user ID, username or anything GetFullUserRequest
+                    accepts
+
+    Returns:
+        the result of GetFullUserRequest
+    """
+    return await _entity_cache._get_full_user(client, identifier)
+
+
+def invalidate_user(user_id: int):
+    """
+    Drops the cached User and FullUser objects of the given user
+    """
+    _entity_cache._invalidate(user_id)
+    return
+
+
+def clear_entity_cache():
+    """
+    Drops all cached entities
+    """
+    _entity_cache._clear()
+    return
+
+
+def getEntityCacheStats() -> dict:
+    """
+    Returns size, hits and misses of the User and FullUser caches.
+    Scheme: {"users": {"size": 0, "hits": 0, "misses": 0},
+             "full_users": {"size": 0, "hits": 0, "misses": 0}}
+    """
+    return _entity_cache._getStats()
@@ -0,0 +1,140 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from userbot.include.language_processor import GeneralMessages as msgsLang
+from userbot.sysutils.configuration import getConfig
+from telethon.errors import FloodWaitError
+from asyncio import (Queue, QueueEmpty, QueueFull, create_task, sleep,
+                     wait_for)
+from asyncio import TimeoutError as AsyncTimeoutError
+from logging import getLogger
+from time import monotonic
+
+log = getLogger(__name__)
+_MESSAGE_LIMIT = 4096  # characters of a Telegram message at most
+_QUEUE_SIZE = 256  # events waiting to be sent at most
+_SEPARATOR = "\n\n"
+
+
+def _pack(texts: list, limit: int = _MESSAGE_LIMIT) -> list:
+    """
+    Merge the texts into as few messages as possible, none longer than
+    limit. A text longer than limit is split on its own, after its last
+    line that fits if possible
+    """
+    messages, current = [], ""
+    for text in texts:
+        while len(text) > limit:
+            if current:
+                messages.append(current)
+                current = ""
+            cut = text.rfind("\n", 1, limit + 1)
+            if cut > 0:  # the line break itself is dropped
+                messages.append(text[:cut])
+                text = text[cut + 1:]
+            else:
+                messages.append(text[:limit])
+                text = text[limit:]
+        if not text:
+            continue
+        if current and len(current) + len(_SEPARATOR) + len(text) > limit:
+            messages.append(current)
+            current = ""
+        current = current + _SEPARATOR + text if current else text
+    if current:
+        messages.append(current)
+    return messages
+
+
+class _EventLogSink:
+    def __init__(self):
+        """
+        Sends logged events in the background. Events arriving within
+        EVENT_LOG_WINDOW seconds are merged into one message, so a burst
+        of e.g. bans doesn't flood the log chat. Submitting never waits
+        for Telegram
+        """
+        self.__queue = None  # (client, chat ID, text)
+        self.__task = None
+        self.__dropped = 0
+
+    def _submit(self, client, chat_id, text: str):
+        if self.__queue is None:  # created in the running loop
+            self.__queue = Queue(maxsize=_QUEUE_SIZE)
+        if self.__task is None or self.__task.done():
+            self.__task = create_task(self.__run())
+        try:
+            self.__queue.put_nowait((client, chat_id, text))
+        except QueueFull:
+            # never block the command, the sender is too far behind
+            if not self.__dropped:
+                log.warning("EVENT_LOG queue is full, dropping events")
+            self.__dropped += 1
+        return
+
+    async def __collect(self) -> list:
+        events = [await self.__queue.get()]
+        deadline = monotonic() + getConfig("EVENT_LOG_WINDOW", 2)
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            try:
+                events.append(await wait_for(self.__queue.get(), remaining))
+            except AsyncTimeoutError:
+                break
+        # take what's left without waiting any longer
+        while True:
+            try:
+                events.append(self.__queue.get_nowait())
+            except QueueEmpty:
+                break
+        return events
+
+    async def __send(self, client, chat_id, text: str):
+        while True:
+            try:
+                await client.send_message(chat_id, text)
+                return
+            except FloodWaitError as fwe:
+                log.info(f"EVENT_LOG: flood wait of {fwe.seconds}s")
+                await sleep(fwe.seconds + 1)
+            except Exception as e:
+                log.warning(f"EVENT_LOG: {e}")
+                return
+
+    async def __run(self):
+        while True:
+            events = await self.__collect()
+            targets = {}  # (client, chat ID): texts, in order of arrival
+            for client, chat_id, text in events:
+                targets.setdefault((client, chat_id), []).append(text)
+            if self.__dropped:
+                first = next(iter(targets.values()))
+                first.append(msgsLang.LOG_DROPPED.format(self.__dropped))
+                self.__dropped = 0
+            for (client, chat_id), texts in targets.items():
+                for message in _pack(texts):
+                    await self.__send(client, chat_id, message)
+
+
+_sink = _EventLogSink()
+
+
+def submit_event(client, chat_id, text: str):
+    """
+    Queue a text to be sent to the chat in the background. Texts queued
+    shortly after each other are merged into one message
+
+    Args:
+        client (TelegramClient): the client to send with
+        chat_id: the targeted chat
+        text (string): the text to send
+    """
+    _sink._submit(client, chat_id, text)
+    return
@@ -1,31 +1,166 @@
-import urllib.request as url
+from userbot.sysutils.configuration import getConfig
+from asyncio import get_event_loop
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from os import replace
+from os.path import join
+from threading import Lock
 import json
+import requests
 
-VERSION = "1.2.0"
-APIURL = "http://api.github.com/repos/"
+VERSION = "1.3.0"
+APIURL = "https://api.github.com/repos/"
+RELEASES_PER_PAGE = 10
+_CACHE_SIZE = 64  # responses kept at most
 
 
 def vercheck() -> str:
     return str(VERSION)
 
 
+class _GitHubClient:
+    def __init__(self):
+        """
+        All requests share one session, so connections to the API are
+        reused. Responses are cached with their ETag and revalidated
+        with If-None-Match, unchanged data (304) doesn't count against
+        the rate limit. The cache is kept in TEMP_DL_DIR/github_cache.json
+        to survive restarts
+        """
+        self.__session = None
+        self.__cache = None  # url: {"etag": ETag, "data": decoded JSON}
+        self.__lock = Lock()
+        self.__executor = ThreadPoolExecutor(max_workers=2,
+                                             thread_name_prefix="git_api")
+
+    def __cache_file(self) -> str:
+        return join(getConfig("TEMP_DL_DIR", "."), "github_cache.json")
+
+    def __setup(self):
+        # requires lock
+        if self.__session is None:
+            self.__session = requests.Session()
+            self.__session.headers.update(
+                {"Accept": "application/vnd.github.v3+json"})
+        if self.__cache is None:
+            self.__cache = OrderedDict()
+            try:
+                with open(self.__cache_file(), "r") as cache_file:
+                    self.__cache.update(json.load(cache_file))
+            except (OSError, ValueError):
+                pass  # no (valid) cache yet
+        return
+
+    def __store(self, request_url: str, etag: str, data):
+        with self.__lock:
+            self.__cache[request_url] = {"etag": etag, "data": data}
+            self.__cache.move_to_end(request_url)
+            while len(self.__cache) > _CACHE_SIZE:
+                self.__cache.popitem(last=False)
+            try:
+                temp_file = self.__cache_file() + ".tmp"
+                with open(temp_file, "w") as cache_file:
+                    json.dump(self.__cache, cache_file)
+                replace(temp_file, self.__cache_file())
+            except OSError:
+                pass  # keep it in memory at least
+        return
+
+    def _get(self, request_url: str, params: dict = None):
+        """
+        Blocking GET of the JSON data at request_url
+
+        Returns:
+            the decoded JSON data or None if the resource doesn't exist
+            or the API couldn't be reached without a cached response
+        """
+        if params:
+            request_url += "?" + "&".join(f"{key}={value}"
+                                          for key, value in params.items())
+        with self.__lock:
+            self.__setup()
+            cached = self.__cache.get(request_url)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        try:
+            response = self.__session.get(request_url, headers=headers,
+                                          timeout=15)
+        except requests.RequestException:
+            return cached["data"] if cached else None
+        if response.status_code == 304 and cached:
+            return cached["data"]
+        if response.status_code != 200:
+            # rate limited or API troubles, better outdated than nothing
+            if cached and (response.status_code in (403, 429) or
+                           response.status_code >= 500):
+                return cached["data"]
+            return None
+        try:
+            data = response.json()
+        except ValueError:
+            return None
+        etag = response.headers.get("ETag")
+        if etag:
+            self.__store(request_url, etag, data)
+        return data
+
+    async def _fetch(self, request_url: str, params: dict = None):
+        return await get_event_loop().run_in_executor(
+            self.__executor, self._get, request_url, params)
+
+
+_client = _GitHubClient()
+
+
 # Repo-wise stuff
 
 
 def getData(repoURL):
     try:
-        with url.urlopen(APIURL + repoURL + "/releases") as data_raw:
-            repoData = json.loads(data_raw.read().decode())
-            return repoData
+        return _client._get(APIURL + repoURL + "/releases")
     except:
         return None
 
 
 def getLatestData(repoURL):
     try:
-        with url.urlopen(APIURL + repoURL + "/releases/latest") as data_raw:
-            repoData = json.loads(data_raw.read().decode())
-            return repoData
+        return _client._get(APIURL + repoURL + "/releases/latest")
+    except:
+        return None
+
+
+async def fetchReleases(repoURL, page: int = 1,
+                        per_page: int = RELEASES_PER_PAGE):
+    """
+    Get a page of the releases of a repository (newest first) without
+    blocking the event loop. One request per page, revalidated through
+    the response cache
+
+    Args:
+        repoURL (string): user/repo combination e.g. "nunopenim/HyperUBot"
+        page (int): number of the page starting at 1
+        per_page (int): releases per page (max. 100)
+
+    Returns:
+        a list of releases (empty if past the last page) or None if
+        the repository doesn't exist
+    """
+    try:
+        return await _client._fetch(APIURL + repoURL + "/releases",
+                                    {"per_page": per_page, "page": page})
+    except:
+        return None
+
+
+async def fetchLatestRelease(repoURL):
+    """
+    Get the latest release of a repository without blocking the event
+    loop
+
+    Returns:
+        the release or None if there is none
+    """
+    try:
+        return await _client._fetch(APIURL + repoURL + "/releases/latest")
     except:
         return None
 
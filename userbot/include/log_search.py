@@ -0,0 +1,334 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from userbot import LOGFILE
+from asyncio import get_event_loop
+from collections import deque
+from datetime import datetime, timedelta
+from gzip import compress
+from gzip import open as gzip_open
+from io import BytesIO
+from logging import getLogger
+from os import listdir, path, stat
+from threading import Lock
+import re
+
+log = getLogger(__name__)
+_BLOCK_SIZE = 65536  # bytes of the log covered by one index entry
+_CHUNK_SIZE = 1048576  # bytes read at once
+_MAX_MATCHES = 5000  # most recent matches returned at most
+TAIL_LIMIT = 5000  # lines returned by tailLog at most
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"  # same as the log file formatter
+_HEADER = re.compile(
+    rb"\[(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d)\] \d+ ([DIWEC]): ")
+_LEVEL_BITS = {b"D": 1, b"I": 2, b"W": 4, b"E": 8, b"C": 16}
+_LEVEL_NAMES = ("debug", "info", "warning", "error", "critical")
+_SINCE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def _records(log_file, offset: int, end: int = None):
+    """
+    Yields (offset, timestamp, level bit, record) of every complete
+    record read from log_file, starting at offset and stopping at end
+    (or EOF). A record is a log line with its following lines without
+    header e.g. a traceback. Lines before the first header (system info)
+    are yielded as record without timestamp and level (b"", 0)
+    """
+    pending = b""
+    start, timestamp, bit, lines = offset, b"", 0, []
+    position = line_offset = offset
+    while end is None or position < end:
+        chunk = log_file.read(_CHUNK_SIZE if end is None
+                              else min(_CHUNK_SIZE, end - position))
+        if not chunk:
+            break
+        position += len(chunk)
+        data = pending + chunk
+        cut = data.rfind(b"\n") + 1
+        pending = data[cut:]  # incomplete line, still being written
+        for line in data[:cut].splitlines(keepends=True):
+            header = _HEADER.match(line) if line[:1] == b"[" else None
+            if header:
+                if lines:
+                    yield start, timestamp, bit, b"".join(lines)
+                start, lines = line_offset, []
+                timestamp = header.group(1)
+                bit = _LEVEL_BITS[header.group(2)]
+            lines.append(line)
+            line_offset += len(line)
+    if lines:
+        yield start, timestamp, bit, b"".join(lines)
+
+
+class _LiveIndex:
+    def __init__(self):
+        """
+        Sparse index of the current log file: one entry every
+        _BLOCK_SIZE bytes with the byte offset, first and last timestamp
+        and a mask of the levels of the records in that block. Only
+        appended bytes are indexed on every query; the index is rebuilt
+        if the file has been rotated
+        """
+        self.__blocks = []  # [offset, first time, last time, level mask]
+        self.__end = 0  # indexed bytes
+        self.__identity = None  # (device, inode) of the indexed file
+
+    def _update(self, file_path: str) -> tuple:
+        info = stat(file_path)
+        identity = (info.st_dev, info.st_ino)
+        if identity != self.__identity or info.st_size < self.__end:
+            self.__blocks, self.__end = [], 0
+            self.__identity = identity
+        if info.st_size > self.__end:
+            blocks = self.__blocks
+            with open(file_path, "rb") as log_file:
+                log_file.seek(self.__end)
+                for start, timestamp, bit, record in _records(
+                        log_file, self.__end):
+                    if not blocks or \
+                       (bit and start - blocks[-1][0] >= _BLOCK_SIZE):
+                        blocks.append([start, timestamp, timestamp, bit])
+                    elif bit:
+                        block = blocks[-1]
+                        if not block[1]:
+                            block[1] = timestamp
+                        block[2] = timestamp
+                        block[3] |= bit
+                    self.__end = start + len(record)
+        return [tuple(block) for block in self.__blocks], self.__end
+
+
+class _LogSearch:
+    def __init__(self, file_path: str):
+        """
+        Answers tail and grep queries over the log file and its rotated,
+        gzip compressed backups. The current log is searched through
+        _LiveIndex, blocks outside the time range or without the wanted
+        levels are never read. Backups don't change anymore, a summary
+        (time range and level mask) of each is kept to skip whole files
+        """
+        self.__path = file_path
+        self.__index = _LiveIndex()
+        self.__summaries = {}  # file signature: (first, last, mask)
+        self.__lock = Lock()  # queries run in worker threads
+
+    def __backups(self) -> list:
+        """
+        Rotated logs, oldest first
+        """
+        directory, name = path.split(path.abspath(self.__path))
+        pattern = re.compile(re.escape(name) + r"\.(\d+)\.gz")
+        backups = []
+        for file_name in listdir(directory):
+            rotated = pattern.fullmatch(file_name)
+            if rotated:
+                backups.append((int(rotated.group(1)),
+                                path.join(directory, file_name)))
+        return [file_path for _, file_path in sorted(backups, reverse=True)]
+
+    def __summary(self, file_path: str) -> tuple:
+        info = stat(file_path)
+        # renaming keeps the inode, a backup isn't read again after the
+        # next rotation moved it to hyper.log.<n+1>.gz
+        signature = (info.st_dev, info.st_ino, info.st_mtime_ns,
+                     info.st_size)
+        summary = self.__summaries.get(signature)
+        if summary is None:
+            first, last, mask = b"", b"", 0
+            with gzip_open(file_path, "rb") as log_file:
+                for _, timestamp, bit, _ in _records(log_file, 0):
+                    if bit:
+                        first = first or timestamp
+                        last, mask = timestamp, mask | bit
+            summary = (first, last, mask)
+            self.__summaries[signature] = summary
+        return signature, summary
+
+    def _grep(self, matcher, levels: int = None,
+              since: bytes = None) -> tuple:
+        matches, total = deque(maxlen=_MAX_MATCHES), 0
+
+        def collect(records):
+            nonlocal total
+            for _, timestamp, bit, record in records:
+                if levels is not None and not bit & levels:
+                    continue
+                if since is not None and timestamp < since:
+                    continue
+                if matcher(record):
+                    matches.append(record)
+                    total += 1
+            return
+
+        with self.__lock:
+            summaries = {}
+            for backup in self.__backups():
+                try:
+                    signature, (first, last, mask) = self.__summary(backup)
+                    summaries[signature] = (first, last, mask)
+                    if levels is not None and not mask & levels:
+                        continue
+                    if since is not None and last < since:
+                        continue
+                    with gzip_open(backup, "rb") as log_file:
+                        collect(_records(log_file, 0))
+                except (OSError, EOFError) as e:
+                    log.warning(f"Unable to search {backup}: {e}")
+            self.__summaries = summaries  # forget removed backups
+            if path.exists(self.__path):
+                blocks, end = self.__index._update(self.__path)
+                with open(self.__path, "rb") as log_file:
+                    for index, (offset, first, last, mask) in enumerate(
+                            blocks):
+                        if levels is not None and not mask & levels:
+                            continue
+                        if since is not None and last < since:
+                            continue
+                        block_end = (blocks[index + 1][0]
+                                     if index + 1 < len(blocks) else end)
+                        log_file.seek(offset)
+                        collect(_records(log_file, offset, block_end))
+        return list(matches), total
+
+    def _tail(self, lines: int) -> list:
+        result = deque()
+        with self.__lock:
+            if path.exists(self.__path):
+                with open(self.__path, "rb") as log_file:
+                    position = log_file.seek(0, 2)
+                    data, newlines = b"", 0
+                    # read backwards until enough lines are in memory
+                    while position > 0 and newlines <= lines:
+                        size = min(_BLOCK_SIZE, position)
+                        position -= size
+                        log_file.seek(position)
+                        chunk = log_file.read(size)
+                        newlines += chunk.count(b"\n")
+                        data = chunk + data
+                tail = data.splitlines(keepends=True)
+                if position > 0:  # first line may be cut off
+                    tail = tail[1:]
+                result.extend(tail[-lines:])
+            for backup in reversed(self.__backups()):
+                if len(result) >= lines:
+                    break
+                try:
+                    with gzip_open(backup, "rb") as log_file:
+                        tail = deque(log_file, maxlen=lines - len(result))
+                except (OSError, EOFError) as e:
+                    log.warning(f"Unable to read {backup}: {e}")
+                    break
+                result.extendleft(reversed(tail))
+        return list(result)
+
+
+_search = _LogSearch(LOGFILE)
+
+
+def parseLevel(level: str):
+    """
+    Parse a level name or its first letter (e.g. "warning" or "w")
+
+    Returns:
+        a mask of the level and all levels above, None if level isn't
+        a level
+    """
+    level = level.lower()
+    for position, name in enumerate(_LEVEL_NAMES):
+        if level in (name, name[0]):
+            return sum(1 << higher
+                       for higher in range(position, len(_LEVEL_NAMES)))
+    return None
+
+
+def parseSince(since: str):
+    """
+    Parse a relative time (e.g. "30m", "2h", "1d") or a date with an
+    optional time (e.g. "2021-05-30" or "2021-05-30T18:00")
+
+    Returns:
+        the timestamp in the format of the log file, None if since isn't
+        a time
+    """
+    unit = _SINCE_UNITS.get(since[-1:].lower())
+    if unit and since[:-1].isdigit():
+        moment = datetime.now() - timedelta(seconds=int(since[:-1]) * unit)
+    else:
+        try:
+            moment = datetime.fromisoformat(since)
+        except ValueError:
+            return None
+    return moment.strftime(_DATE_FORMAT).encode()
+
+
+async def grepLog(pattern: str, levels: int = None,
+                  since: bytes = None) -> tuple:
+    """
+    Search the log file and its rotated backups without blocking the
+    event loop. The search is case-insensitive
+
+    Args:
+        pattern (string): regular expression to search for
+        levels (int): levels mask as returned by parseLevel, all levels
+                      by default
+        since (bytes): timestamp as returned by parseSince, no time
+                       limit by default
+
+    Example:
+        records, total = await grepLog("flood", parseLevel("warning"),
+                                       parseSince("1d"))
+
+    Returns:
+        a tuple of the most recent matching records (oldest first, at
+        most 5000) and the amount of all matching records. Raises
+        re.error if pattern isn't a valid regular expression
+    """
+    matcher = re.compile(pattern.encode(), re.IGNORECASE).search
+    return await get_event_loop().run_in_executor(
+        None, _search._grep, matcher, levels, since)
+
+
+async def tailLog(lines: int) -> list:
+    """
+    Get the last lines of the log file without blocking the event loop.
+    Rotated backups are read if the current log file is shorter
+
+    Args:
+        lines (int): amount of lines, TAIL_LIMIT at most
+
+    Returns:
+        a list of the lines (bytes), oldest first
+    """
+    lines = max(min(lines, TAIL_LIMIT), 1)
+    return await get_event_loop().run_in_executor(None, _search._tail, lines)
+
+
+async def compressLog(file_name: str, data: bytes = None) -> BytesIO:
+    """
+    Compress data with gzip in a worker thread, the log file if data is
+    None
+
+    Args:
+        file_name (string): name of the compressed file
+        data (bytes): data to compress
+
+    Example:
+        await client.send_file(chat, await compressLog("hyper.log.gz"))
+
+    Returns:
+        the compressed file, ready to be uploaded
+    """
+    def pack() -> bytes:
+        if data is not None:
+            return compress(data)
+        with open(LOGFILE, "rb") as log_file:
+            return compress(log_file.read())
+    compressed = BytesIO(await get_event_loop().run_in_executor(None, pack))
+    compressed.name = file_name
+    return compressed
+
@@ -0,0 +1,198 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from icmplib import async_ping, NameLookupError, SocketPermissionError
+from asyncio import create_subprocess_exec, gather, wait_for
+from asyncio.subprocess import DEVNULL, PIPE
+from collections import OrderedDict, deque
+from logging import getLogger
+from re import search
+from shutil import which
+from sys import platform
+
+log = getLogger(__name__)
+_HISTORY_SIZE = 20  # probes kept per target
+_MAX_TARGETS = 256  # targets with a history at most
+
+
+class _PingHistory:
+    def __init__(self):
+        """
+        Rolling history of the last probes of a target. A lost probe is
+        stored as None
+        """
+        self.__probes = deque(maxlen=_HISTORY_SIZE)
+
+    def add(self, rtt):
+        self.__probes.append(rtt)
+        return
+
+    def stats(self) -> dict:
+        rtts = [rtt for rtt in self.__probes if rtt is not None]
+        probes = len(self.__probes)
+        stats = {"probes": probes,
+                 "loss": (probes - len(rtts)) * 100 / probes if probes else 0,
+                 "min": None, "avg": None, "jitter": None}
+        if rtts:
+            stats["min"] = min(rtts)
+            stats["avg"] = sum(rtts) / len(rtts)
+            # mean deviation between consecutive probes (RFC 3550 style)
+            stats["jitter"] = (sum(abs(rtts[i] - rtts[i - 1])
+                                   for i in range(1, len(rtts))) /
+                               (len(rtts) - 1) if len(rtts) > 1 else 0.0)
+        return stats
+
+
+class _PingEngine:
+    def __init__(self):
+        """
+        Probes targets without blocking the event loop. ICMP sockets are
+        used through icmplib if the system allows unprivileged ICMP,
+        the ping binary of the system otherwise. The histories of the
+        least recently probed targets are dropped beyond _MAX_TARGETS
+        """
+        self.__histories = OrderedDict()  # address: _PingHistory
+        self.__icmp_usable = True
+
+    async def __icmp_ping(self, address: str, timeout: float):
+        host = await async_ping(address, count=1, timeout=timeout,
+                                privileged=False)
+        return host.avg_rtt if host.is_alive else None
+
+    async def __binary_ping(self, address: str, timeout: float):
+        if not which("ping"):
+            raise FileNotFoundError("ping binary not found")
+        # no shell, the address is never parsed as an option (see _probe)
+        if platform.startswith("win"):
+            args = ["ping", "-n", "1", "-w", str(int(timeout * 1000))]
+        elif platform == "darwin" or "bsd" in platform:
+            # -W is in milliseconds there, -t limits the whole run in s
+            args = ["ping", "-c", "1", "-t", str(max(int(timeout), 1))]
+        else:
+            args = ["ping", "-c", "1", "-W", str(max(int(timeout), 1))]
+        process = await create_subprocess_exec(*args, address,
+                                               stdout=PIPE, stderr=DEVNULL)
+        try:
+            stdout, _ = await wait_for(process.communicate(), timeout + 1)
+        except Exception:
+            process.kill()
+            raise
+        found = search(r"time[=<]\s*([\d.]+)\s*ms",
+                       stdout.decode(errors="replace"))
+        return float(found.group(1)) if found else None
+
+    def __record(self, address: str, rtt):
+        history = self.__histories.get(address)
+        if history is None:
+            history = self.__histories[address] = _PingHistory()
+            while len(self.__histories) > _MAX_TARGETS:
+                self.__histories.popitem(last=False)
+        else:
+            self.__histories.move_to_end(address)
+        history.add(rtt)
+        return
+
+    async def _probe(self, address: str, timeout: float = 2):
+        """
+        Probe the address once and record the result in its history
+
+        Returns:
+            the round-trip time in ms or None if the probe got lost
+        """
+        if not address or address.startswith("-"):
+            raise ValueError(f"Invalid address '{address}'")
+        rtt = None
+        if self.__icmp_usable:
+            try:
+                rtt = await self.__icmp_ping(address, timeout)
+            except NameLookupError:
+                raise ValueError(f"Unable to resolve '{address}'")
+            except SocketPermissionError:
+                # unprivileged ICMP sockets not allowed, don't retry
+                log.info("Unprivileged ICMP not permitted, using the "
+                         "ping binary instead")
+                self.__icmp_usable = False
+            except Exception as e:
+                # this host only, ICMP stays in use for the others
+                log.warning(f"ICMP ping to {address} failed: {e}")
+                self.__record(address, None)
+                return None
+        if not self.__icmp_usable:
+            rtt = await self.__binary_ping(address, timeout)
+        self.__record(address, rtt)
+        return rtt
+
+    async def _probe_many(self, addresses: list, timeout: float = 2) -> dict:
+        async def probe(address):
+            try:
+                return await self._probe(address, timeout)
+            except Exception as e:
+                log.warning(f"Ping to {address} failed: {e}")
+            return None
+        results = await gather(*[probe(address) for address in addresses])
+        return dict(zip(addresses, results))
+
+    def _getStats(self, address: str) -> dict:
+        history = self.__histories.get(address)
+        return history.stats() if history else _PingHistory().stats()
+
+
+_engine = _PingEngine()
+
+
+async def async_pinger(address: str, timeout: float = 2) -> str:
+    """
+    Ping an IP or DNS server from given address without blocking
+
+    Args:
+        address (str): IP/DNS address e.g. "8.8.8.8"
+        timeout (float): seconds to wait for the reply
+
+    Example:
+        rtt = await async_pinger("8.8.8.8")
+
+    Returns:
+        Ping result as a string
+    """
+    try:
+        rtt = await _engine._probe(address, timeout)
+    except Exception as e:
+        log.warning(f"pinger: {e}")
+        rtt = None
+    return format_rtt(rtt)
+
+
+async def ping_hosts(addresses: list, timeout: float = 2) -> dict:
+    """
+    Ping several addresses concurrently, so all results are there after
+    about the slowest round trip
+
+    Args:
+        addresses (list): IP/DNS addresses
+        timeout (float): seconds to wait for the replies
+
+    Returns:
+        the round-trip time in ms (or None) of every address
+    """
+    return await _engine._probe_many(addresses, timeout)
+
+
+def getPingStats(address: str) -> dict:
+    """
+    Returns the statistics of the last probes of the address.
+    Scheme: {"probes": 0, "loss": "in percent", "min": "ms or None",
+             "avg": "ms or None", "jitter": "ms or None"}
+    """
+    return _engine._getStats(address)
+
+
+def format_rtt(rtt) -> str:
+    """
+    Format a round-trip time in ms as a string
+    """
+    return f"{round(rtt, 3)} ms" if rtt is not None else "-- ms"
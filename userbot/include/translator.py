@@ -0,0 +1,153 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from googletrans import Translator
+from asyncio import get_event_loop
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha1
+from logging import getLogger
+
+log = getLogger(__name__)
+_CACHE_SIZE = 512  # translations kept at most
+
+
+class _GoogleBackend:
+    def __init__(self):
+        """
+        Translates through googletrans. The client (and its connection
+        pool) is created once and reused for every translation
+        """
+        self.__translator = None
+
+    def translate(self, texts: list, src: str, dest: str) -> list:
+        """
+        Translate the texts, called in a worker thread
+
+        Returns:
+            a list of (translated text, detected source language) tuples
+        """
+        if self.__translator is None:
+            self.__translator = Translator()
+        results = self.__translator.translate(texts, dest=dest, src=src)
+        return [(result.text, result.src) for result in results]
+
+
+class _TranslatorService:
+    def __init__(self):
+        """
+        Translations run in a worker thread so the event loop isn't
+        blocked by the requests, results are kept in a bounded least
+        recently used cache keyed by (text hash, source, destination)
+        """
+        self.__backend = _GoogleBackend()
+        # one worker as the client of the backend isn't thread-safe
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="translator")
+        self.__cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _set_backend(self, backend):
+        self.__backend = backend
+        self.__cache.clear()
+        return
+
+    def __key(self, text: str, src: str, dest: str) -> tuple:
+        return (sha1(text.encode()).hexdigest(), src, dest)
+
+    async def _translate_many(self, texts: list, dest: str,
+                              src: str = "auto") -> list:
+        results = [None] * len(texts)
+        missing = {}  # text: indexes of the text
+        for index, text in enumerate(texts):
+            cached = self.__cache.get(self.__key(text, src, dest))
+            if cached is not None:
+                self.__cache.move_to_end(self.__key(text, src, dest))
+                results[index] = cached
+                self.hits += 1
+            else:
+                missing.setdefault(text, []).append(index)
+        if missing:
+            self.misses += len(missing)
+            todo = list(missing.keys())
+            # all missing texts in one call to the worker thread
+            translated = await get_event_loop().run_in_executor(
+                self.__executor, self.__backend.translate, todo, src, dest)
+            for text, result in zip(todo, translated):
+                for index in missing[text]:
+                    results[index] = result
+                self.__cache[self.__key(text, src, dest)] = result
+                while len(self.__cache) > _CACHE_SIZE:
+                    self.__cache.popitem(last=False)
+        return results
+
+    def _getStats(self) -> dict:
+        return {"size": len(self.__cache), "hits": self.hits,
+                "misses": self.misses}
+
+
+_service = _TranslatorService()
+
+
+async def translate(text: str, dest: str, src: str = "auto") -> tuple:
+    """
+    Translate a text without blocking the event loop
+
+    Args:
+        text (string): the text to translate
+        dest (string): language code to translate to e.g. "en"
+        src (string): language code of the text, detected by default
+
+    Example:
+        text, src_lang = await translate("Hallo Welt", "en")
+
+    Returns:
+        a tuple of the translated text and the (detected) language code
+        of the source text
+    """
+    return (await _service._translate_many([text], dest, src))[0]
+
+
+async def translate_many(texts: list, dest: str, src: str = "auto") -> list:
+    """
+    Translate several texts in one call to the backend. Cached texts
+    aren't requested again
+
+    Args:
+        texts (list): the texts to translate
+        dest (string): language code to translate to e.g. "en"
+        src (string): language code of the texts, detected by default
+
+    Returns:
+        a list of (translated text, source language code) tuples in
+        the order of texts
+    """
+    return await _service._translate_many(texts, dest, src)
+
+
+def set_translation_backend(backend):
+    """
+    Replace the translation backend e.g. by a local stub. The cache is
+    cleared
+
+    Args:
+        backend: object with a translate(texts, src, dest) method
+                 returning a (translated text, source language code)
+                 tuple for every text. Called in a worker thread
+    """
+    _service._set_backend(backend)
+    return
+
+
+def getTranslationCacheStats() -> dict:
+    """
+    Returns size, hits and misses of the translation cache.
+    Scheme: {"size": 0, "hits": 0, "misses": 0}
+    """
+    return _service._getStats()
@@ -8,6 +8,7 @@
 
 from userbot.include.aux_funcs import (event_log, fetch_user, format_chat_id,
                                        isRemoteCMD)
+from userbot.include.cas_api import fetch_users_data, isbanned, offenses
 from userbot.include.language_processor import (AdminText as msgRep,
                                                 ModuleDescriptions as descRep,
                                                 ModuleUsages as usageRep)
@@ -18,17 +19,64 @@ from userbot.sysutils.registration import (register_cmd_usage,
                                            register_module_info)
 from userbot.version import VERSION
 from telethon.errors import (UserAdminInvalidError, ChatAdminRequiredError,
-                             AdminsTooMuchError, AdminRankEmojiNotAllowedError)
+                             AdminsTooMuchError, AdminRankEmojiNotAllowedError,
+                             FloodWaitError)
 from telethon.tl.functions.channels import EditBannedRequest, EditAdminRequest
 from telethon.tl.types import (ChatAdminRights, ChatBannedRights,
                                ChannelParticipantsAdmins, User, Channel,
                                PeerUser, PeerChannel)
-from asyncio import sleep
+from asyncio import CancelledError, Queue, create_task, gather, sleep
 from logging import getLogger
+from time import monotonic
 
 log = getLogger(__name__)
 ehandler = EventHandler(log)
 LOGGING = getConfig("LOGGING")
+_SWEEP_WORKERS = 3  # kick requests in flight at most
+_SWEEP_PROGRESS_INTERVAL = 3  # seconds between two progress edits
+_CAS_SCAN_CHUNK = 500  # participants looked up in CAS per batch
+_CAS_SCAN_LIST_LIMIT = 50  # offenders listed at most
+_MESSAGE_LIMIT = 4096  # characters Telegram accepts per message
+# Telethon's markdown has no escape sequence, names must not contain
+# these characters to not break the formatting of the report
+_MARKDOWN_CHARS = str.maketrans({"[": "(", "]": ")", "*": None, "_": None,
+                                 "~": None, "`": None})
+
+
+class _AdaptiveThrottle:
+    def __init__(self, max_delay: float = 5.0):
+        """
+        Spaces out requests shared by several workers. The delay between
+        two requests grows with every FloodWaitError (based on the wait
+        time Telegram asked for) and shrinks again with every successful
+        request, so the throttle settles just below the flood limit
+        """
+        self.__delay = 0.0
+        self.__max_delay = max_delay
+        self.__next_slot = 0.0
+
+    async def wait(self):
+        now = monotonic()
+        slot = max(self.__next_slot, now)
+        self.__next_slot = slot + self.__delay
+        if slot > now:
+            await sleep(slot - now)
+        return
+
+    def success(self):
+        self.__delay *= 0.9
+        if self.__delay < 0.01:
+            self.__delay = 0.0
+        return
+
+    def flood_wait(self, seconds: int):
+        # pause everyone until the wait is over, then slow down
+        self.__next_slot = max(self.__next_slot, monotonic() + seconds)
+        self.__delay = min(max(self.__delay * 2, seconds / 10, 0.1),
+                           self.__max_delay)
+        log.info(f"Flood wait of {seconds} second(s), throttling kicks "
+                 f"to one per {self.__delay:.2f} second(s)")
+        return
 
 
 @ehandler.on(command="adminlist", hasArgs=True, outgoing=True)
@@ -554,26 +602,89 @@ async def unmute(event):
     return
 
 
-@ehandler.on(command="delaccs", outgoing=True)
+async def _sweep_deleted_accounts(event, chat, kick: bool) -> tuple:
+    """
+    Scans the participants of the chat and feeds the deleted accounts to
+    a pool of workers which kick them while the scan is still running.
+
+    Args:
+        event: the event of the command
+        chat: the chat to sweep
+        kick (bool): kick the deleted accounts else count them only
+
+    Returns:
+        a tuple of the amount of deleted and removed accounts
+    """
+    queue = Queue(maxsize=_SWEEP_WORKERS * 4)
+    throttle = _AdaptiveThrottle()
+    state = {"deleted": 0, "removed": 0, "last_edit": monotonic()}
+
+    async def report_progress():
+        if monotonic() - state["last_edit"] < _SWEEP_PROGRESS_INTERVAL:
+            return
+        state["last_edit"] = monotonic()
+        try:
+            await event.edit(
+                msgRep.DEL_ACCS_PROGRESS.format(state["removed"],
+                                                state["deleted"]))
+        except Exception:
+            pass  # progress is cosmetic only
+
+    async def kick_member(member_id: int):
+        while True:
+            await throttle.wait()
+            try:
+                await event.client.kick_participant(chat.id, member_id)
+                throttle.success()
+                state["removed"] += 1
+                return
+            except FloodWaitError as fwe:
+                throttle.flood_wait(fwe.seconds)
+            except Exception:
+                # e.g. deleted accounts which are still admin
+                return
+
+    async def worker():
+        while True:
+            member_id = await queue.get()
+            if member_id is None:
+                return
+            await kick_member(member_id)
+            await report_progress()
+
+    workers = ([create_task(worker()) for _ in range(_SWEEP_WORKERS)]
+               if kick else [])
+    try:
+        async for member in event.client.iter_participants(chat.id):
+            if member.deleted:
+                state["deleted"] += 1
+                if kick:
+                    await queue.put(member.id)
+        for _ in workers:
+            await queue.put(None)
+        await gather(*workers)
+    except (Exception, CancelledError):
+        for task in workers:
+            task.cancel()
+        await gather(*workers, return_exceptions=True)
+        raise
+    return (state["deleted"], state["removed"])
+
+
+@ehandler.on(command="delaccs", hasArgs=True, outgoing=True)
 async def delaccs(event):
     chat = await event.get_chat()
     if type(chat) is User:
         await event.edit(msgRep.NO_GROUP_CHAN)
         return
 
-    deleted_accounts, rem_del_accounts = (0,)*2
-    await event.edit(msgRep.TRY_DEL_ACCOUNTS)
-    async for member in event.client.iter_participants(chat.id):
-        if member.deleted:
-            deleted_accounts += 1
-            if chat.creator or (chat.admin_rights and
-                                chat.admin_rights.ban_users):
-                try:
-                    await event.client.kick_participant(chat.id, member.id)
-                    await sleep(0.2)
-                    rem_del_accounts += 1
-                except:
-                    pass
+    dry_run = event.pattern_match.group(1).lower() == "count"
+    can_kick = chat.creator or (chat.admin_rights and
+                                chat.admin_rights.ban_users)
+    await event.edit(msgRep.COUNT_DEL_ACCOUNTS if dry_run or not can_kick
+                     else msgRep.TRY_DEL_ACCOUNTS)
+    deleted_accounts, rem_del_accounts = await _sweep_deleted_accounts(
+        event, chat, kick=bool(can_kick and not dry_run))
 
     if deleted_accounts > 0 and not rem_del_accounts:
         await event.edit(msgRep.DEL_ACCS_COUNT.format(deleted_accounts))
@@ -597,8 +708,130 @@ async def delaccs(event):
     return
 
 
+async def _cas_scan(event, chat) -> tuple:
+    """
+    Looks up the participants of the chat in CAS. The participants are
+    looked up in chunks with bounded concurrency while the next chunk is
+    still being fetched from Telegram.
+
+    Args:
+        event: the event of the command
+        chat: the chat to scan
+
+    Returns:
+        a tuple of the amount of scanned members, a list of the banned
+        members as (member, userdata) tuples and the amount of members
+        which couldn't be looked up
+    """
+    queue = Queue(maxsize=2)
+    offenders = []
+    state = {"scanned": 0, "failed": 0, "last_edit": monotonic()}
+
+    async def report_progress():
+        if monotonic() - state["last_edit"] < _SWEEP_PROGRESS_INTERVAL:
+            return
+        state["last_edit"] = monotonic()
+        try:
+            await event.edit(
+                msgRep.CAS_SCAN_PROGRESS.format(state["scanned"],
+                                                len(offenders)))
+        except Exception:
+            pass  # progress is cosmetic only
+
+    async def checker():
+        while True:
+            members = await queue.get()
+            if members is None:
+                return
+            try:
+                verdicts = await fetch_users_data(
+                    [member.id for member in members])
+            except Exception as e:
+                # keep draining the queue, the scan must not get stuck
+                log.warning(f"CAS lookup failed: {e}")
+                verdicts = {}
+            for member in members:
+                userdata = verdicts.get(member.id)
+                if userdata is None:
+                    state["failed"] += 1
+                elif isbanned(userdata):
+                    offenders.append((member, userdata))
+            state["scanned"] += len(members)
+            await report_progress()
+
+    task = create_task(checker())
+    try:
+        members = []
+        async for member in event.client.iter_participants(chat.id):
+            members.append(member)
+            if len(members) >= _CAS_SCAN_CHUNK:
+                await queue.put(members)
+                members = []
+        if members:
+            await queue.put(members)
+        await queue.put(None)
+        await task
+    except (Exception, CancelledError):
+        task.cancel()
+        await gather(task, return_exceptions=True)
+        raise
+    return (state["scanned"], offenders, state["failed"])
+
+
+@ehandler.on(command="casscan", outgoing=True)
+async def casscan(event):
+    chat = await event.get_chat()
+    if type(chat) is User:
+        await event.edit(msgRep.NO_GROUP_CHAN)
+        return
+
+    await event.edit(msgRep.CAS_SCAN_START)
+    try:
+        scanned, offenders, failed = await _cas_scan(event, chat)
+    except ChatAdminRequiredError:
+        await event.edit(msgRep.NO_ADMIN)
+        return
+    except Exception as e:
+        log.warning(e)
+        await event.edit(msgRep.CAS_SCAN_FAILED)
+        return
+
+    footer = ""
+    if failed:
+        footer = "\n" + msgRep.CAS_SCAN_LOOKUPS_FAILED.format(failed)
+    if offenders:
+        text = msgRep.CAS_SCAN_RESULT.format(len(offenders), scanned)
+        text += "\n\n"
+        # leave room for the "more" line and the footer
+        limit = (_MESSAGE_LIMIT - len(footer) -
+                 len(msgRep.CAS_SCAN_MORE.format(len(offenders))) - 1)
+        listed = 0
+        for member, userdata in offenders[:_CAS_SCAN_LIST_LIMIT]:
+            if member.deleted:
+                name = msgRep.DELETED_ACCOUNT
+            elif member.username:
+                name = f"@{member.username}"
+            else:
+                name = (member.first_name or "").translate(_MARKDOWN_CHARS)
+                name = f"[{name or member.id}](tg://user?id={member.id})"
+            line = (f"{listed + 1}. {name} (`{member.id}`): "
+                    f"{msgRep.CAS_OFFENSES.format(offenses(userdata))}\n")
+            if len(text) + len(line) > limit:
+                break
+            text += line
+            listed += 1
+        if len(offenders) > listed:
+            text += msgRep.CAS_SCAN_MORE.format(
+                len(offenders) - listed) + "\n"
+    else:
+        text = msgRep.CAS_SCAN_CLEAN.format(scanned) + "\n"
+    text += footer
+    await event.edit(text.strip())
+    return
+
+
 for cmd in ("adminlist", "ban", "unban", "kick",
-            "promote", "demote", "mute", "unmute", "delaccs"):
+            "promote", "demote", "mute", "unmute", "delaccs", "casscan"):
     register_cmd_usage(cmd,
                        usageRep.ADMIN_USAGE.get(cmd, {}).get("args"),
                        usageRep.ADMIN_USAGE.get(cmd, {}).get("usage"))
@@ -6,7 +6,7 @@
 # You may not use this file or any of the content within it, unless in
 # compliance with the PE License
 
-from userbot.include.aux_funcs import format_chat_id
+from userbot.include.aux_funcs import fan_out, format_chat_id
 from userbot.include.language_processor import (ChatInfoText as msgRep,
                                                 ModuleDescriptions as descRep,
                                                 ModuleUsages as usageRep)
@@ -25,7 +25,7 @@ from telethon.tl.types import (ChannelParticipantCreator,
                                ChatParticipantCreator,
                                MessageActionChannelMigrateFrom,
                                ChannelParticipantsAdmins, Chat, Channel,
-                               PeerChannel)
+                               ChannelFull, PeerChannel, PeerChat)
 from datetime import datetime
 from logging import getLogger
 
@@ -76,29 +76,67 @@ async def get_chatinfo(event):
     return None
 
 
+async def fetch_admins(event, chat_id: int, is_channel_obj: bool):
+    owner_id, owner_username = (None,)*2
+    admins = 0
+    try:
+        async for admin in (
+            event.client.iter_participants(entity=chat_id,
+                                           filter=(ChannelParticipantsAdmins()
+                                                   if is_channel_obj else
+                                                   None))):
+            if isinstance(admin.participant, (ChannelParticipantCreator,
+                                              ChatParticipantCreator)):
+                owner_id = admin.id
+                owner_username = ("@" + admin.username
+                                  if admin.username else None)
+                if not is_channel_obj:
+                    break
+            if is_channel_obj:
+                admins += 1
+    except (ChatAdminRequiredError, ChannelPrivateError):
+        # admins are hidden to non-admins, that's not a failure
+        return None
+    return (owner_id, owner_username, admins)
+
+
 async def fetch_info(chat, event):
-    chat_obj_info = await event.client.get_entity(chat.full_chat.id)
+    chat_id = chat.full_chat.id
+    is_channel_obj = isinstance(chat.full_chat, ChannelFull)
+    # the chat object is part of the full chat result usually
+    chat_obj_info = next((c for c in chat.chats if c.id == chat_id), None)
+    # chat object, first message and admins don't depend on each other
+    calls = {"history": event.client(
+                GetHistoryRequest(peer=(PeerChannel(chat_id)
+                                        if is_channel_obj else
+                                        PeerChat(chat_id)),
+                                  offset_id=0,
+                                  offset_date=datetime(2010, 1, 1),
+                                  add_offset=-1,
+                                  limit=1,
+                                  max_id=0,
+                                  min_id=0,
+                                  hash=0)),
+             "admins": fetch_admins(event, chat_id, is_channel_obj)}
+    if not chat_obj_info:
+        calls["chat"] = event.client.get_entity(chat_id)
+    results, failed = await fan_out(calls)
+    if not chat_obj_info:
+        chat_obj_info = results["chat"]
+        if not chat_obj_info:
+            raise Exception(f"Unable to get chat object of {chat_id}")
     broadcast = (chat_obj_info.broadcast
                  if hasattr(chat_obj_info, "broadcast") else False)
     chat_type = msgRep.CHANNEL if broadcast else msgRep.GROUP
     chat_title = chat_obj_info.title
     warn_emoji = u"\u26A0"
-    try:
-        msg_info = await event.client(
-            GetHistoryRequest(peer=chat_obj_info.id,
-                              offset_id=0,
-                              offset_date=datetime(2010, 1, 1),
-                              add_offset=-1,
-                              limit=1,
-                              max_id=0,
-                              min_id=0,
-                              hash=0))
-    except:
-        msg_info = None
+    msg_info = results["history"]
     first_msg_valid = (True if msg_info and msg_info.messages and
                        msg_info.messages[0].id == 1 else False)
-    owner_id, owner_firstname, owner_username = (None,)*3
-    admins = 0
+    owner_id, owner_username, admins = (results["admins"]
+                                        if results["admins"] else
+                                        (None, None, 0))
+    owner_firstname = None
     created = msg_info.messages[0].date if first_msg_valid else None
     former_title = (msg_info.messages[0].action.title
                     if first_msg_valid and type(msg_info.messages[0].action) is
@@ -171,25 +209,6 @@ async def fetch_info(chat, event):
                 break
     # End of spaghetti block
 
-    try:
-        is_channel_obj = True if isinstance(chat_obj_info, Channel) else False
-        async for admin in (
-            event.client.iter_participants(entity=chat.full_chat.id,
-                                           filter=(ChannelParticipantsAdmins()
-                                                   if is_channel_obj else
-                                                   None))):
-            if isinstance(admin.participant, (ChannelParticipantCreator,
-                                              ChatParticipantCreator)):
-                owner_id = admin.id
-                owner_username = ("@" + admin.username
-                                  if admin.username else None)
-                if not is_channel_obj:
-                    break
-            if is_channel_obj:
-                admins += 1
-    except:
-        pass
-
     caption = msgRep.CHATINFO
     caption += msgRep.CHAT_ID.format(format_chat_id(chat_obj_info))
     caption += msgRep.CHAT_TYPE.format(chat_type, chat_type_priv_or_public)
@@ -279,6 +298,8 @@ async def fetch_info(chat, event):
         caption += msgRep.VERFIED.format(verified)
     if description:
         caption += msgRep.DESCRIPTION.format(description)
+    if failed:
+        caption += "\n" + msgRep.PARTIAL_INFO
 
     return caption
 
@@ -16,13 +16,19 @@ from userbot.sysutils.registration import (register_cmd_usage,
                                            register_module_desc,
                                            register_module_info)
 from userbot.version import VERSION
+from telethon.errors import FloodWaitError
 from telethon.tl.types import Chat, Channel, User
-from asyncio import sleep
+from asyncio import CancelledError, Queue, create_task, gather, sleep
 from logging import getLogger
+from time import monotonic
 
 log = getLogger(__name__)
 ehandler = EventHandler(log)
 LOGGING = getConfig("LOGGING")
+# Telegram allows to delete up to 100 messages at once
+_PURGE_BATCH_SIZE = 100
+_PURGE_WORKERS = 3  # delete requests in flight at most
+_PURGE_PROGRESS_INTERVAL = 3  # seconds between two progress edits
 
 
 async def del_msgs(event, chat_id, messages: list) -> int:
@@ -33,11 +39,121 @@ async def del_msgs(event, chat_id, messages: list) -> int:
             entity=chat_id, message_ids=messages)
         for am in affected_msgs:
             msgs_count += am.pts_count
+    except FloodWaitError:
+        raise  # let the caller decide how to wait
     except Exception as e:
         raise Exception(e)
     return msgs_count
 
 
+async def _iter_id_batches(event, chat_id):
+    """
+    Yields the IDs of the messages between the replied message and the
+    purge message in batches while still iterating the chat history.
+    For normal groups and PMs
+    """
+    batch = []
+    async for message in event.client.iter_messages(
+            entity=chat_id, min_id=event.reply_to_msg_id):
+        if not message.id == event.message.id:
+            batch.append(message.id)
+        if len(batch) >= _PURGE_BATCH_SIZE:
+            yield batch
+            batch = []
+    batch.append(event.reply_to_msg_id)
+    yield batch
+
+
+async def _range_id_batches(min_id: int, max_id: int):
+    """
+    Yields the IDs between min_id (included) and max_id (excluded) in
+    batches, newest first.
+
+    Instead of using iter_messages we just create a range of IDs between
+    the replied msg' ID and this event's ID (e.g. 24 (replied msg) to 48
+    (.'purge' msg)) regardless if there are gaps (due to deletions)
+    between the min and max ID. This method works for channels and super
+    groups only as channel objects have their own message IDs. Using this
+    method in PMs or normal groups may accidentally cause deletions in
+    different PM conversations or normal chats
+    """
+    for upper in range(max_id, min_id, -_PURGE_BATCH_SIZE):
+        yield list(range(upper - 1, max(upper - _PURGE_BATCH_SIZE,
+                                        min_id) - 1, -1))
+
+
+async def _purge_pipeline(event, chat_id, id_batches) -> int:
+    """
+    Deletes the batches of message IDs with up to _PURGE_WORKERS
+    requests in flight while the batches are still being produced.
+    All workers pause if Telegram asks to wait (FloodWaitError) and
+    the progress is edited into the purge message from time to time
+
+    Returns:
+        the amount of deleted messages
+    """
+    queue = Queue(maxsize=_PURGE_WORKERS * 2)
+    state = {"count": 0, "error": None, "resume_at": 0,
+             "last_edit": monotonic()}
+
+    async def report_progress():
+        if monotonic() - state["last_edit"] < _PURGE_PROGRESS_INTERVAL:
+            return
+        state["last_edit"] = monotonic()
+        try:
+            await event.edit(msgRep.PURGE_PROGRESS.format(state["count"]))
+        except Exception:
+            pass  # progress is cosmetic only
+
+    async def delete_batch(batch: list):
+        while True:
+            wait = state["resume_at"] - monotonic()
+            if wait > 0:
+                await sleep(wait)
+            try:
+                deleted = await del_msgs(event, chat_id=chat_id,
+                                         messages=batch)
+                # add after awaiting, other workers update it meanwhile
+                state["count"] += deleted
+                return
+            except FloodWaitError as fwe:
+                log.info(f"Purge paused for {fwe.seconds} second(s) due to "
+                         "flood wait")
+                state["resume_at"] = max(state["resume_at"],
+                                         monotonic() + fwe.seconds)
+
+    async def worker():
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                return
+            if state["error"]:
+                continue  # drain the queue so the producer can't block
+            try:
+                await delete_batch(batch)
+                await report_progress()
+            except Exception as e:
+                state["error"] = e
+
+    workers = [create_task(worker()) for _ in range(_PURGE_WORKERS)]
+    try:
+        async for batch in id_batches:
+            if state["error"]:
+                break
+            await queue.put(batch)
+        for _ in workers:
+            await queue.put(None)
+        await gather(*workers)
+    except (Exception, CancelledError):
+        for task in workers:
+            task.cancel()
+        await gather(*workers, return_exceptions=True)
+        raise
+    if state["error"]:
+        raise state["error"]
+    return state["count"]
+
+
 @ehandler.on(command="del", outgoing=True)
 async def delete(event):
     if event.reply_to_msg_id:
@@ -76,42 +192,16 @@ async def purge(event):
                 await event.edit(msgRep.NO_DEL_PRIV)
                 return
 
-        message_ids = []
         if chat_obj or isinstance(chat, User):
             # For normal groups and PMs
-            async for message in (
-                event.client.iter_messages(entity=chat.id,
-                                           min_id=event.reply_to_msg_id)):
-                if not message.id == event.message.id:
-                    message_ids.append(message.id)
-            message_ids.append(event.reply_to_msg_id)
+            id_batches = _iter_id_batches(event, chat.id)
         else:
             # For channel objects (Channels and Super groups)
-            # Instead of using iter_messages we just create a range of IDs
-            # between the replied msg' ID and this event's ID (e.g. 24
-            # (replied msg) to 48 (.'purge' msg)) regardless if there are
-            # gaps (due to deletions) between the min and max ID. This method
-            # works for channels and super groups only as channel objects have
-            # their own message IDs. Using this method in PMs or normal
-            # groups may accidentally cause deletions in different
-            # PM conversations or normal chats
-            for i in range(event.reply_to_msg_id, event.message.id):
-                if not i == event.message.id:
-                    message_ids.append(i)
-            message_ids.reverse()
-
-        nested_msgs = []
-
-        # As Telegram only allows to delete up to 100 messages at once,
-        # nest every 100th ID into a new list
-        for i in range(0, len(message_ids), 100):
-            nested_msgs.append(message_ids[i:i+100])
-
-        msgs_count = 0
+            id_batches = _range_id_batches(event.reply_to_msg_id,
+                                           event.message.id)
+
         try:
-            for msgs_list in nested_msgs:
-                msgs_count += await del_msgs(event, chat_id=chat.id,
-                                             messages=msgs_list)
+            msgs_count = await _purge_pipeline(event, chat.id, id_batches)
         except Exception as e:
             log.warning(e)
             await event.edit(msgRep.PURGE_MSG_FAILED)
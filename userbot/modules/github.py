@@ -19,16 +19,20 @@ import userbot.include.git_api as api
 ehandler = EventHandler()
 
 
-def getData(url, index):
-    if not api.getData(url):
+async def getData(url, index):
+    # releases are requested page-wise, only the page of index is fetched
+    page, offset = divmod(index, api.RELEASES_PER_PAGE)
+    releases = await api.fetchReleases(url, page + 1)
+    if releases is None:
         return msgRep.INVALID_URL
-    recentRelease = api.getReleaseData(api.getData(url), index)
+    recentRelease = api.getReleaseData(releases, offset)
     if recentRelease is None:
         return msgRep.NO_RELEASE
     author = api.getAuthor(recentRelease)
     authorUrl = api.getAuthorUrl(recentRelease)
     assets = api.getAssets(recentRelease)
-    releaseName = api.getReleaseName(recentRelease)
+    releaseName = (api.getReleaseName(recentRelease) or
+                   api.getReleaseTag(recentRelease))
     message = msgRep.AUTHOR_STR.format(authorUrl, author)
     message += msgRep.RELEASE_NAME + releaseName + "\n\n"
     for asset in assets:
@@ -48,12 +52,20 @@ def getData(url, index):
 @ehandler.on(command="git", hasArgs=True, outgoing=True)
 async def get_release(event):
     commandArgs = event.text.split(" ")
-    if len(commandArgs) != 2 or "/" not in commandArgs[1]:
+    if len(commandArgs) not in (2, 3) or "/" not in commandArgs[1]:
         await event.edit(msgRep.INVALID_ARGS)
         return
-    index = 0  # later will support going back in time!
+    index = 0  # latest release
+    if len(commandArgs) == 3:
+        try:
+            index = int(commandArgs[2]) - 1
+            if index < 0:
+                raise ValueError
+        except ValueError:
+            await event.edit(msgRep.INVALID_ARGS)
+            return
     url = commandArgs[1]
-    text = getData(url, index)
+    text = await getData(url, index)
     await event.edit(text, parse_mode="html")
     return
 
@@ -14,8 +14,9 @@ from userbot.sysutils.configuration import getConfig
 from userbot.sysutils.event_handler import EventHandler
 from userbot.sysutils.registration import (getAllModules, getLoadModules,
                                            getUserModules, getModuleDesc,
-                                           getModuleInfo, getRegisteredCMDs,
-                                           register_cmd_usage)
+                                           getModuleInfo, getRegisteredCMD,
+                                           getRegisteredCMDs,
+                                           register_cmd_usage, suggestCMDs)
 from userbot.sysutils.sys_funcs import isMacOS, isWindows
 from logging import getLogger
 from os.path import basename, exists, getctime, getsize, join
@@ -34,15 +35,7 @@ async def list_commands(event):
     command = None
     cmds_dict = getRegisteredCMDs()
     if arg_from_event:
-        command, command_value = (None,)*2
-        for key, value in cmds_dict.items():
-            alt_cmd = value.get("alt_cmd")
-            if key == arg_from_event.lower():
-                command, command_value = key, value
-                break
-            elif alt_cmd and alt_cmd == arg_from_event.lower():
-                command, command_value = key, value
-                break
+        command, command_value = getRegisteredCMD(arg_from_event.lower())
 
         if command_value:
             cmd_alt = command_value.get("alt_cmd")
@@ -78,6 +71,11 @@ async def list_commands(event):
     all_cmds = f"**{msgRep.LISTCMDS_TITLE} ({cmds_amount})**\n\n"
     if cmd_not_found:
         all_cmds += msgRep.CMD_NOT_FOUND.format(arg_from_event) + "\n"
+        suggestions = suggestCMDs(arg_from_event.lower())
+        if suggestions:
+            all_cmds += msgRep.CMD_SUGGESTIONS.format(
+                ", ".join(f"`{cmds_dict[cmd].get('prefix')}{cmd}`"
+                          for cmd in suggestions)) + "\n"
     all_cmds += msgRep.LISTCMDS_USAGE.format("`.listcmds`/`.help`") + "\n\n"
     for cmd, value in cmds_dict.items():
         alt_cmd = value.get("alt_cmd")
@@ -6,6 +6,10 @@
 # You may not use this file or any of the content within it, unless in
 # compliance with the PE License
 
+from userbot.include.currency_rates import (HISTORY_FILE, downloadHistory,
+                                            getRateTable)
+from userbot.include.translator import translate as translate_text
+from userbot.include.translator import translate_many
 from userbot.include.language_processor import (getBotLangCode,
                                                 ScrappersText as msgRep,
                                                 ModuleDescriptions as descRep,
@@ -19,25 +23,25 @@ from userbot.version import VERSION
 from telethon.errors import ChatSendMediaForbiddenError, MessageTooLongError
 from telethon.tl.types import (Document, DocumentAttributeAudio,
                                DocumentAttributeFilename)
-from datetime import datetime
-from currency_converter import CurrencyConverter
-from googletrans import Translator, LANGUAGES
+from asyncio import get_event_loop, shield
+from googletrans import LANGUAGES
 from gtts import gTTS
 from gtts.tts import gTTSError
+from hashlib import sha1
+from html import escape
 from logging import getLogger
 from pydub import AudioSegment
-from os import remove, rename
-from os.path import exists, getmtime, join
+from os import listdir, makedirs, remove, replace, stat, utime
+from os.path import exists, join
 from speech_recognition import (AudioFile, Recognizer, UnknownValueError,
                                 RequestError)
-from urllib.request import urlretrieve
-from zipfile import BadZipFile, ZipFile
 
 log = getLogger(__name__)
 ehandler = EventHandler(log)
 TEMP_DL_DIR = getConfig("TEMP_DL_DIR")
-CC_CSV_PATH = join(TEMP_DL_DIR, "currency.csv")
+CC_CSV_PATH = join(TEMP_DL_DIR, HISTORY_FILE)
 DEST_LANG = getBotLangCode()
+TRT_BATCH_LIMIT = 20  # messages translated by .trt batch at most
 
 
 def build_supported_langs():
@@ -71,6 +75,11 @@ async def set_lang(event):
 
 @ehandler.on(command="trt", hasArgs=True, outgoing=True)
 async def translate(event):
+    args = event.pattern_match.group(1).split()
+    if len(args) == 2 and args[0].lower() == "batch":
+        await translate_batch(event, args[1])
+        return
+
     if event.reply_to_msg_id:
         msg = await event.get_reply_message()
         msg = msg.message
@@ -84,13 +93,12 @@ async def translate(event):
     await event.edit(msgRep.TRANSLATING)
 
     try:
-        translator = Translator()
-        result = translator.translate(text=msg, dest=DEST_LANG, src="auto")
-        if result.src == result.dest:
+        translated, src = await translate_text(msg, dest=DEST_LANG)
+        if src == DEST_LANG:
             await event.edit(msgRep.SAME_SRC_TARGET_LANG)
             return
-        src_lang = LANGUAGES.get(result.src, "Unknown")
-        target_lang = LANGUAGES.get(result.dest, "Unknown")
+        src_lang = LANGUAGES.get(src, "Unknown")
+        target_lang = LANGUAGES.get(DEST_LANG, "Unknown")
 
         text = f"{msgRep.DETECTED_LANG}: <b>{src_lang.title()}</b>\n"
         text += f"{msgRep.TARGET_LANG}: <b>{target_lang.title()}</b>\n\n"
@@ -98,7 +106,7 @@ async def translate(event):
             text += f"<b>{msgRep.ORG_TEXT}:</b>\n"
             text += msg + "\n\n"
         text += f"<b>{msgRep.TRANS_TEXT}:</b>\n"
-        text += result.text
+        text += translated
         await event.edit(text, parse_mode="html")
     except MessageTooLongError:
         await event.edit(msgRep.MSG_TOO_LONG)
@@ -111,6 +119,138 @@ async def translate(event):
     return
 
 
+async def translate_batch(event, amount: str):
+    """
+    Translates the replied message and the messages after it or the
+    latest messages before the command if not replied
+    """
+    try:
+        amount = int(amount)
+        if amount < 1 or amount > TRT_BATCH_LIMIT:
+            raise ValueError
+    except ValueError:
+        await event.edit(msgRep.TRT_BATCH_INVALID.format(TRT_BATCH_LIMIT))
+        return
+
+    await event.edit(msgRep.TRANSLATING)
+    try:
+        if event.reply_to_msg_id:
+            messages = await event.client.get_messages(
+                event.chat_id, limit=amount,
+                min_id=event.reply_to_msg_id - 1, max_id=event.message.id,
+                reverse=True)
+        else:
+            messages = await event.client.get_messages(
+                event.chat_id, limit=amount, max_id=event.message.id)
+            messages = list(reversed(messages))
+        messages = [message for message in messages if message.message]
+        if not messages:
+            await event.edit(msgRep.NO_TEXT_OR_MSG)
+            return
+        # one call to the translator's worker thread, googletrans still
+        # requests the texts one by one. Cached texts are skipped
+        results = await translate_many([message.message
+                                        for message in messages],
+                                       dest=DEST_LANG)
+        target_lang = LANGUAGES.get(DEST_LANG, "Unknown")
+        text = f"{msgRep.TARGET_LANG}: <b>{target_lang.title()}</b>\n\n"
+        for message, (translated, src) in zip(messages, results):
+            src_lang = LANGUAGES.get(src, "Unknown")
+            sender = (getattr(message.sender, "first_name", None) or
+                      getattr(message.sender, "title", None) or
+                      msgRep.UNKNOWN_SENDER)
+            text += (f"<b>{escape(sender)}</b> "
+                     f"<i>({src_lang.title()})</i>:\n"
+                     f"{escape(translated)}\n\n")
+        await event.edit(text.strip(), parse_mode="html")
+    except MessageTooLongError:
+        await event.edit(msgRep.MSG_TOO_LONG)
+    except Exception as e:
+        log.warning(e)
+        await event.edit(msgRep.FAIL_TRANS_MSG)
+    return
+
+
+class _TTSCache:
+    def __init__(self):
+        """
+        Synthesizes speech in a worker thread. Audio files are named by
+        the hash of (language, text) so concurrent requests never share
+        an output file, identical requests in flight share one synthesis
+        and the files are kept as a least recently used cache of at most
+        TTS_CACHE_SIZE bytes
+        """
+        self.__cache_dir = join(TEMP_DL_DIR, "tts_cache")
+        self.__pending = {}  # hash: synthesis future
+
+    def __save(self, text: str, lang: str, file_loc: str):
+        # worker thread
+        makedirs(self.__cache_dir, exist_ok=True)
+        temp_loc = file_loc + ".part"
+        try:
+            gTTS(text=text, lang=lang).save(temp_loc)
+            replace(temp_loc, file_loc)  # never serve a half written file
+        except BaseException:
+            try:
+                remove(temp_loc)
+            except OSError:
+                pass  # not created yet
+            raise
+        self.__evict(keep=file_loc)
+        return
+
+    def __evict(self, keep: str):
+        max_size = getConfig("TTS_CACHE_SIZE", 10485760)
+        files = []
+        for name in listdir(self.__cache_dir):
+            if name.endswith(".mp3"):
+                file_loc = join(self.__cache_dir, name)
+                try:
+                    info = stat(file_loc)
+                except OSError:
+                    continue
+                files.append((info.st_mtime, info.st_size, file_loc))
+        total = sum(size for _, size, _ in files)
+        for _, size, file_loc in sorted(files):  # oldest first
+            if total <= max_size:
+                break
+            if file_loc == keep:
+                continue
+            try:
+                remove(file_loc)
+                total -= size
+            except OSError:
+                pass
+        return
+
+    async def _synthesize(self, text: str, lang: str) -> str:
+        """
+        Returns:
+            the location of the audio file of the text
+        """
+        key = sha1(f"{lang}\0{text}".encode()).hexdigest()
+        file_loc = join(self.__cache_dir, f"{key}.mp3")
+        if key not in self.__pending and exists(file_loc):
+            try:
+                utime(file_loc)  # mark as recently used
+                return file_loc
+            except OSError:
+                pass  # evicted meanwhile
+        synthesis = self.__pending.get(key)
+        if synthesis is None:
+            synthesis = get_event_loop().run_in_executor(
+                None, self.__save, text, lang, file_loc)
+            self.__pending[key] = synthesis
+            synthesis.add_done_callback(
+                lambda _: self.__pending.pop(key, None))
+        # shielded, so a cancelled waiter can't cancel the others
+        await shield(synthesis)
+        return file_loc
+
+
+_tts_cache = _TTSCache()
+
+
 @ehandler.on(command="tts", hasArgs=True, outgoing=True)
 async def text_to_speech(event):
     if event.reply_to_msg_id:
@@ -119,15 +259,16 @@ async def text_to_speech(event):
     else:
         msg = event.pattern_match.group(1)
 
+    if not msg:
+        await event.edit(msgRep.NO_TEXT_TTS)
+        return
+
     chat = await event.get_chat()
 
     try:
-        tts = gTTS(text=msg, lang=DEST_LANG)
-        file_loc = join(TEMP_DL_DIR, "tts.mp3")
-        tts.save(file_loc)
+        file_loc = await _tts_cache._synthesize(msg, DEST_LANG)
         await event.client.send_file(chat.id, file=file_loc, voice_note=True)
         await event.delete()
-        remove(file_loc)
     except ChatSendMediaForbiddenError:
         await event.edit(msgRep.MEDIA_FORBIDDEN)
     except AssertionError as ae:
@@ -147,46 +288,14 @@ async def text_to_speech(event):
         await event.edit(msgRep.FAIL_TTS)
     return
 
-def update_currency_data():
-    if exists(CC_CSV_PATH):
-        file_date = datetime.fromtimestamp(getmtime(CC_CSV_PATH))
-        duration = datetime.today() - file_date
-        if not duration.days >= 1:  # don't update if file is not a day old
-            return
-
-    try:
-        zipfile = join(TEMP_DL_DIR, "currency.zip")
-        # get latest data from the European Central Bank
-        data_history = urlretrieve(
-            "http://www.ecb.int/stats/eurofxref/eurofxref-hist.zip", zipfile)
-    except Exception as e:
-        log.warning(f"Unable to download updated data history: {e}")
-        return
 
-    try:
-        csv_filename = None
-        with ZipFile(zipfile, "r") as zipObject:
-            contents = zipObject.namelist()
-            for filename in contents:
-                if filename.endswith(".csv"):
-                    csv_filename = filename
-                    zipObject.extract(filename, TEMP_DL_DIR)
-                    break
-            zipObject.close()
-        try:
-            rename(join(TEMP_DL_DIR, filename), CC_CSV_PATH)
-            log.info("[CURRENCY] data history successfully updated")
-        except Exception as e:
-            log.warning(f"Unable to rename csv file: {e}")
-    except BadZipFile as bze:
-        log.warning(f"Bad zip archive: {bze}")
-    except Exception as e:
-        log.warning(f"Failed to extract data history: {e}")
-
-    try:
-        remove(zipfile)
-    except Exception as e:
-        log.warning(f"Couldn't remove zip file: {e}")
+def update_currency_data():
+    """
+    Download the latest data history from the European Central Bank.
+    Blocking, the history is refreshed in the background anyway (see
+    currency_rates.startCurrencyRefresher)
+    """
+    downloadHistory(CC_CSV_PATH)
     return
 
 
@@ -212,27 +321,21 @@ async def cc(event):
     c_to_iso = c_to_iso.upper()
 
     try:
-        try:
-            update_currency_data()
-            c = CurrencyConverter(currency_file=CC_CSV_PATH)
-        except Exception as e:
-            log.warning(f"Unable to read updated data history: {e}. "
-                        "Falling back to default currency data.")
-            c = CurrencyConverter()
-        if c_from_iso not in c.currencies:
+        rates = await getRateTable(CC_CSV_PATH)
+        if c_from_iso not in rates.currencies:
             await event.edit(msgRep.CC_ISO_UNSUPPORTED.format(c_from_iso))
             return
-        if c_to_iso not in c.currencies:
+        if c_to_iso not in rates.currencies:
             await event.edit(msgRep.CC_ISO_UNSUPPORTED.format(c_to_iso))
             return
-        date = c.bounds[c_from_iso]
-        result = "{:.2f}".format(c.convert(amount=amount,
-                                           currency=c_from_iso,
-                                           new_currency=c_to_iso))
+        last_date = rates.last_date(c_from_iso)
+        result = "{:.2f}".format(rates.convert(amount=amount,
+                                               currency=c_from_iso,
+                                               new_currency=c_to_iso))
         strings = f"**{msgRep.CC_HEADER}**\n\n"
         strings += msgRep.CFROM_CTO.format(c_from_iso, c_to_iso) + "\n"
         strings += f"{amount} {c_from_iso} = {result} {c_to_iso}\n\n"
-        strings += f"__{msgRep.CC_LAST_UPDATE}: {date.last_date}__"
+        strings += f"__{msgRep.CC_LAST_UPDATE}: {last_date}__"
         await event.edit(strings)
     except ValueError as ve:
         await event.edit(f"`{msgRep.INVALID_INPUT}: {ve}`")
@@ -6,15 +6,24 @@
 # You may not use this file or any of the content within it, unless in
 # compliance with the PE License
 
-from userbot import PROJECT, SAFEMODE
-from userbot.include.aux_funcs import (event_log, sizeStrMaker, pinger,
+from userbot import LOGFILE, PROJECT, SAFEMODE
+from userbot.include.aux_funcs import (event_log, sizeStrMaker,
                                        getGitReview)
+from userbot.include.currency_rates import getRateTableStats
+from userbot.include.entity_cache import getEntityCacheStats
+from userbot.include.log_search import (compressLog, grepLog, parseLevel,
+                                        parseSince, tailLog)
+from userbot.include.ping_engine import async_pinger
+from userbot.include.translator import getTranslationCacheStats
 from userbot.include.language_processor import (SystemToolsText as msgRep,
                                                 ModuleDescriptions as descRep,
                                                 ModuleUsages as usageRep,
                                                 getBotLangCode, getBotLang)
+from userbot.sysutils.boot_profiler import getBootProfiles
 from userbot.sysutils.configuration import getConfig, setConfig
 from userbot.sysutils.event_handler import EventHandler
+from userbot.sysutils.metrics import (dump_metrics, getCommandMetrics,
+                                      getJobMetrics, reset_metrics)
 from userbot.sysutils.registration import (register_cmd_usage,
                                            register_module_desc,
                                            register_module_info)
@@ -29,12 +38,19 @@ from subprocess import check_output
 from logging import getLogger
 from os.path import getsize, isfile, join
 from shutil import disk_usage
+from html import escape
+from io import BytesIO
+from re import error as RegexError
 import time
 from os import listdir
 
 log = getLogger(__name__)
 ehandler = EventHandler(log)
 STARTTIME = datetime.now()
+_LOG_TEXT_LIMIT = 3800  # log text shown in the message at most
+_MESSAGE_LIMIT = 4096  # characters of a Telegram message at most
+_PERF_TOP = 15  # commands listed by .perf at most, slowest in total first
+_TAIL_DEFAULT = 20  # lines shown by .sendlog tail without amount
 
 
 def textProgressBar(barLength: int, totalVal, usedVal) -> str:
@@ -51,8 +67,107 @@ def textProgressBar(barLength: int, totalVal, usedVal) -> str:
     return f"[{(bar_used + bar_free)}] {used_percentage}%"
 
 
-@ehandler.on(command="status", outgoing=True)
+def bootProfileView() -> str:
+    if not getConfig("BOOT_PROFILER"):
+        return msgRep.BOOT_PROFILER_OFF
+    profiles = getBootProfiles()
+    if not profiles:
+        return msgRep.NO_BOOT_PROFILE
+
+    def record_str(record: dict) -> str:
+        text = (f"{record.get('name')}: {record.get('wall', 0) * 1000:.1f} ms "
+                f"(CPU {record.get('cpu', 0) * 1000:.1f} ms")
+        if record.get("mem") is not None:
+            text += f", {'+' if record['mem'] >= 0 else '-'}"
+            text += sizeStrMaker(abs(record["mem"]))
+        return text + ")"
+
+    last = profiles[-1]
+    boot_time = datetime.fromtimestamp(last.get("time", 0))
+    text = f"**{msgRep.BOOT_PROFILE}**\n\n"
+    text += (f"{msgRep.BOOT_LAST}: `{boot_time.strftime('%Y-%m-%d %H:%M:%S')}`"
+             f"\n{msgRep.BOOT_TOTAL}: `{last.get('total', 0):.2f}s`\n\n")
+    text += f"**{msgRep.BOOT_PHASES}**\n"
+    for record in last.get("phases", []):
+        text += f"`{record_str(record)}`\n"
+    text += f"\n**{msgRep.BOOT_MODULES}**\n"
+    for record in last.get("modules", []):
+        text += f"`{record_str(record)}`\n"
+    if len(profiles) > 1:
+        text += f"\n**{msgRep.BOOT_HISTORY}**\n"
+        for profile in reversed(profiles[:-1]):
+            boot_time = datetime.fromtimestamp(profile.get("time", 0))
+            text += (f"`{boot_time.strftime('%Y-%m-%d %H:%M:%S')}: "
+                     f"{profile.get('total', 0):.2f}s`\n")
+    return text
+
+
+def perfView() -> str:
+    metrics = getCommandMetrics()
+    if not metrics:
+        return msgRep.NO_PERF
+
+    def ms(seconds: float) -> str:
+        return f"{seconds * 1000:.0f}"
+
+    text = f"**{msgRep.PERF}**\n\n"
+    ranked = sorted(metrics.items(), key=lambda item: item[1].latency.sum,
+                    reverse=True)
+    for name, cmd in ranked[:_PERF_TOP]:
+        latency = cmd.latency
+        text += (f"`{name}`: {cmd.invocations} {msgRep.PERF_CALLS}, "
+                 f"{cmd.errors} {msgRep.PERF_ERRORS}\n"
+                 f"`  p50 {ms(latency.quantile(0.5))} / "
+                 f"p95 {ms(latency.quantile(0.95))} / "
+                 f"p99 {ms(latency.quantile(0.99))} / "
+                 f"max {ms(latency.max)} ms`\n"
+                 f"`  {msgRep.PERF_RPC} {ms(cmd.rpc_time)} ms "
+                 f"({cmd.rpc_calls} {msgRep.PERF_CALLS})`\n")
+    if len(ranked) > _PERF_TOP:
+        text += msgRep.PERF_MORE.format(len(ranked) - _PERF_TOP) + "\n"
+    jobs = getJobMetrics()
+    if jobs:
+        text += f"\n**{msgRep.PERF_JOBS}**\n"
+    for name, job in jobs.items():
+        text += (f"`{name}`: {job.runs} {msgRep.PERF_RUNS}, "
+                 f"{job.failures} {msgRep.PERF_FAILURES}\n"
+                 f"`  p50 {ms(job.duration.quantile(0.5))} / "
+                 f"max {ms(job.duration.max)} ms`\n")
+        if job.last_error:
+            text += f"`  {msgRep.PERF_LAST_ERROR}: {job.last_error}`\n"
+    cache_stats = getEntityCacheStats()
+    text += f"\n**{msgRep.PERF_ENTITY_CACHE}**\n"
+    for name, title in (("users", msgRep.PERF_USERS),
+                        ("full_users", msgRep.PERF_FULL_USERS)):
+        stats = cache_stats[name]
+        text += (f"`{title}: {stats['size']} {msgRep.PERF_CACHED}, "
+                 f"{stats['hits']} {msgRep.PERF_HITS}, "
+                 f"{stats['misses']} {msgRep.PERF_MISSES}`\n")
+    stats = getTranslationCacheStats()
+    text += (f"\n**{msgRep.PERF_TRANSLATION_CACHE}**\n"
+             f"`{stats['size']} {msgRep.PERF_CACHED}, "
+             f"{stats['hits']} {msgRep.PERF_HITS}, "
+             f"{stats['misses']} {msgRep.PERF_MISSES}`\n")
+    stats = cas.getCASCacheStats()
+    text += (f"\n**{msgRep.PERF_CAS_CACHE}**\n"
+             f"`{stats['size']} {msgRep.PERF_CACHED}, "
+             f"{stats['hits']} {msgRep.PERF_HITS}, "
+             f"{stats['misses']} {msgRep.PERF_MISSES}`\n")
+    stats = getRateTableStats()
+    if stats:
+        loaded = msgRep.PERF_RATES_LOADED.format(stats["days"],
+                                                 stats["currencies"])
+        text += (f"\n**{msgRep.PERF_CURRENCY_RATES}**\n"
+                 f"`{loaded}, {ms(stats['parse_time'])} ms, "
+                 f"{sizeStrMaker(stats['memory'])}`\n")
+    return text
+
+
+@ehandler.on(command="status", hasArgs=True, outgoing=True)
 async def statuschecker(stat):
+    if stat.pattern_match.group(1).lower() == "boot":
+        await stat.edit(bootProfileView())
+        return
     global STARTTIME
     uptimebot = datetime.now() - STARTTIME
     uptime_hours = uptimebot.seconds // 3600  # (60 * 60)
@@ -86,7 +201,7 @@ async def statuschecker(stat):
         commit = await getGitReview()
     except:
         pass
-    rtt = pinger("1.1.1.1")  # cloudfare's
+    rtt = await async_pinger("1.1.1.1")  # cloudfare's
     reply = f"**{msgRep.SYSTEM_STATUS}**\n\n"
     reply += msgRep.UBOT + "`" + PROJECT + "`" + "\n"
     reply += msgRep.VER_TEXT + "`" + VERSION + "`" + "\n"
@@ -175,13 +290,89 @@ async def sysd(event):
     return
 
 
-@ehandler.on(command="sendlog", outgoing=True)
+async def _sendLogText(event, data: bytes, caption: str, file_name: str):
+    """
+    Show log lines in the message or upload them compressed if they are
+    too long for a message
+    """
+    text = escape(data.decode("utf-8", errors="replace").rstrip())
+    if len(caption) + len(text) <= _LOG_TEXT_LIMIT:
+        await event.edit(f"<b>{caption}</b>\n<pre>{text}</pre>",
+                         parse_mode="html")
+        return
+    await event.edit(msgRep.UPLD_LOG)
+    try:
+        await event.client.send_file(event.chat_id,
+                                     await compressLog(file_name, data),
+                                     caption=caption)
+        await event.delete()
+    except Exception as e:
+        log.error(f"Failed to upload log records: {e}")
+        await event.edit(msgRep.FAILED_UPLD_LOG)
+    return
+
+
+async def _tailLog(event, args: list):
+    if len(args) > 1 or (args and not args[0].isdigit()):
+        await event.edit(msgRep.SENDLOG_TAIL_INVALID)
+        return
+    lines = await tailLog(int(args[0]) if args else _TAIL_DEFAULT)
+    if not lines:
+        await event.edit(msgRep.SENDLOG_NO_RECORDS)
+        return
+    await _sendLogText(event, b"".join(lines),
+                       msgRep.SENDLOG_TAIL.format(len(lines)),
+                       f"{LOGFILE}.tail.gz")
+    return
+
+
+async def _grepLog(event, args: list):
+    levels = since = None
+    # optional arguments from the end, at least one is left as pattern
+    if len(args) > 1 and parseSince(args[-1]) is not None:
+        since = parseSince(args.pop())
+    if len(args) > 1 and parseLevel(args[-1]) is not None:
+        levels = parseLevel(args.pop())
+    pattern = " ".join(args)
+    if not pattern:
+        await event.edit(msgRep.SENDLOG_NO_PATTERN)
+        return
+    await event.edit(msgRep.SENDLOG_SEARCHING)
+    try:
+        records, total = await grepLog(pattern, levels, since)
+    except RegexError as e:
+        await event.edit(msgRep.SENDLOG_INVALID_PATTERN.format(e))
+        return
+    if not records:
+        await event.edit(msgRep.SENDLOG_NO_RECORDS)
+        return
+    if total > len(records):
+        caption = msgRep.SENDLOG_MATCHES_LIMITED.format(total, len(records))
+    else:
+        caption = msgRep.SENDLOG_MATCHES.format(total)
+    await _sendLogText(event, b"".join(records), caption,
+                       f"{LOGFILE}.grep.gz")
+    return
+
+
+@ehandler.on(command="sendlog", hasArgs=True, outgoing=True)
 async def send_log(event):
+    args = event.pattern_match.group(1).split()
+    option = args.pop(0).lower() if args else None
+    if option == "tail":
+        await _tailLog(event, args)
+        return
+    elif option == "grep":
+        await _grepLog(event, args)
+        return
+    elif option:
+        await event.edit(msgRep.SENDLOG_INVALID_ARG)
+        return
     chat = await event.get_chat()
     await event.edit(msgRep.UPLD_LOG)
-    time.sleep(1)
     try:
-        await event.client.send_file(chat, "hyper.log")
+        await event.client.send_file(chat,
+                                     await compressLog(f"{LOGFILE}.gz"))
         await event.edit(msgRep.SUCCESS_UPLD_LOG)
     except Exception as e:
         log.error(f"Failed to upload HyperUBot log file: {e}")
@@ -189,7 +380,30 @@ async def send_log(event):
     return
 
 
-for cmd in ("status", "storage", "shutdown", "reboot", "sysd", "sendlog"):
+@ehandler.on(command="perf", hasArgs=True, outgoing=True)
+async def perf(event):
+    if event.pattern_match.group(1).lower() == "reset":
+        reset_metrics()
+        await event.edit(msgRep.PERF_RESET)
+        return
+    text = perfView()
+    if dump_metrics():
+        text += "\n" + msgRep.PERF_DUMPED.format(
+            f"`{getConfig('METRICS_FILE')}`")
+    if len(text) <= _MESSAGE_LIMIT:
+        await event.edit(text)
+        return
+    # many jobs or long errors, upload it instead
+    perf_file = BytesIO(text.encode())
+    perf_file.name = "perf.txt"
+    await event.client.send_file(event.chat_id, perf_file,
+                                 caption=f"**{msgRep.PERF}**")
+    await event.delete()
+    return
+
+
+for cmd in ("status", "storage", "shutdown", "reboot", "sysd", "sendlog",
+            "perf"):
     register_cmd_usage(cmd,
                        usageRep.SYSTOOLS_USAGE.get(cmd, {}).get("args"),
                        usageRep.SYSTOOLS_USAGE.get(cmd, {}).get("usage"))
@@ -6,7 +6,7 @@
 # You may not use this file or any of the content within it, unless in
 # compliance with the PE License
 
-from userbot.include.aux_funcs import shell_runner
+from userbot.include.aux_funcs import sizeStrMaker
 from userbot.include.language_processor import (TerminalText as msgRep,
                                                 ModuleDescriptions as descRep,
                                                 ModuleUsages as usageRep)
@@ -16,31 +16,29 @@ from userbot.sysutils.registration import (register_cmd_usage,
                                            register_module_desc,
                                            register_module_info)
 from userbot.version import VERSION
+from asyncio import create_subprocess_shell, wait_for, TimeoutError
+from asyncio.subprocess import PIPE, STDOUT
+from io import BytesIO
 from logging import getLogger
-from os import path, remove
+from time import monotonic
+import os
+import signal
 from telethon.errors import ChatSendMediaForbiddenError, MessageTooLongError
 
 log = getLogger(__name__)
 ehandler = EventHandler(log)
+# leave some room for the command line and status of the message
+_MESSAGE_LIMIT = 3800
+_EDIT_INTERVAL = 2  # seconds between two output edits
+_running = {}  # chat ID: {message ID: process}
 
 
 async def outputAsFile(event, output_text) -> bool:
-    temp_file = path.join(getConfig("TEMP_DL_DIR"), "shell_output.txt")
+    # upload from memory, no temporary file required
+    output_file = BytesIO(output_text.encode())
+    output_file.name = "shell_output.txt"
     try:
-        with open(temp_file, "w") as output_file:
-            output_file.write(output_text)
-        output_file.close()
-    except IOError as io:
-        log.warning(io, exc_info=True)
-        await event.edit(f"`{msgRep.BASH_CRT_FILE_FAILED_RO}`")
-        return
-    except Exception as e:
-        log.error(e, exc_info=True)
-        await event.edit(f"`{msgRep.BASH_CRT_FILE_FAILED}`")
-        return
-
-    try:
-        await event.client.send_file(event.chat_id, temp_file)
+        await event.client.send_file(event.chat_id, output_file)
         await event.delete()  # delete message (not output file)
     except ChatSendMediaForbiddenError:
         log.warning(f"[Shell] Send media is not allowed in chat "
@@ -49,32 +47,147 @@ async def outputAsFile(event, output_text) -> bool:
     except Exception as e:
         log.error(e, exc_info=True)
         await event.edit(f"`{msgRep.BASH_SEND_FILE_FAILED}`")
+    return
 
-    remove(temp_file)
+
+def _kill(process):
+    """
+    Kill the shell including the commands it started. The shell runs
+    in its own process group for this (on POSIX systems)
+    """
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass  # finished meanwhile
     return
 
 
-@ehandler.on(command="shell", hasArgs=True, outgoing=True)
-async def bash(command):
-    full_cmd_str = command.pattern_match.group(1)
-    commandArray = command.text.split(" ")
-    del(commandArray[0])
-    cmd_output = shell_runner(commandArray)
-    if cmd_output is None:
+class _ShellOutput:
+    def __init__(self, limit: int):
+        """
+        Output buffer of a shell command. Output beyond limit (in bytes)
+        is dropped but still counted
+        """
+        self.__buffer = bytearray()
+        self.__limit = limit
+        self.size = 0
+
+    def append(self, chunk: bytes):
+        self.size += len(chunk)
+        room = self.__limit - len(self.__buffer)
+        if room > 0:
+            self.__buffer += chunk[:room]
+        return
+
+    @property
+    def truncated(self) -> bool:
+        return self.size > len(self.__buffer)
+
+    def text(self) -> str:
+        return self.__buffer.decode(errors="replace")
+
+
+async def stream_shell(event, full_cmd_str: str):
+    """
+    Run the command without blocking the event loop and stream its
+    output (stdout and stderr) into the message
+    """
+    timeout = getConfig("SHELL_TIMEOUT", 300)
+    output = _ShellOutput(getConfig("SHELL_OUTPUT_LIMIT", 1048576))
+    header = "$ " + full_cmd_str + "\n\n"
+    process = await create_subprocess_shell(full_cmd_str, stdout=PIPE,
+                                            stderr=STDOUT,
+                                            start_new_session=True)
+    running = _running.setdefault(event.chat_id, {})
+    running[event.message.id] = process
+    last_edit = monotonic()
+
+    async def read_output():
+        nonlocal last_edit
+        while True:
+            chunk = await process.stdout.read(4096)
+            if not chunk:
+                break
+            output.append(chunk)
+            if monotonic() - last_edit < _EDIT_INTERVAL:
+                continue
+            last_edit = monotonic()
+            text = output.text()
+            if len(text) > _MESSAGE_LIMIT:  # show the latest output only
+                text = "..." + text[-_MESSAGE_LIMIT:]
+            try:
+                await event.edit(f"`{header}{text}`\n\n"
+                                 f"__{msgRep.BASH_RUNNING}__")
+            except Exception:
+                pass  # unchanged output or flood wait, next time then
+        return await process.wait()
+
+    status, returncode = None, None
+    try:
+        returncode = await wait_for(read_output(), timeout)
+        if returncode < 0:  # killed by signal, likely .shellstop
+            status = msgRep.BASH_CANCELLED
+        elif returncode:
+            status = msgRep.BASH_EXIT_CODE.format(returncode)
+    except TimeoutError:
+        _kill(process)
+        await process.wait()
+        status = msgRep.BASH_TIMEOUT.format(timeout)
+    finally:
+        running.pop(event.message.id, None)
+        if not running:
+            _running.pop(event.chat_id, None)
+
+    cmd_output = output.text()
+    if not cmd_output and returncode and returncode > 0:
         cmd_output = msgRep.BASH_ERROR
-    output = "$ " + full_cmd_str + "\n\n" + cmd_output
+    if output.truncated:
+        cmd_output += "\n\n" + msgRep.BASH_TRUNCATED.format(
+            sizeStrMaker(output.size))
+    result = header + cmd_output
+    if status:
+        result += "\n\n" + status
+    if len(result) > _MESSAGE_LIMIT:
+        log.info("Shell output is too large. "
+                 "Trying to upload output as a file...")
+        await outputAsFile(event, result)
+        return
     try:
-        await command.edit("`" + output + "`")
+        await event.edit("`" + result + "`")
     except MessageTooLongError:
         log.info("Shell output is too large. "
                  "Trying to upload output as a file...")
-        await outputAsFile(command, output)
+        await outputAsFile(event, result)
+    return
+
+
+@ehandler.on(command="shell", hasArgs=True, outgoing=True)
+async def bash(command):
+    full_cmd_str = command.pattern_match.group(1)
+    await command.edit(f"`$ {full_cmd_str}`\n\n__{msgRep.BASH_RUNNING}__")
+    await stream_shell(command, full_cmd_str)
+    return
+
+
+@ehandler.on(command="shellstop", outgoing=True)
+async def shellstop(event):
+    running = _running.get(event.chat_id)
+    if not running:
+        await event.edit(f"`{msgRep.BASH_NOTHING_RUNNING}`")
+        return
+    for process in list(running.values()):
+        _kill(process)
+    await event.edit(f"`{msgRep.BASH_STOPPED.format(len(running))}`")
     return
 
 
-register_cmd_usage("shell",
-                   usageRep.TERMINAL_USAGE.get("shell", {}).get("args"),
-                   usageRep.TERMINAL_USAGE.get("shell", {}).get("usage"))
+for cmd in ("shell", "shellstop"):
+    register_cmd_usage(cmd,
+                       usageRep.TERMINAL_USAGE.get(cmd, {}).get("args"),
+                       usageRep.TERMINAL_USAGE.get(cmd, {}).get("usage"))
 
 register_module_desc(descRep.TERMINAL_DESC)
 register_module_info(
@@ -7,7 +7,7 @@
 # compliance with the PE License
 
 from userbot.include.aux_funcs import getGitReview
-from userbot.include.git_api import getLatestData
+from userbot.include.git_api import fetchLatestRelease
 from userbot.include.language_processor import (UpdaterText as msgRep,
                                                 ModuleDescriptions as descRep,
                                                 ModuleUsages as usageRep)
@@ -147,7 +147,7 @@ async def updater(event):
         return
 
     try:
-        release_data = getLatestData("nunopenim/HyperUBot")
+        release_data = await fetchLatestRelease("nunopenim/HyperUBot")
         if not release_data:
             raise Exception
     except Exception:
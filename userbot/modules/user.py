@@ -7,7 +7,8 @@
 # compliance with the PE License
 
 from userbot import tgclient
-from userbot.include.aux_funcs import event_log, fetch_user
+from userbot.include.aux_funcs import event_log, fan_out, fetch_user
+from userbot.include.entity_cache import get_full_user
 from userbot.include.language_processor import (UserText as msgRep,
                                                 ModuleDescriptions as descRep,
                                                 ModuleUsages as usageRep)
@@ -17,16 +18,211 @@ from userbot.sysutils.registration import (register_cmd_usage,
                                            register_module_desc,
                                            register_module_info)
 from userbot.version import VERSION
-from telethon.tl.types import User, Chat, Channel
+from telethon.tl.types import (User, Chat, Channel, ChannelForbidden,
+                               ChatForbidden, PeerChannel, PeerChat,
+                               PeerUser, UpdateChannel, UpdateChat,
+                               UpdateChatParticipantAdmin, UpdateNewMessage,
+                               UpdatePeerBlocked, UpdateShortMessage)
 from telethon.tl.functions.contacts import GetBlockedRequest
 from telethon.tl.functions.photos import GetUserPhotosRequest
+from telethon.utils import get_peer_id
+from asyncio import Lock, get_event_loop
+from json import dump, load
 from logging import getLogger
+from os import replace
+from os.path import exists, join
+from threading import Lock as ThreadLock
 
 MAXINT = 2147483647  # I sure do love hammering down shit
+_SAVE_DELAY = 10  # seconds updates are gathered before the cache is saved
 log = getLogger(__name__)
 ehandler = EventHandler(log)
 
 
+class _DialogStats:
+    def __init__(self, cache_file: str):
+        """
+        Persistent classification of all dialogs for .stats. The cache
+        is seeded once by walking all dialogs and kept up to date by
+        update events afterwards, so .stats doesn't need to walk the
+        dialogs on every invocation.
+        Scheme of a dialog: {"peer_id": ["kind", "role"]}
+        kind: user, bot, group, supergroup, channel or unknown
+        role: owner, admin or None
+        """
+        self.__cache_file = cache_file
+        self.__dialogs = {}
+        self.__blocked = set()
+        self.__owner = None
+        self.__seeded = False
+        self.__seed_lock = None  # created in the loop by the first seed
+        self.__pending = None  # peers updated while seeding
+        self.__save_handle = None  # scheduled save
+        self.__write_lock = ThreadLock()
+        self.__load()
+
+    def __load(self):
+        if not exists(self.__cache_file):
+            return
+        try:
+            with open(self.__cache_file, "r") as cfile:
+                cache = load(cfile)
+            self.__dialogs = {int(peer_id): tuple(entry) for peer_id, entry
+                              in cache.get("dialogs", {}).items()}
+            self.__blocked = set(cache.get("blocked", []))
+            self.__owner = cache.get("owner")
+            self.__seeded = True
+        except Exception as e:
+            log.warning(f"Unable to read dialog stats cache: {e}")
+        return
+
+    def __write(self, cache: dict):
+        # worker thread
+        try:
+            with self.__write_lock:
+                temp_file = self.__cache_file + ".tmp"
+                with open(temp_file, "w") as cfile:
+                    dump(cache, cfile)
+                replace(temp_file, self.__cache_file)
+        except Exception as e:
+            log.warning(f"Unable to save dialog stats cache: {e}")
+        return
+
+    def __save(self):
+        """
+        Write a snapshot of the cache in a worker thread
+        """
+        if self.__save_handle is not None:
+            self.__save_handle.cancel()
+            self.__save_handle = None
+        cache = {"owner": self.__owner, "dialogs": dict(self.__dialogs),
+                 "blocked": sorted(self.__blocked)}
+        get_event_loop().run_in_executor(None, self.__write, cache)
+        return
+
+    def __schedule_save(self):
+        """
+        Save the cache _SAVE_DELAY seconds after the first update, so a
+        burst of updates is written once
+        """
+        if self.__save_handle is None:
+            self.__save_handle = get_event_loop().call_later(
+                _SAVE_DELAY, self.__save)
+        return
+
+    def __isDialog(self, entity) -> bool:
+        if isinstance(entity, (ChatForbidden, ChannelForbidden)):
+            return False
+        elif isinstance(entity, Chat):
+            return not (entity.left or entity.deactivated or
+                        entity.migrated_to)
+        elif isinstance(entity, Channel):
+            return not entity.left
+        return True
+
+    def __classify(self, entity) -> tuple:
+        if isinstance(entity, Chat):
+            return ("group", "owner" if entity.creator else
+                    "admin" if entity.admin_rights else None)
+        elif isinstance(entity, Channel):
+            role = ("owner" if entity.creator else
+                    "admin" if entity.admin_rights else None)
+            if entity.broadcast:
+                return ("channel", role)
+            elif entity.megagroup:
+                return ("supergroup", role)
+        elif isinstance(entity, User):
+            return ("bot" if entity.bot else "user", None)
+        return ("unknown", None)
+
+    async def _seed(self, client):
+        if self.__seed_lock is None:
+            self.__seed_lock = Lock()
+        async with self.__seed_lock:
+            self.__pending = set()
+            try:
+                dialogs, blocked = {}, set()
+                try:
+                    block_obj = await client(GetBlockedRequest(offset=0,
+                                                               limit=MAXINT))
+                    if block_obj.blocked:
+                        for user in block_obj.blocked:
+                            blocked.add(get_peer_id(user.peer_id))
+                except:
+                    pass
+                async for dialog in client.iter_dialogs(
+                        ignore_migrated=True):
+                    dialogs[dialog.id] = self.__classify(dialog.entity)
+                me = await client.get_me(input_peer=True)
+            finally:
+                pending, self.__pending = self.__pending, None
+            self.__dialogs, self.__blocked = dialogs, blocked
+            self.__owner = me.user_id
+            self.__seeded = True
+            for peer_id in pending:  # newer than the walk
+                await self._update_peer(client, peer_id, save=False)
+            self.__save()
+        return
+
+    async def _ensure_seeded(self, client):
+        me = await client.get_me(input_peer=True)
+        if not self.__seeded or self.__owner != me.user_id:
+            await self._seed(client)
+        return
+
+    async def _update_peer(self, client, peer_id: int, save: bool = True):
+        if self.__pending is not None:
+            self.__pending.add(peer_id)
+            return
+        if not self.__seeded:
+            return  # the first seed sees it anyway
+        try:
+            entity = await client.get_entity(peer_id)
+            entry = (self.__classify(entity)
+                     if self.__isDialog(entity) else None)
+        except Exception as e:
+            log.debug(f"Unable to update dialog {peer_id}: {e}")
+            return
+        if entry is None:
+            if self.__dialogs.pop(peer_id, None) is None:
+                return
+        elif self.__dialogs.get(peer_id) == entry:
+            return
+        else:
+            self.__dialogs[peer_id] = entry
+        if save:
+            self.__schedule_save()
+        return
+
+    def _knows_peer(self, peer_id: int) -> bool:
+        return peer_id in self.__dialogs
+
+    def _set_blocked(self, peer_id: int, blocked: bool):
+        if not self.__seeded:
+            return
+        if blocked:
+            self.__blocked.add(peer_id)
+        else:
+            self.__blocked.discard(peer_id)
+        self.__schedule_save()
+        return
+
+    def _getStats(self) -> dict:
+        stats = {"total": len(self.__dialogs),
+                 "blocked": len(self.__blocked)}
+        for peer_id, (kind, role) in self.__dialogs.items():
+            stats[kind] = stats.get(kind, 0) + 1
+            if role:
+                stats[f"{kind}_{role}"] = stats.get(f"{kind}_{role}", 0) + 1
+            if kind in ("user", "bot") and peer_id in self.__blocked:
+                stats[f"{kind}_blocked"] = stats.get(f"{kind}_blocked", 0) + 1
+        return stats
+
+
+_dialog_stats = _DialogStats(join(getConfig("TEMP_DL_DIR", "."),
+                                  "dialog_stats.json"))
+
+
 @ehandler.on(command="userid", hasArgs=True, outgoing=True)
 async def userid(event):
     if event.reply_to_msg_id:
@@ -101,60 +297,55 @@ async def kickme(leave):
     return
 
 
-@ehandler.on(command="stats", outgoing=True)
+@ehandler.on_Raw(types=[UpdateChannel, UpdateChat,
+                         UpdateChatParticipantAdmin])
+async def track_chat_dialogs(update):
+    # joined, left, migrated or admin rights changed
+    if isinstance(update, UpdateChannel):
+        peer_id = get_peer_id(PeerChannel(update.channel_id))
+    else:
+        peer_id = get_peer_id(PeerChat(update.chat_id))
+    await _dialog_stats._update_peer(tgclient, peer_id)
+    return
+
+
+@ehandler.on_Raw(types=[UpdateNewMessage, UpdateShortMessage])
+async def track_private_dialogs(update):
+    # first message of a new private chat
+    if isinstance(update, UpdateShortMessage):
+        user_id = update.user_id
+    elif isinstance(update.message.peer_id, PeerUser):
+        user_id = update.message.peer_id.user_id
+    else:
+        return
+    if not _dialog_stats._knows_peer(user_id):
+        await _dialog_stats._update_peer(tgclient, user_id)
+    return
+
+
+@ehandler.on_Raw(types=UpdatePeerBlocked)
+async def track_blocks(update):
+    _dialog_stats._set_blocked(get_peer_id(update.peer_id), update.blocked)
+    return
+
+
+@ehandler.on(command="stats", hasArgs=True, outgoing=True)
 async def stats(event):
+    await event.edit(msgRep.STATS_PROCESSING)
+    if event.pattern_match.group(1).lower() == "refresh":
+        await _dialog_stats._seed(event.client)
+    else:
+        await _dialog_stats._ensure_seeded(event.client)
+
+    dstats = _dialog_stats._getStats()
     (groups, channels, super_groups, bots, users, unknown, total,
      group_owner, group_admin, super_group_owner, super_group_admin,
      bot_blocked, user_blocked, total_blocks, channel_owner,
-     channel_admin) = (0,)*16
-    blocked_ids = []
-
-    await event.edit(msgRep.STATS_PROCESSING)
-
-    try:
-        block_obj = await event.client(GetBlockedRequest(offset=0,
-                                                         limit=MAXINT))
-        if block_obj.blocked:
-            for user in block_obj.blocked:
-                blocked_ids.append(user.peer_id.user_id)
-            total_blocks = len(blocked_ids)
-    except:
-        pass
-
-    async for dialog in tgclient.iter_dialogs(ignore_migrated=True):
-        total += 1
-        if isinstance(dialog.entity, Chat):
-            groups += 1
-            if dialog.entity.creator:
-                group_owner += 1
-            elif dialog.entity.admin_rights:
-                group_admin += 1
-        elif isinstance(dialog.entity, Channel):
-            if dialog.entity.broadcast:
-                channels += 1
-                if dialog.entity.creator:
-                    channel_owner += 1
-                elif dialog.entity.admin_rights:
-                    channel_admin += 1
-            elif dialog.entity.megagroup:
-                super_groups += 1
-                if dialog.entity.creator:
-                    super_group_owner += 1
-                elif dialog.entity.admin_rights:
-                    super_group_admin += 1
-            else:
-                unknown += 1
-        elif isinstance(dialog.entity, User):
-            if dialog.entity.bot:
-                bots += 1
-                if dialog.entity.id in blocked_ids:
-                    bot_blocked += 1
-            else:
-                users += 1
-                if dialog.entity.id in blocked_ids:
-                    user_blocked += 1
-        else:
-            unknown += 1
+     channel_admin) = (dstats.get(key, 0) for key in (
+         "group", "channel", "supergroup", "bot", "user", "unknown",
+         "total", "group_owner", "group_admin", "supergroup_owner",
+         "supergroup_admin", "bot_blocked", "user_blocked", "blocked",
+         "channel_owner", "channel_admin"))
 
     result = f"**{msgRep.STATS_HEADER}**\n\n"
     result += msgRep.STATS_USERS.format(users) + "\n"
@@ -182,14 +373,15 @@ async def stats(event):
 async def info(event):  # .info command
     await event.edit(msgRep.FETCH_INFO)
 
-    full_user_obj = await fetch_user(event=event, full_user=True,
-                                     org_author=True)
+    # resolve the (cached) user first, full user and profile photos
+    # can be requested at the same time then
+    user_obj = await fetch_user(event=event, org_author=True)
     # fetch_user() will return an error msg if something failed
-    if not full_user_obj:
+    if not user_obj:
         return
 
     try:
-        caption = await fetch_info(full_user_obj, event)
+        caption = await fetch_info(user_obj, event)
         await event.edit(caption, parse_mode="html")
     except Exception as e:
         log.error(e)
@@ -198,17 +390,19 @@ async def info(event):  # .info command
     return
 
 
-async def fetch_info(user_obj, event):
-    try:
-        user_pfps = await event.client(
-            GetUserPhotosRequest(user_id=user_obj.user.id,
-                                 offset=42,
-                                 max_id=0,
-                                 limit=80))
-        user_pfps_count = (user_pfps.count
-                           if hasattr(user_pfps, "count") else 0)
-    except:
-        user_pfps_count = 0
+async def fetch_info(user, event):
+    results, failed = await fan_out(
+        {"full_user": get_full_user(event.client, user.id),
+         "photos": event.client(GetUserPhotosRequest(user_id=user.id,
+                                                     offset=42,
+                                                     max_id=0,
+                                                     limit=80))})
+    user_obj = results["full_user"]
+    if not user_obj:
+        raise Exception(f"Unable to get full user of {user.id}")
+    user_pfps = results["photos"]
+    user_pfps_count = (user_pfps.count
+                       if hasattr(user_pfps, "count") else 0)
     user_id = user_obj.user.id
     user_deleted = user_obj.user.deleted
     user_self = user_obj.user.is_self
@@ -253,6 +447,8 @@ async def fetch_info(user_obj, event):
         caption += f"{msgRep.COMMON_SELF}"
     else:
         caption += f"{msgRep.COMMON}: {common_chat}"
+    if failed:
+        caption += "\n\n" + msgRep.PARTIAL_INFO
     return caption
 
 
@@ -6,7 +6,8 @@
 # You may not use this file or any of the content within it, unless in
 # compliance with the PE License
 
-from userbot.include.aux_funcs import pinger
+from userbot.include.ping_engine import (async_pinger, format_rtt,
+                                         getPingStats, ping_hosts)
 from userbot.include.language_processor import (WebToolsText as msgRep,
                                                 ModuleDescriptions as descRep,
                                                 ModuleUsages as usageRep)
@@ -17,11 +18,13 @@ from userbot.sysutils.registration import (register_cmd_usage,
                                            register_module_info)
 from userbot.version import VERSION
 from telethon import functions
+from asyncio import create_task, get_event_loop, shield
 from dateutil.parser import parse
+from io import BytesIO
 from logging import getLogger
-from os import path, remove
 from speedtest import Speedtest
-from urllib.request import urlretrieve
+from time import monotonic
+from urllib.request import urlopen
 
 log = getLogger(__name__)
 ehandler = EventHandler(log)
@@ -30,7 +33,7 @@ DEFAULT_ADD = "1.0.0.1"
 
 @ehandler.on(command="rtt", outgoing=True)
 async def rtt(message):
-    rtt = pinger(DEFAULT_ADD)
+    rtt = await async_pinger(DEFAULT_ADD)
     await message.edit(msgRep.PING_SPEED + rtt)
     return
 
@@ -46,26 +49,128 @@ async def datacenter(event):
 
 @ehandler.on(command="ping", hasArgs=True, outgoing=True)
 async def ping(args):
-    commandParser = str(args.message.message).split(' ')
-    if len(commandParser) != 2:
+    # unique hosts, order kept
+    hosts = list(dict.fromkeys(args.pattern_match.group(1).split()))
+    if not hosts:
         await args.edit(msgRep.BAD_ARGS)
-    else:
-        dns = commandParser[1]
-        try:
-            duration = pinger(dns)
-        except Exception as e:
-            log.warning(e)
-            await args.edit(msgRep.INVALID_HOST)
-            return
-        await args.edit(msgRep.PINGER_VAL.format(dns, duration))
+        return
+    # all hosts at once, so it takes as long as the slowest one only
+    results = await ping_hosts(hosts)
+    if all(rtt is None for rtt in results.values()) and \
+       not any(getPingStats(host)["probes"] for host in hosts):
+        await args.edit(msgRep.INVALID_HOST)
+        return
+    text = ""
+    for host in hosts:
+        stats = getPingStats(host)
+        text += msgRep.PINGER_VAL.format(host, format_rtt(results[host]))
+        if stats["probes"] > 1:
+            text += "\n" + msgRep.PING_STATS.format(
+                format_rtt(stats["min"]), format_rtt(stats["avg"]),
+                format_rtt(stats["jitter"]), f"{stats['loss']:.0f}",
+                stats["probes"])
+        text += "\n\n"
+    await args.edit(text.strip())
     return
 
 
+class _SpeedtestRunner:
+    def __init__(self):
+        """
+        Runs the speedtest in a worker thread so the event loop keeps
+        processing other commands and updates meanwhile. Concurrent
+        requests share one run and the last result is kept for
+        SPEEDTEST_CACHE_TTL seconds.
+        Stages: 0 select server, 1 download, 2 upload, 3 done
+        """
+        self.__run = None
+        self.__stage = 0
+        self.__subscribers = []
+        self.__last = None  # (time measured, SpeedtestResults)
+
+    def __set_stage(self, stage: int):
+        self.__stage = stage
+        for on_stage in list(self.__subscribers):
+            create_task(on_stage(stage))
+        return
+
+    def __finish(self, run):
+        if not run.cancelled() and run.exception() is None:
+            self.__last = (monotonic(), run.result())
+        self.__run = None
+        return
+
+    def __measure(self, loop):
+        # worker thread, don't touch the event loop directly here
+        def stage(value: int):
+            loop.call_soon_threadsafe(self.__set_stage, value)
+        s = Speedtest()
+        s.get_best_server()
+        stage(1)
+        s.download()
+        stage(2)
+        s.upload()
+        stage(3)
+        return s.results
+
+    async def _measure(self, on_stage, share: bool, fresh: bool) -> tuple:
+        """
+        Returns:
+            a tuple of the SpeedtestResults and the age in seconds if
+            the result is from cache else None
+        """
+        loop = get_event_loop()
+        age = None
+        if not fresh and self.__last and \
+           monotonic() - self.__last[0] < getConfig("SPEEDTEST_CACHE_TTL",
+                                                    300):
+            age = monotonic() - self.__last[0]
+            results = self.__last[1]
+        else:
+            if self.__run is None:
+                self.__stage = 0
+                self.__run = loop.run_in_executor(None, self.__measure, loop)
+                self.__run.add_done_callback(self.__finish)
+            self.__subscribers.append(on_stage)
+            await on_stage(self.__stage)
+            try:
+                # shielded, so a cancelled waiter can't cancel the others
+                results = await shield(self.__run)
+            finally:
+                self.__subscribers.remove(on_stage)
+        if share and not results.dict().get("share"):
+            await loop.run_in_executor(None, results.share)
+        return (results, age)
+
+
+_speedtest_runner = _SpeedtestRunner()
+
+
+def _download(url: str) -> bytes:
+    with urlopen(url, timeout=30) as response:
+        return response.read()
+
+
+def speedtestProgress(stage: int, failed: bool = False) -> str:
+    check_mark = u"\u2705"
+    warning = u"\u26A0"
+    steps = (msgRep.SPD_TEST_SELECT_SERVER, msgRep.SPD_TEST_DOWNLOAD,
+             msgRep.SPD_TEST_UPLOAD)
+    process = "**Speedtest by Ookla**\n"
+    for index, step in enumerate(steps[:stage + 1]):
+        if index < stage:
+            process += f"\n- {step} {check_mark}"
+        else:
+            process += f"\n- {step} {warning if failed else '...'}"
+    return process
+
+
 @ehandler.on(command="speedtest", hasArgs=True, outgoing=True)
 async def speedtest(event):
-    arg_from_event = event.pattern_match.group(1)
+    args_from_event = event.pattern_match.group(1).lower().split()
     chat = await event.get_chat()
-    share_as_pic = True if arg_from_event.lower() == "pic" else False
+    share_as_pic = True if "pic" in args_from_event else False
+    fresh = True if "new" in args_from_event else False
     if share_as_pic:
         # if speedtest is send to a group and send media is
         # not allowed then skip 'pic' argument
@@ -73,66 +178,46 @@ async def speedtest(event):
                 not chat.creator and not chat.admin_rights and
                 chat.default_banned_rights.send_media):
             share_as_pic = False  # disable
-    process = None
-    all_test_passed = False
-    check_mark = u"\u2705"
-    warning = u"\u26A0"
+    stage = 0
+
+    async def on_stage(new_stage: int):
+        nonlocal stage
+        stage = new_stage
+        try:
+            await event.edit(speedtestProgress(new_stage))
+        except Exception:
+            pass  # progress is cosmetic only
+
     try:
-        process = (f"**Speedtest by Ookla**\n\n"
-                   f"- {msgRep.SPD_TEST_SELECT_SERVER}...")
-        await event.edit(process)
-        s = Speedtest()
-        s.get_best_server()
-        process = (f"**Speedtest by Ookla**\n\n"
-                   f"- {msgRep.SPD_TEST_SELECT_SERVER} {check_mark}\n"
-                   f"- {msgRep.SPD_TEST_DOWNLOAD}...")
-        await event.edit(process)
-        s.download()
-        process = (f"**Speedtest by Ookla**\n\n"
-                   f"- {msgRep.SPD_TEST_SELECT_SERVER} {check_mark}\n"
-                   f"- {msgRep.SPD_TEST_DOWNLOAD} {check_mark}\n"
-                   f"- {msgRep.SPD_TEST_UPLOAD}...")
-        await event.edit(process)
-        s.upload()
-        process = (f"**Speedtest by Ookla**\n\n"
-                   f"- {msgRep.SPD_TEST_SELECT_SERVER} {check_mark}\n"
-                   f"- {msgRep.SPD_TEST_DOWNLOAD} {check_mark}\n"
-                   f"- {msgRep.SPD_TEST_UPLOAD} {check_mark}")
-        all_test_passed = True
-        if share_as_pic:
-            s.results.share()
-        result = s.results.dict()
+        results, age = await _speedtest_runner._measure(on_stage,
+                                                        share_as_pic, fresh)
+        result = results.dict()
+        process = speedtestProgress(3)
         if not result:
             await event.edit(process + "\n\n" +
                              f"`{msgRep.SPD_FAILED}: {msgRep.SPD_NO_RESULT}`")
             return
     except MemoryError as me:
         log.error(me)
-        if not all_test_passed:
-            process = process[:-3] + f" {warning}"
-            await event.edit(process + "\n\n" +
-                             f"`{msgRep.SPD_FAILED}: {msgRep.SPD_NO_MEMORY}`")
-        else:
-            await event.edit(process + "\n\n" +
-                             f"`{msgRep.SPD_FAILED}: {msgRep.SPD_NO_MEMORY}`")
+        process = speedtestProgress(stage, failed=stage < 3)
+        await event.edit(process + "\n\n" +
+                         f"`{msgRep.SPD_FAILED}: {msgRep.SPD_NO_MEMORY}`")
         return
     except Exception as e:
         log.error(e)
-        if not all_test_passed:
-            process = process[:-3] + f" {warning}"
-            await event.edit(process + "\n\n" + msgRep.SPD_FAILED)
-        else:
-            await event.edit(process + "\n\n" + msgRep.SPD_FAILED)
+        process = speedtestProgress(stage, failed=stage < 3)
+        await event.edit(process + "\n\n" + msgRep.SPD_FAILED)
         return
 
     if share_as_pic:
         try:
             await event.edit(process + "\n\n" + f"{msgRep.SPD_PROCESSING}...")
-            png_file = path.join(getConfig("TEMP_DL_DIR"), "speedtest.png")
-            urlretrieve(result["share"], png_file)
+            # in memory, concurrent commands may share the same result
+            png_file = BytesIO(await get_event_loop().run_in_executor(
+                None, _download, result["share"]))
+            png_file.name = "speedtest.png"
             await event.client.send_file(chat.id, png_file)
             await event.delete()
-            remove(png_file)
         except Exception as e:
             log.error(e)
             await event.edit(msgRep.SPD_FAIL_SEND_RESULT)
@@ -163,6 +248,8 @@ async def speedtest(event):
         text += f"<b>{msgRep.SPD_PING}</b>: <code>{ping}</code> ms\n"
         text += f"<b>{msgRep.SPD_ISP}</b>: {isp}\n"
         text += f"<b>{msgRep.SPD_HOSTED_BY}</b>: {host} ({host_cc})\n"
+        if age is not None:
+            text += "\n<i>" + msgRep.SPD_CACHED.format(int(age)) + "</i>\n"
         await event.edit(text, parse_mode="html")
     return
 
@@ -46,6 +46,8 @@ class ConfigClass(object):
     #
     LOGGING = False  # Enable or disable logging
     LOGGING_CHATID = None  # Chat ID. Must be an integer
+    # Seconds events are collected to be sent as one message
+    EVENT_LOG_WINDOW = 2
 
     #
     # To store downloaded file(s) (temporary)
@@ -57,6 +59,66 @@ class ConfigClass(object):
     #
     NOT_LOAD_MODULES = []  # must be a list or config will not work
 
+    #
+    # Starts specific module(s) on first use of one of their commands
+    # instead of at boot e.g. ["scrappers", "webtools"]
+    #
+    LAZY_LOAD_MODULES = []  # must be a list or config will not work
+
+    #
+    # Imports the dependencies of modules concurrently at boot
+    #
+    PARALLEL_IMPORT = False
+
+    #
+    # Records the duration of every boot phase and module import.
+    # The last boots can be shown with .status boot
+    #
+    BOOT_PROFILER = False
+
+    #
+    # Per command metrics (see .perf) are exported in Prometheus text
+    # format to this file, e.g. "./metrics.prom". Leave empty to disable
+    #
+    METRICS_FILE = ""
+
+    #
+    # Resolved users are cached to save requests. Amount of users kept
+    # per cache and seconds until a cached user expires. Hits and misses
+    # are shown in .perf
+    #
+    ENTITY_CACHE_SIZE = 256
+    ENTITY_CACHE_TTL = 300
+
+    #
+    # Seconds until a .shell command is killed and the maximum amount of
+    # output (in bytes) kept from it
+    #
+    SHELL_TIMEOUT = 300
+    SHELL_OUTPUT_LIMIT = 1048576
+
+    #
+    # Seconds the last speedtest result is reused by .speedtest
+    #
+    SPEEDTEST_CACHE_TTL = 300
+
+    #
+    # Size in bytes the cached text-to-speech audio files of .tts may
+    # take up at most. Least recently used files are removed first
+    #
+    TTS_CACHE_SIZE = 10485760
+
+    #
+    # Seconds after which the currency data history of the European
+    # Central Bank is downloaded again in the background
+    #
+    CURRENCY_REFRESH_INTERVAL = 86400
+
+    #
+    # Seconds a verdict of the Combot Anti-Spam System (CAS) is cached
+    #
+    CAS_CACHE_TTL = 3600
+
     #
     # Community extra repos, leave as list of strings (or not)
     # The format of the repo should be "<github_username>/<github_repo>"
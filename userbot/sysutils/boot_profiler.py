@@ -0,0 +1,204 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from .configuration import getConfig
+from contextlib import contextmanager
+from json import dump, load
+from logging import getLogger
+from os.path import exists, join
+from sys import platform
+from time import perf_counter, thread_time, time
+
+log = getLogger(__name__)
+_BOOT_PROFILES_LIMIT = 10
+
+
+def _getMemoryUsage():
+    """
+    Returns the current memory usage (resident set size) of this process
+    in bytes or None if it can't be determined on this system
+    """
+    try:
+        from os import sysconf
+        with open("/proc/self/statm", "r") as statm:
+            return int(statm.read().split()[1]) * sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        # peak usage only, but better than nothing
+        from resource import getrusage, RUSAGE_SELF
+        maxrss = getrusage(RUSAGE_SELF).ru_maxrss
+        return maxrss if platform == "darwin" else maxrss * 1024
+    except Exception:
+        pass
+    return None
+
+
+class _BootProfiler:
+    def __init__(self):
+        """
+        Records wall time, CPU time (of the current thread) and memory
+        delta of the boot phases and module imports.
+        Scheme of a record: {"name": "name of phase or module",
+                             "wall": "wall time in seconds",
+                             "cpu": "CPU time in seconds",
+                             "mem": "memory delta in bytes or None"}
+        """
+        self.__started = time()
+        self.__start = perf_counter()
+        self.__phases = []
+        self.__modules = []
+        self.__current = None
+
+    def __snapshot(self) -> tuple:
+        return (perf_counter(), thread_time(), _getMemoryUsage())
+
+    def __record(self, record: dict, begin: tuple):
+        end = self.__snapshot()
+        record["wall"] = end[0] - begin[0]
+        record["cpu"] = end[1] - begin[1]
+        record["mem"] = (end[2] - begin[2]
+                         if end[2] is not None and
+                         begin[2] is not None else None)
+        return
+
+    def _start_phase(self, name: str):
+        self._end_phase()
+        self.__current = ({"name": name}, self.__snapshot())
+        return
+
+    def _end_phase(self):
+        if self.__current:
+            record, begin = self.__current
+            self.__record(record, begin)
+            self.__phases.append(record)
+            self.__current = None
+        return
+
+    @contextmanager
+    def _profile(self, name: str, is_module: bool):
+        record = {"name": name}
+        begin = self.__snapshot()
+        try:
+            yield record
+        finally:
+            self.__record(record, begin)
+            if is_module:
+                self.__modules.append(record)
+            else:
+                self.__phases.append(record)
+
+    def _finish(self, profiles_file: str = None) -> dict:
+        self._end_phase()
+        profile = {"time": self.__started,
+                   "total": perf_counter() - self.__start,
+                   "phases": list(self.__phases),
+                   "modules": sorted(self.__modules,
+                                     key=lambda record: record["wall"],
+                                     reverse=True)}
+        if profiles_file:
+            profiles = self._getBootProfiles(profiles_file)
+            profiles.append(profile)
+            try:
+                with open(profiles_file, "w") as pfile:
+                    dump(profiles[-_BOOT_PROFILES_LIMIT:], pfile)
+            except Exception as e:
+                log.warning(f"Unable to save boot profile: {e}")
+        return profile
+
+    def _getBootProfiles(self, profiles_file: str) -> list:
+        if not exists(profiles_file):
+            return []
+        try:
+            with open(profiles_file, "r") as pfile:
+                profiles = load(pfile)
+            return profiles if isinstance(profiles, list) else []
+        except Exception as e:
+            log.warning(f"Unable to read boot profiles: {e}")
+        return []
+
+
+_profiler = _BootProfiler()
+
+
+def _getProfilesFile() -> str:
+    return join(getConfig("TEMP_DL_DIR", "."), "boot_profiles.json")
+
+
+def start_phase(name: str):
+    """
+    Starts a new boot phase. The previous phase (if any) ends
+    automatically
+
+    Args:
+        name (string): name of the phase
+    """
+    _profiler._start_phase(name)
+    return
+
+
+def end_phase():
+    """
+    Ends the current boot phase
+    """
+    _profiler._end_phase()
+    return
+
+
+def profile_phase(name: str):
+    """
+    Profiles a boot phase within a with-statement. Unlike start_phase
+    such phases may run concurrently
+
+    Args:
+        name (string): name of the phase
+
+    Example:
+        with profile_phase("connect") as record:
+            await tgclient.connect()
+        print(record["wall"])
+
+    Returns:
+        a context manager which yields the record of the phase
+    """
+    return _profiler._profile(name, False)
+
+
+def profile_module(name: str):
+    """
+    Profiles the import of a module within a with-statement
+
+    Args:
+        name (string): name of the module
+
+    Returns:
+        a context manager which yields the record of the module
+    """
+    return _profiler._profile(name, True)
+
+
+def finish_profiling() -> dict:
+    """
+    Finishes the boot profile. The profile is saved to the last boot
+    profiles if BOOT_PROFILER is enabled
+
+    Returns:
+        the boot profile as dictionary
+    """
+    enabled = getConfig("BOOT_PROFILER", False)
+    profile = _profiler._finish(_getProfilesFile() if enabled else None)
+    if enabled:
+        log.info(f"Boot profile saved (total: {profile['total']:.2f}s)")
+    return profile
+
+
+def getBootProfiles() -> list:
+    """
+    Returns the last saved boot profiles (oldest first)
+    """
+    return _profiler._getBootProfiles(_getProfilesFile())
@@ -9,6 +9,7 @@
 from inspect import currentframe, getouterframes
 from logging import getLogger
 from os.path import basename, join
+from sys import _getframe
 
 log = getLogger(__name__)
 
@@ -35,7 +36,8 @@ class _SysConfigurations:
         """
         self.__botconfigs = {"REBOOT": False, "REBOOT_SAFEMODE": False,
                              "START_RECOVERY": False, "UPDATE_COMMIT_ID": None}
-        self.__protect_configs = ("API_KEY", "API_HASH", "STRING_SESSION")
+        self.__protect_configs = frozenset(("API_KEY", "API_HASH",
+                                            "STRING_SESSION"))
 
     def _addConfiguration(self, config: str, value):
         """
@@ -120,21 +122,18 @@ class _SysConfigurations:
         Returns:
             the value from config, default if config doesn't exist
         """
-        module_caller = (getouterframes(currentframe(), 2)[2].filename
-                         if not getouterframes(
-                             currentframe(), 2)[2].filename.endswith(
-                                 __name__) else
-                         getouterframes(currentframe(), 2)[1].filename)
         if not config:
             return default
         if config in self.__protect_configs:
+            # resolve the caller only if access is actually denied
+            caller = _getframe(1)
+            if caller.f_code.co_filename == __file__:  # getConfig()
+                caller = caller.f_back
+            module_caller = caller.f_code.co_filename
             raise AccessError(f"Access to '{config}' denied "
                               f"(requested by {basename(module_caller)})")
-        if config in self.__botconfigs.keys():
-            for key, value in self.__botconfigs.items():
-                if config == key:
-                    return value
-        return default
+        return self.__botconfigs.get(config, default)
+
 
 _sysconfigs = _SysConfigurations()
 
@@ -6,14 +6,161 @@
 # You may not use this file or any of the content within it, unless in
 # compliance with the PE License
 
+from .metrics import measure_client_rpcs, track_command
 from .registration import pre_register_cmd
-from inspect import currentframe, getouterframes
+from inspect import currentframe, getouterframes, isawaitable
 from os.path import basename
 from userbot import tgclient
 from userbot.include.language_processor import SystemUtilitiesText as msgResp
-from telethon.events import ChatAction, MessageEdited, NewMessage
+from telethon.events import ChatAction, MessageEdited, NewMessage, Raw
 from logging import getLogger, Logger
-from re import match
+from re import compile as compile_regex, match
+
+
+class _CommandRouter:
+    def __init__(self):
+        """
+        Central command dispatcher. Instead of adding a separate
+        NewMessage/MessageEdited handler (with its own pattern) to the
+        client for every command, the router installs exactly one handler
+        per event type and resolves the command by a dictionary lookup
+        on prefix and command name. The command's own pattern is matched
+        afterwards only, to keep 'pattern_match' as modules expect it.
+
+        Commands of lazy loaded modules are known by name only until the
+        module is imported on first invocation.
+
+        Scheme: {event type: {(prefix, name): [(regex, builder,
+                                                callback), ...]}}
+        Lazy scheme: {event type: {(prefix, name): (builder, loader)}}
+        """
+        self.__routes = {NewMessage: {}, MessageEdited: {}}
+        self.__lazy_routes = {NewMessage: {}, MessageEdited: {}}
+        self.__prefixes = set()
+        self.__installed = set()
+
+    def __install(self, event_type):
+        if event_type not in self.__installed:
+            dispatcher = (self.__dispatch_edited
+                          if event_type is MessageEdited else
+                          self.__dispatch_new)
+            tgclient.add_event_handler(dispatcher, event_type())
+            self.__installed.add(event_type)
+        return
+
+    def _add_route(self, event_type, prefix: str, names: tuple,
+                   cmd_regex: str, callback, *args, **kwargs):
+        """
+        Add a route for the given command name(s) and installs the
+        central handler of event_type to the client if not done yet
+
+        Args:
+            event_type: NewMessage or MessageEdited
+            prefix (string): the prefix used at the beginning of the command
+            names (tuple): command and (optional) alternative command
+            cmd_regex (string): the full pattern of the command
+            callback (Function): the function to call if pattern matches
+
+        Note:
+            Function accepts any further arguments as supported by
+            MessageEdited and NewMessage events. They are used to filter
+            the event (e.g. outgoing) before calling the callback
+        """
+        # builder without pattern, used as filter for this route only
+        builder = event_type(*args, **kwargs)
+        route = (compile_regex(cmd_regex), builder, callback)
+        for name in names:
+            self.__routes[event_type].setdefault(
+                (prefix, name), []).append(route)
+        self.__prefixes.add(prefix)
+        self.__install(event_type)
+        return
+
+    def _add_lazy_route(self, event_type, prefix: str, names: tuple,
+                        loader, *args, **kwargs):
+        """
+        Add a placeholder route for the given command name(s) of a module
+        that is not imported yet. The loader is called on first
+        invocation of any of the module's commands and should import
+        the module, which then adds its real routes
+
+        Args:
+            event_type: NewMessage or MessageEdited
+            prefix (string): the prefix used at the beginning of the command
+            names (tuple): command and (optional) alternative command
+            loader (Function): the function which imports the module
+
+        Note:
+            Function accepts any further arguments as supported by
+            MessageEdited and NewMessage events
+        """
+        builder = event_type(*args, **kwargs)
+        for name in names:
+            self.__lazy_routes[event_type][(prefix, name)] = (builder, loader)
+        self.__prefixes.add(prefix)
+        self.__install(event_type)
+        return
+
+    async def __passes(self, builder, event) -> bool:
+        if not builder.resolved:
+            await builder.resolve(event.client)
+        result = builder.filter(event)
+        if isawaitable(result):  # async func= filters, as in Telethon
+            result = await result
+        return bool(result)
+
+    async def __load_lazy(self, event_type, key: tuple, event) -> bool:
+        builder, loader = self.__lazy_routes[event_type][key]
+        if not await self.__passes(builder, event):
+            return False
+        if key not in self.__lazy_routes[event_type]:
+            return True  # loaded by a concurrent event meanwhile
+        # drop every placeholder of this module before loading it
+        for lazy_routes in self.__lazy_routes.values():
+            for lazy_key in [lazy_key for lazy_key, (_, lazy_loader) in
+                             lazy_routes.items() if lazy_loader is loader]:
+                del lazy_routes[lazy_key]
+        loader()
+        return True
+
+    async def __dispatch(self, event_type, event):
+        text = event.message.message if event.message else None
+        if not text:
+            return
+        routes = None
+        for prefix in self.__prefixes:
+            if text.startswith(prefix):
+                name = text[len(prefix):].split(None, 1)
+                if not name:
+                    continue
+                key = (prefix, name[0])
+                routes = self.__routes[event_type].get(key)
+                if not routes and key in self.__lazy_routes[event_type]:
+                    if await self.__load_lazy(event_type, key, event):
+                        routes = self.__routes[event_type].get(key)
+                if routes:
+                    break
+        if not routes:
+            return
+        for regex, builder, callback in routes:
+            pattern_match = regex.match(text)
+            if not pattern_match:
+                continue
+            if not await self.__passes(builder, event):
+                continue
+            event.pattern_match = pattern_match
+            await callback(event)
+        return
+
+    async def __dispatch_new(self, event):
+        await self.__dispatch(NewMessage, event)
+
+    async def __dispatch_edited(self, event):
+        await self.__dispatch(MessageEdited, event)
+
+
+_router = _CommandRouter()
+measure_client_rpcs(tgclient)
 
 
 class EventHandler:
@@ -121,45 +268,46 @@ class EventHandler:
                                f"failed ({caller})")
                 return None
             async def func_callback(event):
-                try:
-                    await function(event)
-                except Exception as e:
-                    # This block will be executed if the function, where
-                    # the events are being used, has no own
-                    # exception handler(s)
+                with track_command(command) as invocation:
                     try:
-                        # get current executed command
-                        curr_cmd = (
-                            event.pattern_match.group(0).split(" ")[0][1:])
-                    except:
-                        curr_cmd = command
-                    self.log.error(f"Command '{curr_cmd}' stopped due to an "
-                                   "unhandled exceptionin function "
-                                   f"'{function.__name__}'",
-                                   exc_info=True if self.traceback else False)
-                    try:  # in case editing messages isn't allowed (channels)
-                        cmd_stopped = (
-                            msgResp.CMD_STOPPED.format(f"{curr_cmd}.exe"))
-                        await event.edit(f"`{cmd_stopped}`")
-                    except:
-                        pass
+                        await function(event)
+                    except Exception:
+                        # This block will be executed if the function, where
+                        # the events are being used, has no own
+                        # exception handler(s)
+                        invocation.failed()
+                        try:
+                            # get current executed command
+                            curr_cmd = (
+                                event.pattern_match.group(0).split(" ")[0][1:])
+                        except:
+                            curr_cmd = command
+                        self.log.error(f"Command '{curr_cmd}' stopped due to "
+                                       "an unhandled exceptionin function "
+                                       f"'{function.__name__}'",
+                                       exc_info=(True
+                                                 if self.traceback else False))
+                        try:  # in case editing messages isn't allowed
+                            cmd_stopped = (
+                                msgResp.CMD_STOPPED.format(f"{curr_cmd}.exe"))
+                            await event.edit(f"`{cmd_stopped}`")
+                        except:
+                            pass
             if alt:
                 cmd_regex = (fr"^\.(?:{command}|{alt})(?: |$)(.*)"
                              if hasArgs else fr"^\.(?:{command}|{alt})$")
+                names = (command, alt)
             else:
                 cmd_regex = (fr"^\.{command}(?: |$)(.*)"
                              if hasArgs else fr"^\.{command}$")
+                names = (command,)
             try:
                 if not ignore_edits:
-                    tgclient.add_event_handler(func_callback,
-                                               MessageEdited(pattern=cmd_regex,
-                                                             *args,
-                                                             **kwargs))
-                tgclient.add_event_handler(func_callback,
-                                           NewMessage(pattern=cmd_regex,
-                                                      *args,
-                                                      **kwargs))
-            except Exception as e:
+                    _router._add_route(MessageEdited, ".", names, cmd_regex,
+                                       func_callback, *args, **kwargs)
+                _router._add_route(NewMessage, ".", names, cmd_regex,
+                                   func_callback, *args, **kwargs)
+            except Exception:
                 self.log.error(f"Failed to add command '{command}' to client "
                                f"(in function '{function.__name__}' "
                                f"({caller}))",
@@ -220,14 +368,14 @@ class EventHandler:
             async def func_callback(event):
                 try:
                     await function(event)
-                except Exception as e:
+                except Exception:
                     self.log.error(f"Function '{function.__name__}' stopped "
                                    "due to an unhandled exception",
                                    exc_info=True if self.traceback else False)
             try:
                 tgclient.add_event_handler(func_callback,
                                            ChatAction(*args, **kwargs))
-            except Exception as e:
+            except Exception:
                 self.log.error(f"Failed to add a chat action feature to "
                                f"client (in function '{function.__name__}')",
                                exc_info=True if self.traceback else False)
@@ -235,6 +383,47 @@ class EventHandler:
             return func_callback
         return decorator
 
+    def on_Raw(self, *args, **kwargs):
+        """
+        Listen to raw updates (TLObjects) sent by Telegram. Use the
+        'types' argument to limit the handler to the updates it really
+        needs, as every raw update goes through this handler otherwise.
+
+        Note:
+            Function accepts any further arguments as supported by
+            Raw events
+
+        Example:
+            from userbot.sysutils.event_handler import EventHandler
+            from telethon.tl.types import UpdatePeerBlocked
+            ehandler = EventHandler()
+
+            @ehandler.on_Raw(types=UpdatePeerBlocked)
+            async def example_handler(update):
+                print(update.peer_id, update.blocked)
+
+        Returns:
+            the raw update
+        """
+        def decorator(function):
+            async def func_callback(update):
+                try:
+                    await function(update)
+                except Exception:
+                    self.log.error(f"Function '{function.__name__}' stopped "
+                                   "due to an unhandled exception",
+                                   exc_info=True if self.traceback else False)
+            try:
+                tgclient.add_event_handler(func_callback,
+                                           Raw(*args, **kwargs))
+            except Exception:
+                self.log.error(f"Failed to add a raw update feature to "
+                               f"client (in function '{function.__name__}')",
+                               exc_info=True if self.traceback else False)
+                return None
+            return func_callback
+        return decorator
+
     def on_Pattern(self, pattern: str, events, name: str, prefix: str = ".",
                    hasArgs: bool = False, no_space_arg: bool = False,
                    no_cmd: bool = False, *args, **kwargs):
@@ -319,27 +508,32 @@ class EventHandler:
                                f"registration failed ({caller})")
                 return None
             async def func_callback(event):
-                try:
-                    await function(event)
-                except Exception as e:
-                    if not no_cmd:
+                if no_cmd:  # features aren't measured, only commands
+                    try:
+                        await function(event)
+                    except Exception:
+                        self.log.error(f"Feature '{name}' stopped due to "
+                                       "an unhandled exception in "
+                                       f"function '{function.__name__}'",
+                                       exc_info=(True if self.traceback
+                                                 else False))
+                    return
+                with track_command(name) as invocation:
+                    try:
+                        await function(event)
+                    except Exception:
+                        invocation.failed()
                         self.log.error(f"Command '{name}' stopped due to "
-                                       "an unhandled exception "
-                                       f"in function '{function.__name__}'",
-                                       exc_info=(True
-                                                 if self.traceback else False))
+                                       "an unhandled exception in "
+                                       f"function '{function.__name__}'",
+                                       exc_info=(True if self.traceback
+                                                 else False))
                         try:
                             cmd_stopped = (
                                 msgResp.CMD_STOPPED.format(f'{name}.exe'))
                             await event.edit(f"`{cmd_stopped}`")
                         except:
                             pass
-                    else:
-                        self.log.error(f"Feature '{name}' stopped due to "
-                                       "an unhandled exception "
-                                       f"in function '{function.__name__}'",
-                                       exc_info=(True
-                                                 if self.traceback else False))
             try:
                 if isinstance(events, (list, tuple)):
                     for event in events:
@@ -352,7 +546,7 @@ class EventHandler:
                                                events(pattern=pattern,
                                                       *args,
                                                       **kwargs))
-            except Exception as e:
+            except Exception:
                 self.log.error(f"Failed to add command/feature '{name}' "
                                f"to client (in function "
                                f"'{function.__name__}' ({caller}))",
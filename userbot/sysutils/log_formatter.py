@@ -7,42 +7,48 @@
 # compliance with the PE License
 
 from .colors import Color, ColorBG, setColorText, setColorTextBG
-from logging import Formatter, INFO, WARNING, ERROR, CRITICAL
+from logging import Formatter
+
+
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 class LogFileFormatter(Formatter):
-    def format(self, logtype):
+    def __init__(self):
         """
-        (Log file only) Register logging levels with the help of
-        logging.Formatter class. Debug level is not included.
-        This function overwrites the original format function from Formatter.
+        (Log file only) Formats all logging levels the same way. Debug
+        level is not included. The format is set up once instead of
+        building a new formatter for every record.
         """
         LOG_FORMAT = ("[%(asctime)s] %(process)d %(levelname).1s: "
                       "%(name)s: %(funcName)s: %(message)s "
                       "[%(filename)s:%(lineno)d]")
-        LOG_LEVELS = {"INFO": LOG_FORMAT,
-                      "WARNING": LOG_FORMAT,
-                      "ERROR": LOG_FORMAT,
-                      "CRITICAL": LOG_FORMAT}
-        get_type = LOG_LEVELS.get(logtype.levelname)  # get current level
-        formatter = Formatter(get_type, "%Y-%m-%d %H:%M:%S").format(logtype)
-        return formatter
+        super().__init__(LOG_FORMAT, _DATE_FORMAT)
 
 
 class LogColorFormatter(Formatter):
-    def format(self, logtype):
+    def __init__(self):
         """
-        (Terminal only) Register logging levels with the help of
-        logging.Formatter class. Sets colors to warning (yellow),
-        error (red) and critical (red background) levels. Info level
-        remains plain text. Debug level is not included. This function
-        overwrites the original format function from Formatter.
+        (Terminal only) Sets colors to warning (yellow), error (red) and
+        critical (red background) levels. Info level remains plain
+        text. Debug level is not included. One formatter per level is
+        built once instead of one for every record.
         """
+        super().__init__(None, _DATE_FORMAT)
         LOG_FORMAT = "[%(asctime)s] %(levelname).1s: %(name)s: %(message)s"
         LOG_COLORS = {"INFO": LOG_FORMAT,  # plain text
                       "WARNING": setColorText(LOG_FORMAT, Color.YELLOW),
                       "ERROR": setColorText(LOG_FORMAT, Color.RED),
                       "CRITICAL": setColorTextBG(LOG_FORMAT, ColorBG.RED)}
-        get_type = LOG_COLORS.get(logtype.levelname)
-        formatter = Formatter(get_type, "%Y-%m-%d %H:%M:%S").format(logtype)
-        return formatter
+        self.__formatters = {level: Formatter(log_format, _DATE_FORMAT)
+                             for level, log_format in LOG_COLORS.items()}
+
+    def format(self, logtype):
+        """
+        Format the record with the formatter of its level. This function
+        overwrites the original format function from Formatter.
+        """
+        formatter = self.__formatters.get(logtype.levelname)
+        if formatter is None:  # any other level, message only
+            return super().format(logtype)
+        return formatter.format(logtype)
@@ -0,0 +1,116 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from atexit import register
+from copy import copy
+from gzip import open as gzip_open
+from logging import Formatter
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from os import path, remove
+from queue import SimpleQueue
+from shutil import copyfileobj
+
+_TRACEBACK_FORMATTER = Formatter()
+
+
+class CompressingFileHandler(RotatingFileHandler):
+    def __init__(self, filename: str, maxBytes: int, backupCount: int):
+        """
+        Rotates the log file once it exceeds maxBytes. Rotated files are
+        compressed with gzip (e.g. hyper.log.1.gz), the oldest one is
+        removed once there are more than backupCount
+        """
+        super().__init__(filename, maxBytes=maxBytes,
+                         backupCount=backupCount, encoding="utf-8",
+                         delay=True)
+        self.namer = lambda name: name + ".gz"
+        self.rotator = self.__compress
+
+    def __compress(self, source: str, dest: str):
+        with open(source, "rb") as log_file, \
+             gzip_open(dest, "wb") as gz_file:
+            copyfileobj(log_file, gz_file)
+        remove(source)
+        return
+
+    def rollover_if_used(self):
+        """
+        Rotates the log file if it's not empty, so every start begins
+        with a new log file while the logs of the last starts are kept
+        """
+        if path.exists(self.baseFilename) and \
+           path.getsize(self.baseFilename) > 0:
+            self.doRollover()
+        return
+
+
+class _RecordQueueHandler(QueueHandler):
+    def prepare(self, record):
+        """
+        Resolve the message and the traceback in the logging thread, as
+        arguments may change afterwards, but leave the formatting to the
+        handlers of the listener. Unlike QueueHandler.prepare the
+        traceback isn't merged into the message, so the formatters still
+        place it after the whole formatted line
+        """
+        record = copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _TRACEBACK_FORMATTER.formatException(
+                    record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class LogPipeline:
+    def __init__(self, root_logger, handlers: list):
+        """
+        Moves formatting and I/O of log records to a listener thread
+        once started. Loggers only put the records into a queue, so
+        logging never waits for the disk or the terminal
+
+        Args:
+            root_logger (Logger): the logger to attach the queue to
+            handlers (list): handlers the listener passes the records to
+        """
+        self.__queue = SimpleQueue()
+        self.__listener = QueueListener(self.__queue, *handlers,
+                                        respect_handler_level=True)
+        self.__root_logger = root_logger
+        self.__queue_handler = _RecordQueueHandler(self.__queue)
+        self.__handlers = handlers
+        self.__running = False
+
+    def start(self):
+        """
+        Starts the listener thread. The pipeline is stopped at exit
+        as well, records logged right before quit() are still written
+        """
+        if not self.__running:
+            self.__running = True
+            self.__root_logger.addHandler(self.__queue_handler)
+            self.__listener.start()
+            register(self.stop)
+        return
+
+    def stop(self):
+        """
+        Writes the queued records and stops the listener thread. Later
+        records are passed to the handlers directly, so nothing logged
+        after stopping (e.g. if execle() fails) gets lost. Safe to call
+        more than once
+        """
+        if self.__running:
+            self.__running = False
+            self.__root_logger.removeHandler(self.__queue_handler)
+            self.__listener.stop()
+            for handler in self.__handlers:
+                self.__root_logger.addHandler(handler)
+        return
@@ -0,0 +1,389 @@
+# Copyright 2021 nunopenim @github
+# Copyright 2021 prototype74 @github
+#
+# Licensed under the PEL (Penim Enterprises License), v1.0
+#
+# You may not use this file or any of the content within it, unless in
+# compliance with the PE License
+
+from .configuration import getConfig
+from asyncio import get_running_loop
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging import getLogger
+from os import replace
+from threading import Lock
+from time import monotonic, perf_counter, time
+
+log = getLogger(__name__)
+# upper bounds in seconds: 1ms, 2ms, 4ms, ... ~65s (+Inf implicit)
+_BUCKETS = tuple(0.001 * 2 ** i for i in range(17))
+_DUMP_INTERVAL = 15  # seconds between two metrics dumps at most
+# metrics of the command which is executed in the current task
+_current_invocation = ContextVar("current_invocation", default=None)
+
+
+class _Histogram:
+    def __init__(self):
+        """
+        Fixed size histogram with exponential buckets. Memory usage
+        doesn't depend on the amount of observations
+        """
+        self.counts = [0] * (len(_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        index = 0
+        while index < len(_BUCKETS) and value > _BUCKETS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+        return
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 <= q <= 1) by linear interpolation
+        within the bucket the quantile falls into
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = _BUCKETS[index - 1] if index else 0.0
+                upper = (_BUCKETS[index]
+                         if index < len(_BUCKETS) else self.max)
+                fraction = (rank - cumulative) / bucket_count
+                return min(lower + (upper - lower) * fraction, self.max)
+            cumulative += bucket_count
+        return self.max
+
+
+class _CommandMetrics:
+    def __init__(self):
+        self.invocations = 0
+        self.errors = 0
+        self.latency = _Histogram()
+        self.rpc_calls = 0
+        self.rpc_time = 0.0
+
+
+class _JobMetrics:
+    def __init__(self):
+        self.runs = 0
+        self.failures = 0
+        self.duration = _Histogram()
+        self.last_success = None  # unix time
+        self.last_error = None
+
+
+class _Invocation:
+    def __init__(self, metrics, name: str):
+        """
+        Measures a single invocation of a command. Time spent in Telegram
+        RPCs is added by the client hook while the invocation is active
+        in the current task
+        """
+        self.__metrics = metrics
+        self.__name = name
+        self.__failed = False
+        self.__start = None
+        self.__token = None
+        self.rpc_calls = 0
+        self.rpc_time = 0.0
+
+    def failed(self):
+        """
+        Marks the invocation as failed (unhandled exception)
+        """
+        self.__failed = True
+        return
+
+    def __enter__(self):
+        self.__start = perf_counter()
+        self.__token = _current_invocation.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_invocation.reset(self.__token)
+        if exc_type is not None and issubclass(exc_type, Exception):
+            self.__failed = True
+        self.__metrics._record(self.__name, perf_counter() - self.__start,
+                               self.__failed, self.rpc_calls, self.rpc_time)
+        return False
+
+
+class _Metrics:
+    def __init__(self):
+        """
+        Collects invocation count, latency distribution, unhandled
+        exceptions and time spent awaiting Telegram RPCs per command
+        and runs, failures and durations of background jobs
+        """
+        self.__commands = {}
+        self.__jobs = {}
+        self.__last_dump = 0
+        self.__write_lock = Lock()  # dumps may overlap in the executor
+
+    def _hook_client(self, client):
+        """
+        Wrap the RPC call function of the client to measure the time
+        commands spend awaiting Telegram
+        """
+        try:
+            client_call = client._call
+        except AttributeError:
+            log.warning("Unable to measure RPC times: client not supported")
+            return
+
+        async def timed_call(*args, **kwargs):
+            invocation = _current_invocation.get()
+            if invocation is None:
+                return await client_call(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return await client_call(*args, **kwargs)
+            finally:
+                invocation.rpc_calls += 1
+                invocation.rpc_time += perf_counter() - start
+        client._call = timed_call
+        return
+
+    def _record(self, name: str, duration: float, failed: bool,
+                rpc_calls: int, rpc_time: float):
+        metrics = self.__commands.get(name)
+        if metrics is None:
+            metrics = self.__commands[name] = _CommandMetrics()
+        metrics.invocations += 1
+        metrics.latency.observe(duration)
+        metrics.rpc_calls += rpc_calls
+        metrics.rpc_time += rpc_time
+        if failed:
+            metrics.errors += 1
+        metrics_file = getConfig("METRICS_FILE")
+        if metrics_file and monotonic() - self.__last_dump >= _DUMP_INTERVAL:
+            self._dump(metrics_file)
+        return
+
+    @contextmanager
+    def _track_job(self, name: str):
+        metrics = self.__jobs.get(name)
+        if metrics is None:
+            metrics = self.__jobs[name] = _JobMetrics()
+        start = perf_counter()
+        try:
+            yield metrics
+        except Exception as e:
+            metrics.failures += 1
+            metrics.last_error = str(e) or type(e).__name__
+            raise
+        else:
+            metrics.last_success = time()
+        finally:
+            metrics.runs += 1
+            metrics.duration.observe(perf_counter() - start)
+        return
+
+    def _getCommandMetrics(self) -> dict:
+        return dict(sorted(self.__commands.items()))
+
+    def _getJobMetrics(self) -> dict:
+        return dict(sorted(self.__jobs.items()))
+
+    def _reset(self):
+        self.__commands = {}
+        self.__jobs = {}
+        return
+
+    def _prometheus_text(self) -> str:
+        lines = []
+
+        def header(name: str, mtype: str, desc: str):
+            lines.append(f"# HELP hyperubot_{name} {desc}")
+            lines.append(f"# TYPE hyperubot_{name} {mtype}")
+
+        def histogram(name: str, label: str, histogram: _Histogram):
+            cumulative = 0
+            for bound, bucket_count in zip(_BUCKETS + ("+Inf",),
+                                           histogram.counts):
+                cumulative += bucket_count
+                lines.append(f'hyperubot_{name}_bucket'
+                             f'{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'hyperubot_{name}_sum{{{label}}} {histogram.sum}')
+            lines.append(f'hyperubot_{name}_count{{{label}}} '
+                         f'{histogram.count}')
+        commands = self._getCommandMetrics()
+        header("command_invocations_total", "counter",
+               "Number of command invocations")
+        for name, metrics in commands.items():
+            lines.append(f'hyperubot_command_invocations_total'
+                         f'{{command="{name}"}} {metrics.invocations}')
+        header("command_errors_total", "counter",
+               "Number of unhandled exceptions in commands")
+        for name, metrics in commands.items():
+            lines.append(f'hyperubot_command_errors_total'
+                         f'{{command="{name}"}} {metrics.errors}')
+        header("command_duration_seconds", "histogram",
+               "Latency of command invocations")
+        for name, metrics in commands.items():
+            histogram("command_duration_seconds", f'command="{name}"',
+                      metrics.latency)
+        header("command_rpc_calls_total", "counter",
+               "Number of Telegram RPCs made by commands")
+        for name, metrics in commands.items():
+            lines.append(f'hyperubot_command_rpc_calls_total'
+                         f'{{command="{name}"}} {metrics.rpc_calls}')
+        header("command_rpc_seconds_total", "counter",
+               "Time commands spent awaiting Telegram RPCs")
+        for name, metrics in commands.items():
+            lines.append(f'hyperubot_command_rpc_seconds_total'
+                         f'{{command="{name}"}} {metrics.rpc_time}')
+        jobs = self._getJobMetrics()
+        header("job_runs_total", "counter", "Number of background job runs")
+        for name, metrics in jobs.items():
+            lines.append(f'hyperubot_job_runs_total'
+                         f'{{job="{name}"}} {metrics.runs}')
+        header("job_failures_total", "counter",
+               "Number of failed background job runs")
+        for name, metrics in jobs.items():
+            lines.append(f'hyperubot_job_failures_total'
+                         f'{{job="{name}"}} {metrics.failures}')
+        header("job_duration_seconds", "histogram",
+               "Duration of background job runs")
+        for name, metrics in jobs.items():
+            histogram("job_duration_seconds", f'job="{name}"',
+                      metrics.duration)
+        header("job_last_success_timestamp_seconds", "gauge",
+               "Unix time of the last successful background job run")
+        for name, metrics in jobs.items():
+            if metrics.last_success is not None:
+                lines.append(f'hyperubot_job_last_success_timestamp_seconds'
+                             f'{{job="{name}"}} {metrics.last_success}')
+        return "\n".join(lines) + "\n"
+
+    def __write(self, metrics_file: str, text: str):
+        # worker thread
+        try:
+            with self.__write_lock:
+                temp_file = metrics_file + ".tmp"
+                with open(temp_file, "w") as mfile:
+                    mfile.write(text)
+                # scrapers never see halves
+                replace(temp_file, metrics_file)
+        except Exception as e:
+            log.warning(f"Unable to dump metrics: {e}")
+        return
+
+    def _dump(self, metrics_file: str):
+        """
+        Render the metrics in the current thread, as the loop keeps
+        changing them, and write them in a worker thread
+        """
+        self.__last_dump = monotonic()
+        text = self._prometheus_text()
+        try:
+            loop = get_running_loop()
+        except RuntimeError:  # no loop (anymore), just write it
+            self.__write(metrics_file, text)
+            return
+        loop.run_in_executor(None, self.__write, metrics_file, text)
+        return
+
+
+_metrics = _Metrics()
+
+
+def measure_client_rpcs(client):
+    """
+    Measures the time commands spend awaiting Telegram RPCs made
+    through the given client
+
+    Args:
+        client (TelegramClient): the client to hook
+    """
+    _metrics._hook_client(client)
+    return
+
+
+def track_command(name: str) -> _Invocation:
+    """
+    Measures the invocation of a command within a with-statement
+
+    Args:
+        name (string): name of the command
+
+    Example:
+        with track_command("example") as invocation:
+            try:
+                await function(event)
+            except Exception:
+                invocation.failed()
+
+    Returns:
+        a context manager for the invocation
+    """
+    return _Invocation(_metrics, name)
+
+
+def track_job(name: str):
+    """
+    Measures a run of a background job within a with-statement. A run
+    fails if an exception leaves the with-statement
+
+    Args:
+        name (string): name of the job
+
+    Example:
+        with track_job("currency_refresh"):
+            await refresh()
+
+    Returns:
+        a context manager which yields the metrics of the job
+    """
+    return _metrics._track_job(name)
+
+
+def getCommandMetrics() -> dict:
+    """
+    Returns the collected metrics of all commands sorted by name.
+    Scheme: {"cmd": _CommandMetrics}
+    """
+    return _metrics._getCommandMetrics()
+
+
+def getJobMetrics() -> dict:
+    """
+    Returns the collected metrics of all background jobs sorted by name.
+    Scheme: {"job": _JobMetrics}
+    """
+    return _metrics._getJobMetrics()
+
+
+def reset_metrics():
+    """
+    Clears all collected command and background job metrics
+    """
+    _metrics._reset()
+    return
+
+
+def dump_metrics() -> bool:
+    """
+    Writes the collected metrics in Prometheus text format to the file
+    set in METRICS_FILE. The file is written in a worker thread if an
+    event loop is running
+
+    Returns:
+        True if METRICS_FILE is set else False
+    """
+    metrics_file = getConfig("METRICS_FILE")
+    if not metrics_file:
+        return False
+    _metrics._dump(metrics_file)
+    return True
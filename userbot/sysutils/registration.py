@@ -6,11 +6,19 @@
 # You may not use this file or any of the content within it, unless in
 # compliance with the PE License
 
+from bisect import bisect_left
 from inspect import getfile, currentframe, getouterframes
 from logging import getLogger
 from os.path import basename
+from types import MappingProxyType
 
 log = getLogger(__name__)
+_MIN_SIMILARITY = 0.25  # shared trigrams of a fuzzy match at least
+
+
+def _trigrams(name: str) -> set:
+    padded = f"  {name} "  # weights the beginning of a name higher
+    return {padded[i:i+3] for i in range(len(padded) - 2)}
 
 
 class _RegisterModules:
@@ -20,6 +28,7 @@ class _RegisterModules:
         self.__user_modules = []
         self.__module_desc = {}
         self.__module_info = {}
+        self.__lazy_desc = set()  # modules not imported yet
 
     def _update_all_modules(self, name_of_module: str):
         caller = (True
@@ -68,12 +77,32 @@ class _RegisterModules:
                         f"Module description for '{caller}' not registered")
             return
 
-        if caller not in self.__module_desc.keys():
+        if caller in self.__lazy_desc:  # replaces the manifest's one
+            self.__lazy_desc.discard(caller)
+            self.__module_desc[caller] = description
+        elif caller not in self.__module_desc.keys():
             self.__module_desc[caller] = description
         else:
             log.warning(f"Module description for {caller} registered already")
         return
 
+    def _register_lazy_module_desc(self, name_of_module: str,
+                                   description: str):
+        caller = (True
+                  if getouterframes(currentframe(), 2)[2].filename.endswith(
+                      "userbot/__main__.py") or
+                  getouterframes(currentframe(), 2)[2].filename.endswith(
+                      "userbot\\__main__.py") else False)
+        if not caller:
+            caller = getouterframes(currentframe(), 2)[2]
+            log.error("register_lazy_module_desc only callable in main "
+                      f"({basename(caller.filename)}:{caller.lineno})")
+            return
+        if name_of_module not in self.__module_desc.keys():
+            self.__module_desc[name_of_module] = description
+            self.__lazy_desc.add(name_of_module)
+        return
+
     def _register_module_info(self, name: str,
                               authors=None, version=None):
         caller = basename(getouterframes(currentframe(), 2)[2].filename)[:-3]
@@ -133,9 +162,16 @@ class _RegisterCMD:
                          "module_name": "Where is it defined?"
                                         (_pre_register_cmd() auto generates it)
                          "success": True (present if cmd usage has been
-                                    registered in_register_cmd_usage())}}
+                                    registered in_register_cmd_usage()),
+                         "lazy": True (present until the module of a lazy
+                                 loaded cmd is imported)}}
         """
         self.__registered_cmds = {}
+        # indexes to look up commands without scanning all of them
+        self.__names = {}  # cmd or alt_cmd: cmd
+        self.__sorted_names = []  # all cmds and alt_cmds, sorted
+        self.__trigram_index = {}  # trigram: cmds and alt_cmds
+        self.__sorted_cmds = None  # sorted view, built on demand
         self.__first_time_register = False
 
     def _pre_register_cmd(self, cmd: str, alt_cmd: str,
@@ -174,32 +210,36 @@ class _RegisterCMD:
                       f"({basename(caller.filename)}:{caller.lineno})")
             return False
         module_name = basename(getfile(func)[:-3])
+        entry = self.__registered_cmds.get(cmd)
+        if entry and entry.get("lazy") and \
+           entry.get("module_name") == module_name:
+            # the module of a lazy loaded cmd has been imported now
+            self.__drop_cmd(cmd)
         if cmd not in self.__registered_cmds.keys():
             if not self.__first_time_register:
                 log.info("Registering commands")
                 self.__first_time_register = True
-            for key, value in self.__registered_cmds.items():
-                val = value.get("alt_cmd")
-                loc = value.get("module_name")
-                if cmd == val:
-                    log.warning(f"Command '{cmd}' in module '{module_name}' "
-                                "registered as alternative command "
-                                f"for command '{key}' already "
-                                f"(in module '{loc}')")
-                    return False
-                if alt_cmd and alt_cmd == val:
+            key = self.__names.get(cmd)
+            if key is not None:  # registered as alternative command
+                loc = self.__registered_cmds[key].get("module_name")
+                log.warning(f"Command '{cmd}' in module '{module_name}' "
+                            "registered as alternative command "
+                            f"for command '{key}' already "
+                            f"(in module '{loc}')")
+                return False
+            key = self.__names.get(alt_cmd) if alt_cmd else None
+            if key is not None:
+                loc = self.__registered_cmds[key].get("module_name")
+                if alt_cmd == key:
                     log.warning(f"Alternative command '{alt_cmd}' in module "
                                 f"'{module_name}' registered as "
-                                "alternative command for primary command "
-                                f"'{key}' already (in module '{loc}')")
-                    alt_cmd = None
-                    break
-                if alt_cmd and alt_cmd == key:
+                                f"primary command already (in module '{loc}')")
+                else:
                     log.warning(f"Alternative command '{alt_cmd}' in module "
                                 f"'{module_name}' registered as "
-                                f"primary command already (in module '{loc}')")
-                    alt_cmd = None
-                    break
+                                "alternative command for primary command "
+                                f"'{key}' already (in module '{loc}')")
+                alt_cmd = None
             self.__registered_cmds[cmd] = {"alt_cmd": alt_cmd,
                                            "hasArgs": hasArgs,
                                            "prefix": prefix,
@@ -207,6 +247,9 @@ class _RegisterCMD:
                                            "no_cmd": no_cmd,
                                            "args": None, "usage": None,
                                            "module_name": module_name}
+            for name in (cmd, alt_cmd) if alt_cmd else (cmd,):
+                self.__index_name(name, cmd)
+            self.__sorted_cmds = None
             return True
         loc = self.__registered_cmds.get(cmd, {}).get("module_name")
         log.warning(f"Command '{cmd}' in module '{module_name}' "
@@ -260,11 +303,113 @@ class _RegisterCMD:
                     f"'{cmd}' is not pre-registered ({caller})")
         return
 
-    def _getRegisteredCMDs(self) -> dict:
+    def _pre_register_lazy_cmd(self, cmd: str, alt_cmd: str, hasArgs: bool,
+                               module_name: str, args=None, usage=None):
+        """
+        Registers a command of a lazy loaded module from its manifest, so
+        it is listed before the module is imported. The entry is replaced
+        once the module registers the command itself
+
+        Note:
+            Callable in main only
+        """
+        caller = (True
+                  if getouterframes(currentframe(), 2)[2].filename.endswith(
+                      "userbot/__main__.py") or
+                  getouterframes(currentframe(), 2)[2].filename.endswith(
+                      "userbot\\__main__.py") else False)
+        if not caller:
+            caller = getouterframes(currentframe(), 2)[2]
+            log.error("pre_register_lazy_cmd only callable in main "
+                      f"({basename(caller.filename)}:{caller.lineno})")
+            return
+        if cmd in self.__names or (alt_cmd and alt_cmd in self.__names):
+            log.warning(f"Command '{cmd}' of lazy loaded module "
+                        f"'{module_name}' registered already")
+            return
+        self.__registered_cmds[cmd] = {"alt_cmd": alt_cmd,
+                                       "hasArgs": hasArgs, "prefix": ".",
+                                       "no_space_arg": False,
+                                       "no_cmd": False,
+                                       "args": args, "usage": usage,
+                                       "module_name": module_name,
+                                       "success": True, "lazy": True}
+        for name in (cmd, alt_cmd) if alt_cmd else (cmd,):
+            self.__index_name(name, cmd)
+        self.__sorted_cmds = None
+        return
+
+    def __drop_cmd(self, cmd: str):
+        entry = self.__registered_cmds.pop(cmd)
+        alt_cmd = entry.get("alt_cmd")
+        for name in (cmd, alt_cmd) if alt_cmd else (cmd,):
+            del self.__names[name]
+            del self.__sorted_names[bisect_left(self.__sorted_names, name)]
+            for trigram in _trigrams(name):
+                names = self.__trigram_index[trigram]
+                names.discard(name)
+                if not names:
+                    del self.__trigram_index[trigram]
+        self.__sorted_cmds = None
+        return
+
+    def __index_name(self, name: str, cmd: str):
+        self.__names[name] = cmd
+        self.__sorted_names.insert(bisect_left(self.__sorted_names, name),
+                                   name)
+        for trigram in _trigrams(name):
+            self.__trigram_index.setdefault(trigram, set()).add(name)
+        return
+
+    def _getRegisteredCMDs(self) -> MappingProxyType:
         """
-        Returns all registered commands in a sorted dictionary
+        Returns all registered commands in a sorted, read-only mapping.
+        The sorted view is built once after commands have been registered
+        and is shared by all callers, so it must not be changed
         """
-        return dict(sorted(self.__registered_cmds.items()))
+        if self.__sorted_cmds is None:
+            self.__sorted_cmds = MappingProxyType(
+                dict(sorted(self.__registered_cmds.items())))
+        return self.__sorted_cmds
+
+    def _getRegisteredCMD(self, name: str) -> tuple:
+        cmd = self.__names.get(name)
+        if cmd is None:
+            return (None, None)
+        return (cmd, self.__registered_cmds[cmd])
+
+    def _suggestCMDs(self, partial: str, limit: int) -> list:
+        suggestions = []
+
+        def suggest(name: str) -> bool:
+            cmd = self.__names[name]
+            if cmd not in suggestions:
+                suggestions.append(cmd)
+            return len(suggestions) >= limit
+
+        # commands starting with partial, the sorted names serve as trie
+        index = bisect_left(self.__sorted_names, partial)
+        while index < len(self.__sorted_names) and \
+                self.__sorted_names[index].startswith(partial):
+            if suggest(self.__sorted_names[index]):
+                return suggestions
+            index += 1
+        # similar commands (e.g. typos) by shared trigrams
+        trigrams = _trigrams(partial)
+        shared = {}  # name: amount of shared trigrams
+        for trigram in trigrams:
+            for name in self.__trigram_index.get(trigram, ()):
+                shared[name] = shared.get(name, 0) + 1
+        ranked = []
+        for name, amount in shared.items():
+            similarity = amount / (len(trigrams) +
+                                   len(_trigrams(name)) - amount)
+            if similarity >= _MIN_SIMILARITY:
+                ranked.append((-similarity, name))
+        for _, name in sorted(ranked):
+            if suggest(name):
+                break
+        return suggestions
 
 
 _reg_mod = _RegisterModules()
@@ -309,6 +454,22 @@ def register_module_info(name: str, authors=None, version=None):
     return
 
 
+def register_lazy_module_desc(name_of_module: str, description: str):
+    """
+    Registers the description of a lazy loaded module from its manifest.
+    Replaced once the module registers its description itself
+
+    Args:
+        name_of_module (string): name of the module
+        description (string): (detailed) description of the module
+
+    Note:
+        Callable in main only
+    """
+    _reg_mod._register_lazy_module_desc(name_of_module, description)
+    return
+
+
 def getAllModules() -> list:
     return _reg_mod._getAllModules()
 
@@ -353,6 +514,28 @@ def pre_register_cmd(cmd: str, alt_cmd: str,
                                       prefix, no_space_arg, no_cmd, func)
 
 
+def pre_register_lazy_cmd(cmd: str, alt_cmd: str, hasArgs: bool,
+                          module_name: str, args=None, usage=None):
+    """
+    Registers a command of a lazy loaded module from its manifest, so it
+    is listed (e.g. by .help) before the module is imported
+
+    Args:
+        cmd (string): command to register
+        alt_cmd (string): alternative command to 'cmd'
+        hasArgs (bool): whether 'cmd' takes arguments
+        module_name (string): name of the module of 'cmd'
+        args (string): arguments of the command (must be None)
+        usage (string): usage of the command (must be None)
+
+    Note:
+        Callable in main only
+    """
+    _reg_cmd._pre_register_lazy_cmd(cmd, alt_cmd, hasArgs, module_name,
+                                    args, usage)
+    return
+
+
 def register_cmd_usage(cmd: str, args=None, usage=None):
     """
     Registers the usage of a command if the specific command is pre-registered
@@ -375,6 +558,43 @@ def register_cmd_usage(cmd: str, args=None, usage=None):
 
 def getRegisteredCMDs():
     """
-    Returns all registered commands in a sorted dictionary
+    Returns all registered commands in a sorted, read-only mapping
+    (types.MappingProxyType). Use dict(getRegisteredCMDs()) for a copy
     """
     return _reg_cmd._getRegisteredCMDs()
+
+
+def getRegisteredCMD(name: str) -> tuple:
+    """
+    Look up a registered command by its name or alternative name
+
+    Args:
+        name (string): command or alternative command
+
+    Example:
+        cmd, value = getRegisteredCMD("help")  # ("listcmds", {...})
+
+    Returns:
+        a tuple of the command and its value as in getRegisteredCMDs(),
+        (None, None) if no such command is registered
+    """
+    return _reg_cmd._getRegisteredCMD(name)
+
+
+def suggestCMDs(partial: str, limit: int = 5) -> list:
+    """
+    Suggest registered commands for a partial or misspelled command.
+    Commands starting with partial come first, followed by similar
+    commands
+
+    Args:
+        partial (string): partial or misspelled command
+        limit (int): amount of suggestions at most
+
+    Example:
+        suggestCMDs("sendl")  # ["sendlog"]
+
+    Returns:
+        a list of commands, the best suggestion first
+    """
+    return _reg_cmd._suggestCMDs(partial, limit)
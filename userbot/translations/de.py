@@ -83,6 +83,19 @@ class AdminText(object):
     REM_DEL_ACCS_COUNT_EXCP = ("`{} gelöschte (Admin-) Konten konnten "
                                "nicht entfernt werden`")
     NO_DEL_ACCOUNTS = "`Keine gelöschte Konten in diesem Chat gefunden`"
+    COUNT_DEL_ACCOUNTS = "`Zähle gelöschte Konten...`"
+    DEL_ACCS_PROGRESS = ("`{} von bisher {} gefundenen gelöschten Konten "
+                         "entfernt...`")
+    CAS_SCAN_START = "`Prüfe Mitglieder mit CAS...`"
+    CAS_SCAN_PROGRESS = ("`{} Mitglieder geprüft, bisher {} von CAS "
+                         "gebannt...`")
+    CAS_SCAN_RESULT = "**{} von {} Mitgliedern sind von CAS gebannt:**"
+    CAS_SCAN_CLEAN = "`Keines von {} Mitgliedern ist von CAS gebannt`"
+    CAS_SCAN_MORE = "`...und {} weitere`"
+    CAS_SCAN_LOOKUPS_FAILED = ("`{} Mitglieder konnten nicht mit CAS "
+                               "geprüft werden`")
+    CAS_SCAN_FAILED = "`Fehler beim Prüfen der Mitglieder dieses Chats`"
+    CAS_OFFENSES = "{} Verstoß/Verstöße"
 
 
 class SystemToolsText(object):
@@ -122,6 +135,49 @@ class SystemToolsText(object):
     UPLD_LOG = "`Das Userbot-Log wird hochgeladen...`"
     SUCCESS_UPLD_LOG = "`Das HyperUBot-Log wurde erfolgreich hochgeladen!`"
     FAILED_UPLD_LOG = "`Fehler beim hochladen der Log-Datei`"
+    SENDLOG_SEARCHING = "`Das Log wird durchsucht...`"
+    SENDLOG_INVALID_ARG = ("`Ungültiges Argument. Verwende tail <Zeilen> "
+                           "oder grep <Muster> [Level] [seit]`")
+    SENDLOG_TAIL_INVALID = "`Die Anzahl der Zeilen muss eine Zahl sein`"
+    SENDLOG_NO_PATTERN = "`Gib ein Muster für die Suche an`"
+    SENDLOG_INVALID_PATTERN = "`Ungültiges Muster: {}`"
+    SENDLOG_NO_RECORDS = "`Keine Log-Einträge gefunden`"
+    SENDLOG_TAIL = "Letzte {} Zeile(n) des Logs"
+    SENDLOG_MATCHES = "{} passende(r) Eintrag/Einträge"
+    SENDLOG_MATCHES_LIMITED = ("{} passende(r) Eintrag/Einträge, die "
+                               "letzten {} werden angezeigt")
+    BOOT_PROFILE = "Startprofil"
+    BOOT_PROFILER_OFF = ("`Der Start-Profiler ist deaktiviert. Setzen Sie "
+                         "BOOT_PROFILER in Ihrer Config auf True, um ihn zu "
+                         "aktivieren`")
+    NO_BOOT_PROFILE = "`Bisher wurde kein Startprofil aufgezeichnet`"
+    BOOT_LAST = "Letzter Start"
+    BOOT_TOTAL = "Gesamt"
+    BOOT_PHASES = "Phasen"
+    BOOT_MODULES = "Module"
+    BOOT_HISTORY = "Vorherige Starts"
+    PERF = "Befehlsleistung"
+    NO_PERF = "`Noch keine Befehle gemessen`"
+    PERF_RESET = "`Befehls- und Aufgabenmetriken zurückgesetzt`"
+    PERF_CALLS = "Aufrufe"
+    PERF_ERRORS = "Fehler"
+    PERF_RPC = "RPC"
+    PERF_DUMPED = "Metriken exportiert nach {}"
+    PERF_MORE = "`...und {} weitere(r) Befehl(e)`"
+    PERF_JOBS = "Hintergrundaufgaben"
+    PERF_RUNS = "Durchläufe"
+    PERF_FAILURES = "Fehlschläge"
+    PERF_LAST_ERROR = "letzter Fehler"
+    PERF_ENTITY_CACHE = "Entitäten-Cache"
+    PERF_USERS = "Benutzer"
+    PERF_FULL_USERS = "Vollständige Benutzer"
+    PERF_TRANSLATION_CACHE = "Übersetzungs-Cache"
+    PERF_CAS_CACHE = "CAS-Cache"
+    PERF_CURRENCY_RATES = "Wechselkurse"
+    PERF_RATES_LOADED = "{} Tage von {} Währungen"
+    PERF_CACHED = "gespeichert"
+    PERF_HITS = "Treffer"
+    PERF_MISSES = "Fehlschläge"
 
 
 class DeletionsText(object):
@@ -135,6 +191,7 @@ class DeletionsText(object):
     PURGE_MSG_FAILED = "`Fehler beim purgen der Nachricht(en)`"
     PURGE_COMPLETE = ("Purge abgeschlossen! `{}` Nachricht(en) wurde(n) "
                       "gepurgt!")
+    PURGE_PROGRESS = "`Purge läuft... bisher {} Nachricht(en) gepurgt`"
     LOG_PURGE = "`{}` Nachricht(en) wurde(n) gepurgt"
     REPLY_PURGE_MSG = ("`Antworte auf jemand's Nachricht, um mit dem "
                        "purgen zu beginnen`")
@@ -209,6 +266,8 @@ class ChatInfoText(object):
                       "erforderlich, um diese Aktion auszuführen`")
     UNABLE_GET_LINK = ("`Der Einladungslink des Chats kann nicht abgerufen "
                        "werden`")
+    PARTIAL_INFO = ("<i>Einige Informationen konnten nicht rechtzeitig "
+                    "abgerufen werden</i>")
 
 
 class MemberInfoText(object):
@@ -308,6 +367,9 @@ class ScrappersText(object):
     MSG_TOO_LONG = "`Der übersetze Text ist zu groß!`"
     FAIL_TRANS_MSG = "`Fehler beim übersetzen der Nachricht`"
     FAIL_TRANS_TEXT = "`Fehler beim übersetzen des gegebenen Textes`"
+    TRT_BATCH_INVALID = ("`Die Anzahl der Nachrichten muss zwischen 1 "
+                         "und {} liegen`")
+    UNKNOWN_SENDER = "Unbekannt"
     MEDIA_FORBIDDEN = ("`TTS fehlgeschlagen: Medien hochladen ist in "
                        "diesem Chat nicht erlaubt`")
     NO_TEXT_TTS = "`Keine Text oder Nachricht zum text-to-speech`"
@@ -388,6 +450,8 @@ class UserText(object):
     DEL_HAS_ID_OF = "Gelöschtes Konto hat eine ID von `{}`"
     ID_NOT_ACCESSIBLE = "die ID von {} ist nicht zugreifbar"
     ORG_HAS_ID_OF = "Der Originalautor {} hat eine ID von `{}`"
+    PARTIAL_INFO = ("<i>Einige Informationen konnten nicht rechtzeitig "
+                    "abgerufen werden</i>")
 
 
 class SystemUtilitiesText(object):
@@ -408,6 +472,8 @@ class GeneralMessages(object):
     LOG_CHAT_TITLE = "Chat-Titel"
     LOG_CHAT_LINK = "Link"
     LOG_CHAT_ID = "Chat-ID"
+    LOG_DROPPED = ("`{} Ereignisse wurden verworfen, da das Ereignisprotokoll "
+                   "überlastet war`")
     UNKNOWN = "Unbekannt"
 
 
@@ -441,6 +507,7 @@ class ModulesUtilsText(object):
     ARGS_NOT_REQ = "keine Argumente nötig"
     ARGS_NOT_AVAILABLE = "keine Argumente verfügbar"
     CMD_NOT_FOUND = "Befehl '{}' wurde nicht gefunden!"
+    CMD_SUGGESTIONS = "Meintest du {}?"
 
 
 class WebToolsText(object):
@@ -451,6 +518,8 @@ class WebToolsText(object):
     BAD_ARGS = "`Ungültige Argumente!`"
     INVALID_HOST = "`Fehler beim parsen des IPs/Hostname`"
     PINGER_VAL = "DNS: `{}`\nPing-Geschwindigkeit: `{}`"
+    PING_STATS = ("min `{}` / avg `{}` / Jitter `{}`, Verlust `{}%` "
+                  "(letzte {} Pings)")
     SPD_TEST_SELECT_SERVER = "Wähle den besten Server aus"
     SPD_TEST_DOWNLOAD = "Teste Download-Geschwindigkeit"
     SPD_TEST_UPLOAD = "Teste Upload-Geschwindigkeit"
@@ -467,6 +536,8 @@ class WebToolsText(object):
     SPD_PING = "Ping"
     SPD_ISP = "Mein ISP"
     SPD_HOSTED_BY = "Gehostet von"
+    SPD_CACHED = ("Ergebnis von vor {} Sekunden. Gib .speedtest new "
+                  "ein, um erneut zu messen")
 
 
 class CasIntText(object):
@@ -537,6 +608,13 @@ class TerminalText(object):
                            "erlaubt ist")
     BASH_SEND_FILE_FAILED = ("Fehler beim senden des Shell-Outputs als "
                              "eine Datei")
+    BASH_RUNNING = "läuft..."
+    BASH_EXIT_CODE = "Exit-Code: {}"
+    BASH_TIMEOUT = "Nach einem Timeout von {} Sekunden beendet"
+    BASH_CANCELLED = "Vom Benutzer gestoppt"
+    BASH_TRUNCATED = "[Output gekürzt, insgesamt {}]"
+    BASH_NOTHING_RUNNING = "In diesem Chat läuft kein Shell-Befehl"
+    BASH_STOPPED = "{} Shell-Befehl(e) gestoppt"
 
 
 class MiscText(object):
@@ -766,14 +844,22 @@ class ModuleUsages(object):
                                         "(aus der Ferne) in einem Chat auf. "
                                         "Erfordert Adminrechte mit Nutzer "
                                         "sperren Berechtigung.")},
-                   "delaccs": {"args": None,
+                   "delaccs": {"args": "[optional: count]",
                                "usage": ("Versucht gelöschte Konten "
                                          "automatisch aus einem Chat zu "
                                          "entfernen, falls Adminrechte mit "
                                          "vorhanden sind.\n"
                                          "Ansonsten werden nur die Anzahl "
                                          "an gelöschten Konten im "
-                                         "jeweiligen Chat angezeigt.")}}
+                                         "jeweiligen Chat angezeigt. "
+                                         "Gib .delaccs count ein, um die "
+                                         "gelöschten Konten nur zu "
+                                         "zählen.")},
+                   "casscan": {"args": None,
+                               "usage": ("Prüft jedes Mitglied des Chats "
+                                         "mit dem Combot Anti-Spam System "
+                                         "(CAS) und listet die gebannten "
+                                         "auf.")}}
 
     CHATINFO_USAGE = {"chatinfo": {"args": ("[optional: <Chat-ID/Link>] "
                                             "oder als Antwort (falls es "
@@ -839,11 +925,16 @@ class ModuleUsages(object):
                                           "angeheftete Nachrichten in "
                                           "einem Chat loszulösen.")}}
 
-    SCRAPPERS_USAGE = {"trt": {"args": "[optional: <Text>] oder als Antwort",
+    SCRAPPERS_USAGE = {"trt": {"args": ("[optional: <Text>] oder als Antwort "
+                                        "oder [batch <Anzahl>]"),
                                "usage": ("Der gegebene Text oder auf die "
                                          "geantwortete Nachricht wird "
                                          "auf die Zielspraches des Bots "
-                                         "übersetzt.")},
+                                         "übersetzt. Mit batch wird die "
+                                         "gegebene Anzahl an Nachrichten "
+                                         "(ab der geantworteten Nachricht "
+                                         "oder die letzten Nachrichten) "
+                                         "auf einmal übersetzt.")},
                        "tts": {"args": "[optional: <Text>] oder als Antwort",
                                "usage": ("Konvertiert den Text oder auf "
                                          "die geantwortete Nachricht ins "
@@ -867,11 +958,15 @@ class ModuleUsages(object):
                                               "den ISO eines Landes "
                                               "(EUR, USD, JPY usw.).")}}
 
-    SYSTOOLS_USAGE = {"status": {"args": None,
+    SYSTOOLS_USAGE = {"status": {"args": "[optional: boot]",
                                  "usage": ("Geben Sie .status ein, um "
                                            "zahlreiche Informationen des "
                                            "Bots zu prüfen und ob es am "
-                                           "Laufen ist.")},
+                                           "Laufen ist. Geben Sie "
+                                           ".status boot ein, um die "
+                                           "Profile der letzten Starts "
+                                           "anzuzeigen (erfordert "
+                                           "BOOT_PROFILER).")},
                       "shutdown": {"args": None,
                                    "usage": ("Geben Sie .shutdown ein, "
                                              "um den Bot herunterzufahren.")},
@@ -886,15 +981,41 @@ class ModuleUsages(object):
                                          "anzeigen zu lassen. "
                                          "(neofetch muss "
                                          "vorinstalliert sein)")},
-                      "sendlog": {"args": None,
-                                  "usage": ("Ladet die Log-Datei im "
-                                            "aktuellen Chat hoch.")}}
+                      "sendlog": {"args": ("[optional: tail <Zeilen>] "
+                                           "oder [optional: grep <Muster> "
+                                           "[Level] [seit]]"),
+                                  "usage": ("Ladet die Log-Datei "
+                                            "komprimiert im aktuellen Chat "
+                                            "hoch.\n.sendlog tail <Zeilen> "
+                                            "zeigt die letzten Zeilen des "
+                                            "Logs.\n.sendlog grep "
+                                            "durchsucht das Log und dessen "
+                                            "Backups nach einem Muster "
+                                            "(regulärer Ausdruck), "
+                                            "optional nur Einträge ab "
+                                            "einem Level (z.B. warning "
+                                            "oder w) und seit einer Zeit "
+                                            "(z.B. 30m, 2h, 1d oder "
+                                            "2021-05-30). Große Ergebnisse "
+                                            "werden als komprimierte Datei "
+                                            "hochgeladen.")},
+                      "perf": {"args": "[optional: reset]",
+                               "usage": ("Zeigt Aufrufe, Fehler, "
+                                         "Latenz-Perzentile (p50/p95/p99) "
+                                         "und die Zeit in Telegram-RPCs "
+                                         "aller Befehle seit dem Start. "
+                                         "Gib .perf reset ein, um die "
+                                         "Metriken zurückzusetzen.")}}
 
     USER_USAGE = {"info": {"args": ("[optional: <Benutzername/ID>] oder "
                                     "als Antwort"),
                            "usage": "Holt Informationen über einen User."},
-                  "stats": {"args": None,
-                            "usage": "Holt Ihre eigenen Statistiken."},
+                  "stats": {"args": "[optional: refresh]",
+                            "usage": ("Holt Ihre eigenen Statistiken. Die "
+                                      "Statistiken werden zwischengespeichert "
+                                      "und automatisch aktualisiert, gib "
+                                      ".stats refresh ein, um alle Chats "
+                                      "neu zu zählen.")},
                   "kickme": {"args": None,
                              "usage": "Entfernt Sie selbst aus einer Gruppe."},
                   "userid": {"args": ("[optional: <Benutzername>] oder als "
@@ -912,16 +1033,24 @@ class ModuleUsages(object):
                       "dc": {"args": None,
                              "usage": ("Sucht nach dem nächstengelegenen "
                                        "Rechenzentrum ihres Userbots aus.")},
-                      "ping": {"args": "<DNS/IP>",
-                               "usage": ("Pingt einen bestimmten DNS- "
-                                         "oder IP-Addresse an.")},
-                      "speedtest": {"args": "[optionales Argument \"pic\"]",
+                      "ping": {"args": "<DNS/IP> [<DNS/IP> ...]",
+                               "usage": ("Pingt eine oder mehrere DNS- "
+                                         "oder IP-Adressen gleichzeitig an. "
+                                         "Für bereits gepingte Adressen "
+                                         "werden Statistiken der letzten "
+                                         "Pings angezeigt.")},
+                      "speedtest": {"args": ("[optionale Argumente \"pic\" "
+                                             "und/oder \"new\"]"),
                                     "usage": ("Führt einen Speedtest durch "
                                               "und zeigt Ihnen das Ergebnis "
                                               "als Text an. Das Übergeben "
                                               "von \"pic\" als Argument "
                                               "ändert das Ergebnis zu einem "
-                                              "Bild.")}}
+                                              "Bild. Das letzte Ergebnis "
+                                              "wird einige Minuten lang "
+                                              "wiederverwendet, übergib "
+                                              "\"new\" für eine neue "
+                                              "Messung.")}}
 
     CAS_INTERFACE_USAGE = {"casupdate": {"args": None,
                                          "usage": ("Aktualisiert die "
@@ -941,14 +1070,21 @@ class ModuleUsages(object):
                                                   "Severseite von Telegram, "
                                                   "prüfen.")}}
 
-    GITHUB_USAGE = {"git": {"args": "<User>/<Repo>",
+    GITHUB_USAGE = {"git": {"args": "<User>/<Repo> [optional: <n>]",
                             "usage": ("Prüft nach Releases aus dem "
-                                      "angegebenen User/Repo-Kombination.")}}
+                                      "angegebenen User/Repo-Kombination. "
+                                      "Zeigt das n-te neueste Release an, "
+                                      "falls n angegeben ist.")}}
 
     MODULES_UTILS_USAGE = {"listcmds": {"args": ("[optional: <Name des "
                                                  "Befehls>]"),
                                         "usage": ("Listet alle verfügbare "
-                                                  "und registrierte Befehle")},
+                                                  "und registrierte "
+                                                  "Befehle. Zeigt die "
+                                                  "Verwendung eines Befehls "
+                                                  "oder schlägt ähnliche "
+                                                  "Befehle vor, falls er "
+                                                  "nicht existiert")},
                            "modules": {"args": ("[optional: <-d (--desc) "
                                                 "oder -i (--info) oder -u "
                                                 "(--usage) [Modulnummer]>]"),
@@ -967,7 +1103,18 @@ class ModuleUsages(object):
                                           "läuft, könnte dies potenziel "
                                           "ihr System unwiederruflich "
                                           "zerschießen! Mit Vorsicht "
-                                          "fortfahren!**")}}
+                                          "fortfahren!**\n"
+                                          "Der Output wird angezeigt, "
+                                          "während der Befehl läuft, und "
+                                          "als Datei gesendet, falls er zu "
+                                          "lang für eine Nachricht ist. "
+                                          "Befehle werden nach "
+                                          "SHELL_TIMEOUT Sekunden "
+                                          "beendet.")},
+                      "shellstop": {"args": None,
+                                    "usage": ("Stoppt alle Shell-Befehle, "
+                                              "die im aktuellen Chat "
+                                              "laufen.")}}
 
     MISC_USAGE = {"coinflip": {"args": None,
                                "usage": ("Wirft eine Münze und gibt "
@@ -76,6 +76,16 @@ class AdminText(object):
     REM_DEL_ACCS_COUNT = "`Removed {} deleted accounts`"
     REM_DEL_ACCS_COUNT_EXCP = "`Couldn't remove {} deleted (admin) accounts`"
     NO_DEL_ACCOUNTS = "`No deleted accounts found in this chat`"
+    COUNT_DEL_ACCOUNTS = "`Counting deleted accounts...`"
+    DEL_ACCS_PROGRESS = "`Removed {} of {} deleted accounts found so far...`"
+    CAS_SCAN_START = "`Scanning members against CAS...`"
+    CAS_SCAN_PROGRESS = "`Checked {} members, {} CAS banned so far...`"
+    CAS_SCAN_RESULT = "**{} of {} members are CAS banned:**"
+    CAS_SCAN_CLEAN = "`None of {} members is CAS banned`"
+    CAS_SCAN_MORE = "`...and {} more`"
+    CAS_SCAN_LOOKUPS_FAILED = "`Couldn't look up {} members in CAS`"
+    CAS_SCAN_FAILED = "`Failed to scan the members of this chat`"
+    CAS_OFFENSES = "{} offense(s)"
 
 
 class SystemToolsText(object):
@@ -115,6 +125,47 @@ class SystemToolsText(object):
     UPLD_LOG = "`Uploading userbot log...`"
     SUCCESS_UPLD_LOG = "`HyperUBot Log successfully uploaded!`"
     FAILED_UPLD_LOG = "`Failed to upload log file`"
+    SENDLOG_SEARCHING = "`Searching the log...`"
+    SENDLOG_INVALID_ARG = ("`Invalid argument. Use tail <lines> or grep "
+                           "<pattern> [level] [since]`")
+    SENDLOG_TAIL_INVALID = "`The amount of lines must be a number`"
+    SENDLOG_NO_PATTERN = "`Enter a pattern to search for`"
+    SENDLOG_INVALID_PATTERN = "`Invalid pattern: {}`"
+    SENDLOG_NO_RECORDS = "`No log records found`"
+    SENDLOG_TAIL = "Last {} line(s) of the log"
+    SENDLOG_MATCHES = "{} matching record(s)"
+    SENDLOG_MATCHES_LIMITED = "{} matching record(s), showing the last {}"
+    BOOT_PROFILE = "Boot profile"
+    BOOT_PROFILER_OFF = ("`Boot profiler is disabled. Set BOOT_PROFILER to "
+                         "True in your config to enable it`")
+    NO_BOOT_PROFILE = "`No boot profile recorded yet`"
+    BOOT_LAST = "Last boot"
+    BOOT_TOTAL = "Total"
+    BOOT_PHASES = "Phases"
+    BOOT_MODULES = "Modules"
+    BOOT_HISTORY = "Previous boots"
+    PERF = "Command performance"
+    NO_PERF = "`No commands measured yet`"
+    PERF_RESET = "`Command and job metrics cleared`"
+    PERF_CALLS = "calls"
+    PERF_ERRORS = "errors"
+    PERF_RPC = "RPC"
+    PERF_DUMPED = "Metrics exported to {}"
+    PERF_MORE = "`...and {} more command(s)`"
+    PERF_JOBS = "Background jobs"
+    PERF_RUNS = "runs"
+    PERF_FAILURES = "failures"
+    PERF_LAST_ERROR = "last error"
+    PERF_ENTITY_CACHE = "Entity cache"
+    PERF_USERS = "Users"
+    PERF_FULL_USERS = "Full users"
+    PERF_TRANSLATION_CACHE = "Translation cache"
+    PERF_CAS_CACHE = "CAS cache"
+    PERF_CURRENCY_RATES = "Currency rates"
+    PERF_RATES_LOADED = "{} days of {} currencies"
+    PERF_CACHED = "cached"
+    PERF_HITS = "hits"
+    PERF_MISSES = "misses"
 
 
 class DeletionsText(object):
@@ -126,6 +177,7 @@ class DeletionsText(object):
     PURGE_MSG_FAILED = "`Failed to purge message(s)`"
     PURGE_COMPLETE = "Purge complete! Purged `{}` message(s)!"
     LOG_PURGE = "Purged `{}` message(s)"
+    PURGE_PROGRESS = "`Purging... {} message(s) purged so far`"
     REPLY_PURGE_MSG = "`Reply to a message to start purge`"
 
 
@@ -193,6 +245,7 @@ class ChatInfoText(object):
     NO_INVITE_PERM = ("`Invite users permission is required to perform this "
                       "action`")
     UNABLE_GET_LINK = "`Unable to fetch chat's invite link`"
+    PARTIAL_INFO = "<i>Some information couldn't be fetched in time</i>"
 
 
 class MemberInfoText(object):
@@ -288,6 +341,8 @@ class ScrappersText(object):
     MSG_TOO_LONG = "`Translated text is too long!`"
     FAIL_TRANS_MSG = "`Failed to translate this message`"
     FAIL_TRANS_TEXT = "`Failed to translate given text`"
+    TRT_BATCH_INVALID = "`Amount of messages must be between 1 and {}`"
+    UNKNOWN_SENDER = "Unknown"
     MEDIA_FORBIDDEN = ("`Couldn't TTS: Uploading media isn't allowed in this "
                        "chat`")
     NO_TEXT_TTS = "`No text or message to text-to-speech`"
@@ -368,6 +423,7 @@ class UserText(object):
     ID_NOT_ACCESSIBLE = "the ID from {} is not accessible"
     # name of person, ID
     ORG_HAS_ID_OF = "The original author {} has an ID of `{}`"
+    PARTIAL_INFO = "<i>Some information couldn't be fetched in time</i>"
 
 
 class SystemUtilitiesText(object):
@@ -387,6 +443,7 @@ class GeneralMessages(object):
     LOG_CHAT_TITLE = "Chat title"
     LOG_CHAT_LINK = "Link"
     LOG_CHAT_ID = "Chat ID"
+    LOG_DROPPED = "`{} events were dropped as the event log was too busy`"
     UNKNOWN = "Unknown"
 
 
@@ -420,6 +477,7 @@ class ModulesUtilsText(object):
     ARGS_NOT_REQ = "no arguments required"  # lower if possible
     ARGS_NOT_AVAILABLE = "no arguments available"  # lower if possible
     CMD_NOT_FOUND = "Command '{}' not found!"
+    CMD_SUGGESTIONS = "Did you mean {}?"
 
 
 class WebToolsText(object):
@@ -430,6 +488,8 @@ class WebToolsText(object):
     BAD_ARGS = "`Bad arguments!`"
     INVALID_HOST = "`There was a problem parsing the IP/Hostname`"
     PINGER_VAL = "DNS: `{}`\nPing Speed: `{}`"
+    PING_STATS = ("min `{}` / avg `{}` / jitter `{}`, loss `{}%` "
+                  "(last {} pings)")
     SPD_TEST_SELECT_SERVER = "Selecting best server"
     SPD_TEST_DOWNLOAD = "Testing download speed"
     SPD_TEST_UPLOAD = "Testing upload speed"
@@ -446,6 +506,8 @@ class WebToolsText(object):
     SPD_PING = "Ping"
     SPD_ISP = "My ISP"
     SPD_HOSTED_BY = "Hosted by"
+    SPD_CACHED = ("Result from {} seconds ago. Type .speedtest new to "
+                  "measure again")
 
 
 class CasIntText(object):
@@ -508,6 +570,13 @@ class TerminalText(object):
     BASH_SEND_FILE_MTLO = ("Can't shell output as a file as send media "
                            "isn't allowed in this chat")
     BASH_SEND_FILE_FAILED = "Unable to send shell output as a file"
+    BASH_RUNNING = "running..."
+    BASH_EXIT_CODE = "Exit code: {}"
+    BASH_TIMEOUT = "Killed after a timeout of {} seconds"
+    BASH_CANCELLED = "Stopped by user"
+    BASH_TRUNCATED = "[output truncated, {} in total]"
+    BASH_NOTHING_RUNNING = "No shell command is running in this chat"
+    BASH_STOPPED = "Stopped {} shell command(s)"
 
 
 class MiscText(object):
@@ -715,13 +784,20 @@ class ModuleUsages(object):
                               "usage": ("Unmute a certain user from a chat "
                                         "(remotely). Requires admin "
                                         "privileges with ban permission.")},
-                   "delaccs": {"args": None,
+                   "delaccs": {"args": "[optional: count]",
                                "usage": ("Tries to remove deleted accounts "
                                          "automatically in a chat if admin "
                                          "privileges with ban permission "
                                          "are present. Else it reports the "
                                          "amount of deleted accounts it "
-                                         "the specific chat.")}}
+                                         "the specific chat. Type "
+                                         ".delaccs count to only count the "
+                                         "deleted accounts.")},
+                   "casscan": {"args": None,
+                               "usage": ("Checks every member of the chat "
+                                         "against the Combot Anti-Spam "
+                                         "System (CAS) and lists the "
+                                         "banned ones.")}}
 
     CHATINFO_USAGE = {"chatinfo": {"args": ("[optional: <chat_id/link>] or "
                                             "reply (if channel)"),
@@ -772,10 +848,15 @@ class ModuleUsages(object):
                                           "unpin it or send \".unpin all\" to "
                                           "unpin all messages in a chat.")}}
 
-    SCRAPPERS_USAGE = {"trt": {"args": "[optional: <text>] or reply",
+    SCRAPPERS_USAGE = {"trt": {"args": ("[optional: <text>] or reply or "
+                                        "[batch <amount>]"),
                                "usage": ("Translates given text or replied "
                                          "message to the bot's target "
-                                         "language.")},
+                                         "language. With batch the given "
+                                         "amount of messages (starting "
+                                         "at the replied message or the "
+                                         "latest messages) are translated "
+                                         "at once.")},
                        "tts": {"args": "[optional: <text>] or reply",
                                "usage": ("Converts text or replied message "
                                          "into spoken voice output "
@@ -797,10 +878,13 @@ class ModuleUsages(object):
                                               "USD). Requires Country ISO "
                                               "(EUR, USD, JPY etc.).")}}
 
-    SYSTOOLS_USAGE = {"status": {"args": None,
+    SYSTOOLS_USAGE = {"status": {"args": "[optional: boot]",
                                  "usage": ("Type .status to check various "
                                            "bot information and if it is "
-                                           "up and running.")},
+                                           "up and running. Type "
+                                           ".status boot to show the "
+                                           "profiles of the last boots "
+                                           "(requires BOOT_PROFILER).")},
                       "shutdown": {"args": None,
                                    "usage": ("Type .shutdown to shutdown "
                                              "the bot.")},
@@ -812,14 +896,38 @@ class ModuleUsages(object):
                       "sysd": {"args": None,
                                "usage": ("Type .sysd to get system details. "
                                          "(Requires neofetch installed)")},
-                      "sendlog": {"args": None,
-                                  "usage": ("Uploads the log file to the "
-                                            "current chat.")}}
+                      "sendlog": {"args": ("[optional: tail <lines>] or "
+                                           "[optional: grep <pattern> "
+                                           "[level] [since]]"),
+                                  "usage": ("Uploads the log file "
+                                            "compressed to the current "
+                                            "chat.\n.sendlog tail <lines> "
+                                            "shows the last lines of the "
+                                            "log.\n.sendlog grep searches "
+                                            "the log and its backups for "
+                                            "a pattern (regular expression"
+                                            "), optionally only records "
+                                            "of a level and above (e.g. "
+                                            "warning or w) and since a "
+                                            "time (e.g. 30m, 2h, 1d or "
+                                            "2021-05-30). Large results "
+                                            "are uploaded as compressed "
+                                            "file.")},
+                      "perf": {"args": "[optional: reset]",
+                               "usage": ("Shows invocations, errors, "
+                                         "latency percentiles (p50/p95/"
+                                         "p99) and time spent in Telegram "
+                                         "RPCs of every command since "
+                                         "start. Type .perf reset to "
+                                         "clear the metrics.")}}
 
     USER_USAGE = {"info": {"args": "[optional: <username/id>] or reply",
                            "usage": "Gets info of an user."},
-                  "stats": {"args": None,
-                            "usage": "Gets your stats."},
+                  "stats": {"args": "[optional: refresh]",
+                            "usage": ("Gets your stats. The stats are "
+                                      "cached and kept up to date "
+                                      "automatically, type .stats refresh "
+                                      "to count all chats again.")},
                   "kickme": {"args": None,
                              "usage": "Makes you leave the group."},
                   "userid": {"args": "[optional: <username>] or reply",
@@ -831,16 +939,24 @@ class ModuleUsages(object):
     WEBTOOLS_USAGE = {"dc": {"args": None,
                              "usage": ("Finds the near datacenter to "
                                        "your userbot host.")},
-                      "ping": {"args": "<DNS/IP>",
-                               "usage": "Pings a specific DNS or IP address."},
+                      "ping": {"args": "<DNS/IP> [<DNS/IP> ...]",
+                               "usage": ("Pings one or more DNS or IP "
+                                         "addresses at the same time. "
+                                         "Statistics of the last pings "
+                                         "are shown for addresses pinged "
+                                         "before.")},
                       "rtt": {"args": None,
                               "usage": "Gets the current Round Trip Time"},
-                      "speedtest": {"args": "[optional argument \"pic\"]",
+                      "speedtest": {"args": ("[optional arguments \"pic\" "
+                                             "and/or \"new\"]"),
                                     "usage": ("Performs a speedtest and "
                                               "shows the result as text. "
                                               "Passing \"pic\" as argument "
                                               "will change the result to a "
-                                              "picture.")}}
+                                              "picture. The last result is "
+                                              "reused for a few minutes, "
+                                              "pass \"new\" to measure "
+                                              "again.")}}
 
     CAS_INTERFACE_USAGE = {"casupdate": {"args": None,
                                          "usage": ("Downloads/updates the "
@@ -857,14 +973,20 @@ class ModuleUsages(object):
                                                   "Telegram's server-side "
                                                   "limitation.")}}
 
-    GITHUB_USAGE = {"git": {"args": "<user>/<repo>",
+    GITHUB_USAGE = {"git": {"args": "<user>/<repo> [optional: <n>]",
                             "usage": ("Checks for releases on the "
-                                      "specified user/repo combination.")}}
+                                      "specified user/repo combination. "
+                                      "Shows the n-th most recent "
+                                      "release if n is given.")}}
 
     MODULES_UTILS_USAGE = {"listcmds": {"args": ("[optional: <name of "
                                                  "command>]"),
                                         "usage": ("Lists all available and "
-                                                  "registered commands.")},
+                                                  "registered commands. "
+                                                  "Shows the usage of a "
+                                                  "command or suggests "
+                                                  "similar commands if it "
+                                                  "doesn't exist.")},
                            "modules": {"args": ("[optional: <-d (--desc) or "
                                                 "-i (--info) or -u (--usage) "
                                                 "[number of module]>]"),
@@ -880,7 +1002,16 @@ class ModuleUsages(object):
                                           "is running as root, this could "
                                           "potentially break your system "
                                           "irreversibly! Proceed with "
-                                          "caution!**")}}
+                                          "caution!**\n"
+                                          "The output is shown while the "
+                                          "command runs and is sent as a "
+                                          "file if it's too long for a "
+                                          "message. Commands are killed "
+                                          "after SHELL_TIMEOUT seconds.")},
+                      "shellstop": {"args": None,
+                                    "usage": ("Stops all shell commands "
+                                              "running in the current "
+                                              "chat.")}}
 
     MISC_USAGE = {"coinflip": {"args": None,
                                "usage": ("Flips a coin and returns heads "
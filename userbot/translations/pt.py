@@ -78,6 +78,18 @@ class AdminText(object):
     REM_DEL_ACCS_COUNT_EXCP = ("`Não foi possivel remover {} contas "
                                "(de admin) excluídas`")
     NO_DEL_ACCOUNTS = "`Não existem contas excluídas neste chat.`"
+    COUNT_DEL_ACCOUNTS = "`A contar contas excluídas...`"
+    DEL_ACCS_PROGRESS = ("`Removidas {} de {} contas excluídas encontradas "
+                         "até agora...`")
+    CAS_SCAN_START = "`A verificar os membros no CAS...`"
+    CAS_SCAN_PROGRESS = ("`{} membros verificados, {} banidos pelo CAS até "
+                         "agora...`")
+    CAS_SCAN_RESULT = "**{} de {} membros estão banidos pelo CAS:**"
+    CAS_SCAN_CLEAN = "`Nenhum de {} membros está banido pelo CAS`"
+    CAS_SCAN_MORE = "`...e mais {}`"
+    CAS_SCAN_LOOKUPS_FAILED = "`Impossível verificar {} membros no CAS`"
+    CAS_SCAN_FAILED = "`Falha ao verificar os membros deste chat`"
+    CAS_OFFENSES = "{} infração(ões)"
 
 
 class SystemToolsText(object):
@@ -117,6 +129,49 @@ class SystemToolsText(object):
     UPLD_LOG = "`A fazer upload do log...`"
     SUCCESS_UPLD_LOG = "`O Log do HyperUBot foi enviado com sucesso!`"
     FAILED_UPLD_LOG = "`Falha ao realizar upload do log`"
+    SENDLOG_SEARCHING = "`A pesquisar o log...`"
+    SENDLOG_INVALID_ARG = ("`Argumento inválido. Usa tail <linhas> ou "
+                           "grep <padrão> [nível] [desde]`")
+    SENDLOG_TAIL_INVALID = "`O número de linhas tem de ser um número`"
+    SENDLOG_NO_PATTERN = "`Indica um padrão para pesquisar`"
+    SENDLOG_INVALID_PATTERN = "`Padrão inválido: {}`"
+    SENDLOG_NO_RECORDS = "`Nenhum registo encontrado no log`"
+    SENDLOG_TAIL = "Últimas {} linha(s) do log"
+    SENDLOG_MATCHES = "{} registo(s) encontrado(s)"
+    SENDLOG_MATCHES_LIMITED = ("{} registo(s) encontrado(s), a mostrar os "
+                               "últimos {}")
+    BOOT_PROFILE = "Perfil de arranque"
+    BOOT_PROFILER_OFF = ("`O perfil de arranque está desativado. Define "
+                         "BOOT_PROFILER como True na tua config para o "
+                         "ativar`")
+    NO_BOOT_PROFILE = "`Ainda não foi registado nenhum perfil de arranque`"
+    BOOT_LAST = "Último arranque"
+    BOOT_TOTAL = "Total"
+    BOOT_PHASES = "Fases"
+    BOOT_MODULES = "Módulos"
+    BOOT_HISTORY = "Arranques anteriores"
+    PERF = "Desempenho dos comandos"
+    NO_PERF = "`Ainda nenhum comando medido`"
+    PERF_RESET = "`Métricas dos comandos e tarefas limpas`"
+    PERF_CALLS = "chamadas"
+    PERF_ERRORS = "erros"
+    PERF_RPC = "RPC"
+    PERF_DUMPED = "Métricas exportadas para {}"
+    PERF_MORE = "`...e mais {} comando(s)`"
+    PERF_JOBS = "Tarefas em segundo plano"
+    PERF_RUNS = "execuções"
+    PERF_FAILURES = "falhas"
+    PERF_LAST_ERROR = "último erro"
+    PERF_ENTITY_CACHE = "Cache de entidades"
+    PERF_USERS = "Utilizadores"
+    PERF_FULL_USERS = "Utilizadores completos"
+    PERF_TRANSLATION_CACHE = "Cache de traduções"
+    PERF_CAS_CACHE = "Cache do CAS"
+    PERF_CURRENCY_RATES = "Taxas de câmbio"
+    PERF_RATES_LOADED = "{} dias de {} moedas"
+    PERF_CACHED = "em cache"
+    PERF_HITS = "acertos"
+    PERF_MISSES = "falhas"
 
 
 class DeletionsText(object):
@@ -130,6 +185,7 @@ class DeletionsText(object):
     PURGE_MSG_FAILED = "`Falha ao apagar mensagem(s)`"
     PURGE_COMPLETE = "Apagar em massa completo! Foram apagadas `{}` mensagens!"
     LOG_PURGE = "Apagadas `{}` mensagens"
+    PURGE_PROGRESS = "`A apagar... {} mensagem(s) apagadas até agora`"
     REPLY_PURGE_MSG = ("`Responde a uma mensagem para começar a apagar "
                        "em massa.`")
 
@@ -199,6 +255,8 @@ class ChatInfoText(object):
                      "executar esta ação`")
     NO_INVITE_PERM = "`É necessária permissão para adicionar utilizadores!`"
     UNABLE_GET_LINK = "`Falha ao obter o Link de convite deste chat!`"
+    PARTIAL_INFO = ("<i>Algumas informações não puderam ser obtidas a "
+                    "tempo</i>")
 
 
 class MemberInfoText(object):
@@ -298,6 +356,9 @@ class ScrappersText(object):
     MSG_TOO_LONG = "`Texto traduzido é demasiado grande!`"
     FAIL_TRANS_MSG = "`Falha ao traduzir esta mensagem!`"
     FAIL_TRANS_TEXT = "`Falha ao traduzir o texto fornecido!`"
+    TRT_BATCH_INVALID = ("`A quantidade de mensagens deve estar entre 1 "
+                         "e {}`")
+    UNKNOWN_SENDER = "Desconhecido"
     MEDIA_FORBIDDEN = ("`Impossível executar TTS: O upload de média "
                        "neste chat é proíbido!`")
     NO_TEXT_TTS = "`Sem texto ou mensagem para executar TTS`"
@@ -379,6 +440,8 @@ class UserText(object):
     DEL_HAS_ID_OF = "A Conta Excluída tem um ID de `{}`"
     ID_NOT_ACCESSIBLE = "o ID de {} não é acessível"
     ORG_HAS_ID_OF = "O autor original {} tem um ID de `{}`"
+    PARTIAL_INFO = ("<i>Algumas informações não puderam ser obtidas a "
+                    "tempo</i>")
 
 
 class SystemUtilitiesText(object):
@@ -400,6 +463,8 @@ class GeneralMessages(object):
     LOG_CHAT_TITLE = "Título do Chat"
     LOG_CHAT_LINK = "Link"
     LOG_CHAT_ID = "ID do Chat"
+    LOG_DROPPED = ("`{} eventos foram descartados porque o registo de eventos "
+                   "estava sobrecarregado`")
     UNKNOWN = "Desconhecido"
 
 
@@ -433,6 +498,7 @@ class ModulesUtilsText(object):
     ARGS_NOT_REQ = "sem argumentos obrigatórios"
     ARGS_NOT_AVAILABLE = "sem argumentos"
     CMD_NOT_FOUND = "O comando '{}' não foi encontrado!"
+    CMD_SUGGESTIONS = "Querias dizer {}?"
 
 
 class WebToolsText(object):
@@ -443,6 +509,8 @@ class WebToolsText(object):
     BAD_ARGS = "`Maus argumentos`"
     INVALID_HOST = "`Ocorreu um problema a interpretar o IP/Hostname`"
     PINGER_VAL = "DNS: `{}`\nVelocidade de ping: `{}`"
+    PING_STATS = ("mín `{}` / média `{}` / jitter `{}`, perda `{}%` "
+                  "(últimos {} pings)")
     SPD_TEST_SELECT_SERVER = "Escolhendo o melhor servidor"
     SPD_TEST_DOWNLOAD = "Testando velocidade de download"
     SPD_TEST_UPLOAD = "Testando velocidade de upload"
@@ -459,6 +527,8 @@ class WebToolsText(object):
     SPD_PING = "Ping"
     SPD_ISP = "A minha ISP"
     SPD_HOSTED_BY = "Hospedado por"
+    SPD_CACHED = ("Resultado de há {} segundos. Usa .speedtest new "
+                  "para medir de novo")
 
 
 class CasIntText(object):
@@ -524,6 +594,13 @@ class TerminalText(object):
     BASH_SEND_FILE_MTLO = ("Não posso enviar o ficheiro de output shell, "
                            "porque o envio de média está restrito neste chat")
     BASH_SEND_FILE_FAILED = "Impossível enviar ficheiro de output shell."
+    BASH_RUNNING = "a executar..."
+    BASH_EXIT_CODE = "Código de saída: {}"
+    BASH_TIMEOUT = "Terminado após um limite de {} segundos"
+    BASH_CANCELLED = "Parado pelo utilizador"
+    BASH_TRUNCATED = "[output truncado, {} no total]"
+    BASH_NOTHING_RUNNING = "Nenhum comando shell a executar neste chat"
+    BASH_STOPPED = "{} comando(s) shell parado(s)"
 
 
 class MiscText(object):
@@ -744,13 +821,19 @@ class ModuleUsages(object):
                                         "um chat (remotamente). Precisa "
                                         "de permissão de administrador "
                                         "com direito de banir.")},
-                   "delaccs": {"args": None,
+                   "delaccs": {"args": "[opcional: count]",
                                "usage": ("Tenta remover contas excluídas "
                                          "de um chat. Precisa de "
                                          "permissão de administrador "
                                          "com direito de banir. Caso "
                                          "contrário, apenas reporta o "
-                                         "número de contas excluídas.")}}
+                                         "número de contas excluídas. "
+                                         "Usa .delaccs count para apenas "
+                                         "contar as contas excluídas.")},
+                   "casscan": {"args": None,
+                               "usage": ("Verifica todos os membros do chat "
+                                         "no Combot Anti-Spam System (CAS) "
+                                         "e lista os banidos.")}}
 
     CHATINFO_USAGE = {"chatinfo": {"args": ("[opcional: <chat_id/link>] ou "
                                             "resposta (se canal)"),
@@ -810,10 +893,15 @@ class ModuleUsages(object):
                                           "desafixar todas as mensagens "
                                           "no grupo")}}
 
-    SCRAPPERS_USAGE = {"trt": {"args": "[opcional: <text>] ou resposta",
+    SCRAPPERS_USAGE = {"trt": {"args": ("[opcional: <text>] ou resposta ou "
+                                        "[batch <quantidade>]"),
                                "usage": ("Traduz o texto ou mensagens "
                                          "fornecidos, para a linguagem "
-                                         "de defeito do bot.")},
+                                         "de defeito do bot. Com batch, a "
+                                         "quantidade de mensagens dada "
+                                         "(a partir da mensagem respondida "
+                                         "ou as últimas mensagens) é "
+                                         "traduzida de uma só vez.")},
                        "tts": {"args": "[opcional: <text>] ou resposta",
                                "usage": ("Converte a mensagem de voz em "
                                          "texto. (speech-to-text).")},
@@ -836,9 +924,13 @@ class ModuleUsages(object):
                                               "código ISO da Moeda (EUR, "
                                               "USD, JPY etc.).")}}
 
-    SYSTOOLS_USAGE = {"status": {"args": None,
+    SYSTOOLS_USAGE = {"status": {"args": "[opcional: boot]",
                                  "usage": ("Apresenta vários parâmetros "
-                                           "de execução do bot.")},
+                                           "de execução do bot. Usa "
+                                           ".status boot para apresentar "
+                                           "os perfis dos últimos "
+                                           "arranques (requer "
+                                           "BOOT_PROFILER).")},
                       "shutdown": {"args": None,
                                    "usage": "Desliga o bot."},
                       "reboot": {"args": None,
@@ -849,14 +941,40 @@ class ModuleUsages(object):
                       "sysd": {"args": None,
                                "usage": ("Apresenta detalhes de sistema "
                                          "(Requer neofetch)")},
-                      "sendlog": {"args": None,
+                      "sendlog": {"args": ("[opcional: tail <linhas>] "
+                                           "ou [opcional: grep <padrão> "
+                                           "[nível] [desde]]"),
                                   "usage": ("Faz upload do log do bot "
-                                            "para o chat atual")}}
+                                            "comprimido para o chat "
+                                            "atual.\n.sendlog tail "
+                                            "<linhas> mostra as últimas "
+                                            "linhas do log.\n.sendlog "
+                                            "grep pesquisa o log e os seus "
+                                            "backups por um padrão "
+                                            "(expressão regular), "
+                                            "opcionalmente só registos a "
+                                            "partir de um nível (p.ex. "
+                                            "warning ou w) e desde um "
+                                            "tempo (p.ex. 30m, 2h, 1d ou "
+                                            "2021-05-30). Resultados "
+                                            "grandes são enviados como "
+                                            "ficheiro comprimido")},
+                      "perf": {"args": "[opcional: reset]",
+                               "usage": ("Mostra chamadas, erros, "
+                                         "percentis de latência (p50/p95/"
+                                         "p99) e o tempo gasto em RPCs do "
+                                         "Telegram de cada comando desde "
+                                         "o arranque. Usa .perf reset "
+                                         "para limpar as métricas.")}}
 
     USER_USAGE = {"info": {"args": "[opcional: <username/id>] ou resposta",
                            "usage": "Obtém informação de um utilizador."},
-                  "stats": {"args": None,
-                            "usage": "Obtém as tuas estatísticas."},
+                  "stats": {"args": "[opcional: refresh]",
+                            "usage": ("Obtém as tuas estatísticas. As "
+                                      "estatísticas ficam em cache e são "
+                                      "atualizadas automaticamente, usa "
+                                      ".stats refresh para contar todos os "
+                                      "chats de novo.")},
                   "kickme": {"args": None,
                              "usage": "Sais do grupo."},
                   "userid": {"args": "[opcional: <username>] ou resposta",
@@ -868,16 +986,24 @@ class ModuleUsages(object):
     WEBTOOLS_USAGE = {"dc": {"args": None,
                              "usage": ("Procura o Datacenter do Telegram "
                                        "mais próximo.")},
-                      "ping": {"args": "<DNS/IP>",
-                               "usage": "Faz ping do DNS/IP fornecido."},
+                      "ping": {"args": "<DNS/IP> [<DNS/IP> ...]",
+                               "usage": ("Faz ping de um ou mais DNS/IP "
+                                         "ao mesmo tempo. São mostradas "
+                                         "estatísticas dos últimos pings "
+                                         "de endereços já usados.")},
                       "rtt": {"args": None,
                               "usage": "Obtém o Round-Trip Time atual"},
-                      "speedtest": {"args": "[argumento opcional \"pic\"]",
+                      "speedtest": {"args": ("[argumentos opcionais \"pic\" "
+                                             "e/ou \"new\"]"),
                                     "usage": ("Executa um teste de "
                                               "velocidade da ligação. "
                                               "Usando \"pic\" como "
                                               "argumento irá apresentar "
-                                              "o resultado como uma imagem.")}}
+                                              "o resultado como uma imagem. "
+                                              "O último resultado é "
+                                              "reutilizado durante alguns "
+                                              "minutos, usa \"new\" para "
+                                              "medir de novo.")}}
 
     CAS_INTERFACE_USAGE = {"casupdate": {"args": None,
                                          "usage": ("Atualiza os dados do "
@@ -896,16 +1022,21 @@ class ModuleUsages(object):
                                                   "a uma limitação nos "
                                                   "servidores do Telegram.")}}
 
-    GITHUB_USAGE = {"git": {"args": "<user>/<repo>",
+    GITHUB_USAGE = {"git": {"args": "<user>/<repo> [opcional: <n>]",
                             "usage": ("Obtém a release mais recente de "
                                       "determinado repositório de um "
-                                      "utilizador.")}}
+                                      "utilizador. Mostra a n-ésima "
+                                      "release mais recente caso n seja "
+                                      "fornecido.")}}
 
     MODULES_UTILS_USAGE = {"listcmds": {"args": ("[opcional: <nome do "
                                                  "comando>]"),
                                         "usage": ("Apresenta todos os "
                                                   "comandos disponíveis e "
-                                                  "registados")},
+                                                  "registados. Mostra o uso "
+                                                  "de um comando ou sugere "
+                                                  "comandos semelhantes se "
+                                                  "não existir")},
                            "modules": {"args": ("[opcional: <-d (--desc) ou "
                                                 "-i (--info) ou -u (--usage) "
                                                 "[número do módulo]>]"),
@@ -921,7 +1052,17 @@ class ModuleUsages(object):
                                           "executado com permissões root, "
                                           "isto pode causar dados "
                                           "irreversíveis. Procede com "
-                                          "cuidado!**")}}
+                                          "cuidado!**\n"
+                                          "O output é mostrado enquanto o "
+                                          "comando é executado e enviado "
+                                          "como ficheiro se for demasiado "
+                                          "longo para uma mensagem. Os "
+                                          "comandos são terminados após "
+                                          "SHELL_TIMEOUT segundos.")},
+                      "shellstop": {"args": None,
+                                    "usage": ("Para todos os comandos shell "
+                                              "a executar no chat "
+                                              "atual.")}}
 
     MISC_USAGE = {"coinflip": {"args": None,
                                "usage": ("Lança uma moeda e indica se o "